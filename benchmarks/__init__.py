@@ -0,0 +1,9 @@
+"""
+WorldSeed Lint Benchmarks
+
+Status: Informative
+Scope: Performance and memory measurements
+
+Benchmarks in this package measure cost only.
+They MUST NOT be used to assess compliance.
+"""
@@ -0,0 +1,143 @@
+"""
+Benchmark: SemanticContext Memory per Quantity
+
+Status: Informative
+Scope: Memory footprint of quantity records
+
+Builds a synthetic world with N action-parameter quantities
+(default 1,000,000) and reports bytes per quantity for:
+
+- before: the previous record layout (per-instance __dict__,
+  stored path string, non-interned unit and provenance strings)
+- after:  the current slotted Quantity layout, registered under
+  structured paths with its symbol table
+- context: the complete SemanticContext, divided by quantity count
+
+Usage:
+    python -m benchmarks.memory_quantities [N]
+
+Measurements use tracemalloc and exclude the parsed manifest.
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from engine.semantic_context import Quantity, SemanticContext
+from engine.symbols import ACTION_PARAMETER, SymbolTable
+
+
+PARAMETERS_PER_ACTION = 10
+UNITS = ("meter", "second", "kilogram", "radian", "newton")
+PROVENANCES = ("control", "sensor", "derived")
+
+
+class _LegacyQuantity:
+    # Record layout prior to slotting: __dict__ and a stored path
+    def __init__(self, value, unit, uncertainty, provenance, *, _path):
+        self.value = value
+        self.unit = unit
+        self.uncertainty = uncertainty
+        self.provenance = provenance
+        self._path = _path
+
+
+def synthetic_manifest(n_quantities: int) -> dict:
+    """
+    Build a manifest with n_quantities action parameters.
+
+    The manifest is round-tripped through JSON so that string
+    values are distinct objects, exactly as after json.load.
+    """
+    actions = []
+    for a in range((n_quantities + PARAMETERS_PER_ACTION - 1) // PARAMETERS_PER_ACTION):
+        count = min(PARAMETERS_PER_ACTION, n_quantities - a * PARAMETERS_PER_ACTION)
+        actions.append({
+            "name": f"action_{a}",
+            "parameters": {
+                f"p{i}": {
+                    "value": float(i),
+                    "unit": UNITS[(a + i) % len(UNITS)],
+                    "uncertainty": 0.01,
+                    "provenance": PROVENANCES[(a + i) % len(PROVENANCES)]
+                }
+                for i in range(count)
+            },
+            "stochastic": False
+        })
+
+    manifest = {
+        "version": "1.0.0",
+        "profile": "L1",
+        "world": {"id": "550e8400-e29b-41d4-a716-446655440000"},
+        "ontology": {"entities": ["position"]},
+        "actions": actions
+    }
+    return json.loads(json.dumps(manifest))
+
+
+def _measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del result
+    return used
+
+
+def _legacy_records(manifest: dict) -> dict:
+    records = {}
+    for action in manifest["actions"]:
+        for pname, p in action["parameters"].items():
+            records[f"action:{action['name']}:{pname}"] = _LegacyQuantity(
+                value=p["value"],
+                unit=p["unit"],
+                uncertainty=p["uncertainty"],
+                provenance=p["provenance"],
+                _path=f"actions[{action['name']}].parameters[{pname}]"
+            )
+    return records
+
+
+def _current_records(manifest: dict) -> dict:
+    records = {}
+    symbols = SymbolTable()
+    for action in manifest["actions"]:
+        a = symbols.intern(action["name"])
+        for pname, p in action["parameters"].items():
+            records[ACTION_PARAMETER, a, symbols.intern(pname)] = Quantity(
+                value=p["value"],
+                unit=p["unit"],
+                uncertainty=p["uncertainty"],
+                provenance=p["provenance"]
+            )
+    return records, symbols
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    n = int(argv[0]) if argv else 1_000_000
+
+    manifest = synthetic_manifest(n)
+
+    before = _measure(lambda: _legacy_records(manifest))
+    after = _measure(lambda: _current_records(manifest))
+    context = _measure(lambda: SemanticContext(manifest))
+
+    print(json.dumps({
+        "quantities": n,
+        "bytes_per_quantity": {
+            "before": round(before / n, 1),
+            "after": round(after / n, 1),
+            "context": round(context / n, 1)
+        }
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
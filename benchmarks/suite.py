@@ -0,0 +1,207 @@
+"""
+Benchmark: Lint Cost by World Size
+
+Status: Informative
+Scope: Per-phase timing and regression tracking
+
+Generates worlds of increasing size (see benchmarks.worlds) and
+times each lint phase separately:
+
+- load:    reading and decoding the manifest file
+- context: SemanticContext construction
+- rules:   rule execution with the compiled plan
+- report:  generate_report over the collected violations
+
+Each phase is timed `--repeat` times and the fastest run is kept.
+Results are printed as JSON and appended to a local history file
+(default: .benchmark-history.json). A phase regresses when it is
+slower than the fastest of its last `--window` recorded timings by
+more than `--threshold` (relative) and MIN_REGRESSION_SECONDS
+(absolute); any regression exits with code 1.
+
+Usage:
+    python -m benchmarks.suite [--scales A,B,...] [--parameters M]
+        [--density D] [--profile P] [--seed S] [--packs P,...]
+        [--repeat R] [--history PATH] [--window W]
+        [--threshold T] [--no-record]
+
+Timings are only comparable within one machine and interpreter;
+the history records both.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from benchmarks.worlds import PROFILES, generate_world
+from engine import compile_plan
+from engine.manifest_reader import read_manifest
+from engine.report import generate_report
+from engine.semantic_context import SemanticContext
+
+
+PHASES = ("load", "context", "rules", "report")
+HISTORY_FORMAT = 1
+
+# Differences below this are timer noise, whatever their ratio
+MIN_REGRESSION_SECONDS = 0.005
+
+
+def scenario_key(actions: int, options) -> str:
+    """
+    Identify a scenario in the history; timings are compared per key.
+    """
+    return (f"{options.profile}:a{actions}:p{options.parameters}:d{options.density}"
+            f":s{options.seed}:{'+'.join(options.packs)}")
+
+
+def _fastest(fn, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_scenario(actions: int, options, plan) -> dict:
+    """
+    Time every phase on one generated world.
+    """
+    manifest = generate_world(
+        actions=actions, parameters=options.parameters, observers=max(1, actions // 10),
+        edges=max(1, actions // 10), density=options.density, profile=options.profile,
+        seed=options.seed
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "world.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        size = os.path.getsize(path)
+        del manifest
+
+        timings = {}
+        timings["load"], manifest = _fastest(lambda: read_manifest(path), options.repeat)
+    timings["context"], context = _fastest(lambda: SemanticContext(manifest), options.repeat)
+    timings["rules"], violations = _fastest(lambda: plan.run(context), options.repeat)
+    timings["report"], report = _fastest(lambda: generate_report(violations), options.repeat)
+
+    return {
+        "bytes": size,
+        "actions": len(context.actions),
+        "observers": len(context.observers),
+        "quantities": len(context.quantities),
+        "edges": len(context.degradation_graph.edges),
+        "violations": len(violations),
+        "verdict": report["verdict"],
+        "seconds": {phase: round(timings[phase], 6) for phase in PHASES}
+    }
+
+
+def load_history(path: str) -> dict:
+    """
+    Read the history file; a missing or unreadable file is empty.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        return {"format": HISTORY_FORMAT, "runs": []}
+    if not isinstance(history, dict) or history.get("format") != HISTORY_FORMAT:
+        return {"format": HISTORY_FORMAT, "runs": []}
+    return history
+
+
+def find_regressions(history: dict, run: dict, threshold: float, window: int) -> list:
+    """
+    Compare the results of `run` against the fastest of the last
+    `window` runs recorded on the same machine and interpreter, for
+    each scenario and phase.
+
+    Returns a list of {scenario, phase, baseline, seconds} objects.
+    """
+    runs = [r for r in history["runs"] if (r["machine"], r["python"]) == (run["machine"], run["python"])]
+    regressions = []
+    for key, result in run["results"].items():
+        previous = [r["results"][key] for r in runs if key in r["results"]][-window:]
+        for phase in PHASES:
+            timings = [r["seconds"][phase] for r in previous if phase in r["seconds"]]
+            if not timings:
+                continue
+            baseline = min(timings)
+            seconds = result["seconds"][phase]
+            if seconds > baseline * (1.0 + threshold) and seconds - baseline > MIN_REGRESSION_SECONDS:
+                regressions.append({"scenario": key, "phase": phase, "baseline": baseline, "seconds": seconds})
+    return regressions
+
+
+def _write_history(path: str, history: dict):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".history-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _scales(text: str) -> list:
+    scales = [int(s) for s in text.split(",")]
+    if any(s < 0 for s in scales):
+        raise argparse.ArgumentTypeError("scales must be non-negative")
+    return scales
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("--scales", type=_scales, default=[100, 1000, 10000],
+                        help="comma-separated action counts")
+    parser.add_argument("--parameters", type=int, default=10)
+    parser.add_argument("--density", type=float, default=0.01)
+    parser.add_argument("--profile", choices=PROFILES, default="L3")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--packs", type=lambda s: tuple(s.split(",")), default=("axioms",))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--history", default=".benchmark-history.json")
+    parser.add_argument("--window", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--no-record", action="store_true")
+    options = parser.parse_args(argv)
+
+    plan = compile_plan(options.packs)
+    results = {}
+    for actions in options.scales:
+        results[scenario_key(actions, options)] = run_scenario(actions, options, plan)
+
+    run = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "machine": f"{platform.node()} {platform.machine()}",
+        "python": platform.python_version(),
+        "results": results
+    }
+    history = load_history(options.history)
+    regressions = find_regressions(history, run, options.threshold, options.window)
+    print(json.dumps(dict(run, regressions=regressions), indent=2))
+
+    if not options.no_record:
+        history["runs"].append(run)
+        _write_history(options.history, history)
+
+    for r in regressions:
+        print(f"Regression: {r['scenario']} {r['phase']}: {r['seconds']:.6f}s "
+              f"(baseline {r['baseline']:.6f}s)", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark: Synthetic World Generator
+
+Status: Informative
+Scope: Deterministic worlds of controlled size and defect density
+
+Generates worlds with:
+
+- N actions of M parameters each,
+- K observers,
+- a degradation chain of E edges,
+
+declared under any profile L0–L3; sections the profile forbids are
+not generated. At a violation density of 0 the world is COMPLIANT
+under the axiom, feature and consistency packs; at density d, each
+action parameter, action, observer and edge independently carries
+one defect with probability d.
+
+Usage:
+    python -m benchmarks.worlds [--actions N] [--parameters M]
+        [--observers K] [--edges E] [--density D] [--profile P]
+        [--seed S]
+
+The generated world is written to STDOUT as JSON.
+
+Normative Requirements:
+- The same arguments MUST generate the same world.
+"""
+
+import argparse
+import json
+import random
+import sys
+import uuid
+
+
+PROFILES = ("L0", "L1", "L2", "L3")
+# Interchangeable units per dimension; a parameter keeps one dimension
+UNIT_FAMILIES = (
+    ("meter", "km", "cm"),
+    ("second", "ms", "min"),
+    ("kilogram", "g"),
+    ("radian", "deg"),
+    ("newton", "kg m/s^2"),
+)
+PROVENANCES = ("control", "sensor", "derived")
+
+
+def _quantity(rng: random.Random, provenance: str, unknown: bool, units: tuple) -> dict:
+    # Unknown values carry unknown uncertainty
+    if unknown and rng.random() < 0.25:
+        value, uncertainty = "unknown", "unknown"
+    else:
+        value, uncertainty = round(rng.uniform(-100.0, 100.0), 6), round(rng.uniform(0.0, 1.0), 6)
+    return {"value": value, "unit": rng.choice(units), "uncertainty": uncertainty, "provenance": provenance}
+
+
+# Defects: each makes one element non-compliant; quantity defects
+# other than a missing unit are reported by supplementary packs only
+def _defective_quantity(rng: random.Random, q: dict) -> dict:
+    kind = rng.randrange(3)
+    if kind == 0:
+        q["unit"] = None
+    elif kind == 1:
+        q["unit"] = ""
+    else:
+        q["uncertainty"] = -1.0
+    return q
+
+
+def _defective_action(action: dict) -> dict:
+    action["stochastic"] = "sometimes"
+    return action
+
+
+def _defective_observer(observer: dict) -> dict:
+    del observer["operator"]
+    return observer
+
+
+def _defective_edge(edge: dict) -> dict:
+    del edge["irreversible"]
+    return edge
+
+
+def generate_world(actions: int = 100, parameters: int = 10, observers: int = 10,
+                   edges: int = 10, density: float = 0.0, profile: str = "L3",
+                   seed: int = 0) -> dict:
+    """
+    Generate a world of the given size and violation density.
+    """
+    # Sections the profile forbids are not generated
+    if profile == "L0":
+        actions = observers = 0
+    elif profile == "L1":
+        observers = 0
+
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}")
+    if not 0.0 <= density <= 1.0:
+        raise ValueError(f"Violation density out of range: {density}")
+
+    rng = random.Random(seed)
+
+    def defective() -> bool:
+        return density > 0.0 and rng.random() < density
+
+    world = {
+        "version": "1.0.0",
+        "profile": profile,
+        "world": {"id": str(uuid.UUID(int=rng.getrandbits(128), version=4))},
+        "ontology": {"entities": [f"entity_{i}" for i in range(max(1, actions // 100))]},
+        "actions": [],
+        "observers": [],
+    }
+
+    for a in range(actions):
+        params = {}
+        for p in range(parameters):
+            q = _quantity(rng, "control", profile != "L3", UNIT_FAMILIES[p % len(UNIT_FAMILIES)])
+            params[f"p{p}"] = _defective_quantity(rng, q) if defective() else q
+        action = {"name": f"action_{a}", "parameters": params, "stochastic": False}
+        world["actions"].append(_defective_action(action) if defective() else action)
+
+    for o in range(observers):
+        observer = {
+            "name": f"observer_{o}",
+            "operator": rng.choice(("pinhole", "tof", "sampler")),
+            "boundary": f"field {o}",
+            "noise": _quantity(rng, "sensor", False, ("pixel", "meter", "radian"))
+        }
+        world["observers"].append(_defective_observer(observer) if defective() else observer)
+
+    if edges:
+        # A chain of irreversible transformations, each destroying
+        # its own distinction and preserving none already destroyed
+        world["degradation"] = []
+        for e in range(edges):
+            edge = {
+                "source": f"state_{e}",
+                "target": f"state_{e + 1}",
+                "irreversible": True,
+                "destroyed": [f"distinction_{e}"],
+                "preserved": [f"distinction_{j}" for j in range(e + 1, min(e + 3, edges))]
+            }
+            world["degradation"].append(_defective_edge(edge) if defective() else edge)
+
+    # Round-trip so that strings are distinct objects, as after json.load
+    return json.loads(json.dumps(world))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.worlds")
+    parser.add_argument("--actions", type=int, default=100)
+    parser.add_argument("--parameters", type=int, default=10)
+    parser.add_argument("--observers", type=int, default=10)
+    parser.add_argument("--edges", type=int, default=10)
+    parser.add_argument("--density", type=float, default=0.0)
+    parser.add_argument("--profile", choices=PROFILES, default="L3")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    json.dump(generate_world(**vars(args)), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+WorldSeed Lint Batch Mode
+
+Status: Normative
+Scope: Multi-manifest invocation and orchestration only
+
+Responsibilities:
+- Expand batch inputs (paths, directories, @listfiles) into manifest paths
+- Fan manifests out to a pool of worker processes
+- Emit one ABI report per manifest, in input order
+- Derive an aggregate exit code
+
+Output Format:
+One JSON object per line on STDOUT:
+
+    {"manifest": "<path>", "report": { ...ABI report... }}
+
+Lines are emitted in the order of the expanded inputs,
+independent of which worker finishes first.
+
+Aggregate Exit Semantics:
+- The batch exit code is the maximum of the per-manifest exit codes
+  (0 COMPLIANT, 1 NON-COMPLIANT, 2 BLOCKED).
+
+This module MUST NOT alter per-manifest lint outcomes.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from cli.main import exit_code_for, lint_path
+from engine import default_plan
+from engine.report import generate_report, violation
+
+
+def expand_inputs(args: list[str], failures: dict = None, _listfiles: tuple = ()) -> list[str]:
+    """
+    Expand batch arguments into an ordered list of manifest paths.
+
+    - A directory expands to every *.json file below it, sorted.
+    - An argument of the form @listfile expands to the entries
+      listed in that file, one per line (blank lines are ignored).
+    - Any other argument is taken as a manifest path verbatim.
+
+    Listfiles that cannot be read or decoded, or that list themselves
+    (directly or through other listfiles), are kept as their @listfile
+    argument so that they surface as BLOCKED reports rather than being
+    silently dropped; `failures`, if given, maps each such argument
+    to the reason (see listfile_report).
+    """
+    paths = []
+
+    for arg in args:
+        if arg.startswith("@"):
+            listfile = os.path.realpath(arg[1:])
+            reason = None
+            if listfile in _listfiles:
+                reason = f"Listfile includes itself: '{arg[1:]}'"
+            else:
+                try:
+                    with open(arg[1:], encoding="utf-8") as f:
+                        entries = [line.strip() for line in f]
+                except (OSError, UnicodeDecodeError) as e:
+                    reason = str(e)
+            if reason is not None:
+                if failures is not None:
+                    failures[arg] = reason
+                paths.append(arg)
+                continue
+            paths.extend(expand_inputs([e for e in entries if e], failures, _listfiles + (listfile,)))
+        elif os.path.isdir(arg):
+            found = []
+            for root, dirs, files in os.walk(arg):
+                dirs.sort()
+                for name in files:
+                    if name.endswith(".json"):
+                        found.append(os.path.join(root, name))
+            paths.extend(sorted(found))
+        else:
+            paths.append(arg)
+
+    return paths
+
+
+def listfile_report(arg: str, reason: str) -> dict:
+    """
+    BLOCKED report for an @listfile argument that could not be expanded.
+    """
+    return generate_report([violation(
+        rule="CLI-IO-ERROR",
+        axiom=None,
+        path=arg[1:],
+        message=f"Failed to read listfile: {reason}"
+    )])
+
+
+_worker_cache = None
+
+
+def _init_worker(cache_dir=None):
+    """
+    Per-worker initialization: compile the rule plan once
+    so that individual lint calls pay no lookup cost, and
+    open the report cache if one is in use.
+    """
+    global _worker_cache
+
+    default_plan()
+    if cache_dir is not None:
+        from cli.cache import ReportCache
+        _worker_cache = ReportCache(cache_dir)
+
+
+def _lint(path: str) -> dict:
+    return lint_path(path, cache=_worker_cache)
+
+
+def run_batch(args: list[str], max_workers: int = None, cache_dir: str = None) -> int:
+    """
+    Lint every manifest named by `args` and print one report per line.
+
+    Workers share the report cache in `cache_dir`, if given.
+    Returns the aggregate exit code.
+    """
+    failures = {}
+    paths = expand_inputs(args, failures)
+    if not paths:
+        report = generate_report([violation(
+            rule="CLI-IO-ERROR",
+            axiom=None,
+            path=" ".join(args),
+            message="Batch inputs resolved to no manifests."
+        )])
+        print(json.dumps({"manifest": None, "report": report}))
+        return 2
+
+    manifests = [path for path in paths if path not in failures]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(manifests)))
+    chunksize = max(1, len(manifests) // (max_workers * 4))
+
+    exit_code = 0
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(cache_dir,)) as pool:
+        # map() yields results in submission order, which keeps
+        # the output deterministic regardless of completion order.
+        reports = pool.map(_lint, manifests, chunksize=chunksize)
+        for path in paths:
+            if path in failures:
+                report = listfile_report(path, failures[path])
+            else:
+                report = next(reports)
+            print(json.dumps({"manifest": path, "report": report}))
+            exit_code = max(exit_code, exit_code_for(report["verdict"]))
+
+    return exit_code
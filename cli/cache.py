@@ -0,0 +1,158 @@
+"""
+WorldSeed Lint Result Cache
+
+Status: Normative
+Scope: Content-addressed reuse of lint reports
+
+Responsibilities:
+- Derive a cache key from the manifest content, the lint version,
+  the identity of the compiled rule plan (including the engine
+  sources) and the manifest schemas
+- Store and retrieve serialized ABI reports
+- Bound the cache size with least-recently-used eviction
+
+Normative Requirements:
+- A cached report MUST be byte-identical to the report of a fresh run.
+- Reports MUST be keyed by content, never by file path or mtime.
+- Only reports of parsed manifests MAY be cached; IO and JSON
+  failures depend on the environment and MUST NOT be cached.
+- Writes MUST be atomic so that concurrent writers never expose
+  a partial entry.
+
+The cache MUST NOT alter lint outcomes.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+from engine import default_plan
+from engine.schema_check import schema_digest
+
+
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Number of stores between two eviction scans within one process
+EVICTION_INTERVAL = 64
+
+_VERSION_FILE = os.path.join(os.path.dirname(__file__), "..", "VERSION")
+
+
+def lint_version() -> str:
+    """
+    Return the lint VERSION, or "unknown" if it cannot be read.
+    """
+    try:
+        with open(_VERSION_FILE, encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return "unknown"
+
+
+def manifest_digest(manifest) -> str:
+    """
+    Canonical content hash of a parsed manifest.
+
+    Key order and insignificant whitespace do not affect the digest.
+    """
+    canonical = json.dumps(manifest, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class ReportCache:
+    """
+    Size-bounded on-disk report store.
+
+    Entries live at <directory>/<key[:2]>/<key>.json and hold the
+    exact report text. Recency is tracked through file mtimes.
+
+    Fields:
+    - directory: cache root
+    - max_bytes: upper bound on the total size of stored entries
+    - namespace: lint version, rule plan fingerprint and schema digest
+      mixed into every key
+    """
+    def __init__(self, directory: str, plan=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if plan is None:
+            plan = default_plan()
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.namespace = f"{lint_version()}\0{plan.fingerprint}\0{schema_digest()}"
+        self._stores = 0
+
+    def key(self, manifest) -> str:
+        digest = hashlib.sha256()
+        digest.update(self.namespace.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(manifest_digest(manifest).encode("ascii"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str):
+        """
+        Return the stored report text for `key`, or None.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+            os.utime(path)
+        except OSError:
+            # Missing, or evicted concurrently
+            return None
+        return text
+
+    def put(self, key: str, text: str):
+        """
+        Atomically store the report text for `key`.
+
+        Failures to write are ignored: the cache is an optimization.
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            return
+
+        if self._stores % EVICTION_INTERVAL == 0:
+            self.evict()
+        self._stores += 1
+
+    def evict(self):
+        """
+        Remove least-recently-used entries until the cache fits max_bytes.
+        """
+        entries = []
+        total = 0
+        for root, dirs, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, path, st.st_size))
+                total += st.st_size
+
+        entries.sort()
+        for mtime, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
@@ -0,0 +1,164 @@
+"""
+WorldSeed Lint Daemon
+
+Status: Normative
+Scope: Long-lived lint server and its thin client
+
+Responsibilities:
+- Serve lint requests on a Unix domain socket from a pool of
+  worker processes with precompiled rule plans
+- Forward single-manifest invocations of the CLI to a running server
+
+Protocol:
+One JSON object per line in each direction. Requests:
+
+    {"cwd": "<directory>", "manifest": "<path>", "stream": false}
+
+`manifest` is resolved against `cwd`, exactly as the CLI resolves it
+against its working directory. Responses:
+
+    {"report": { ...ABI report... }}
+    {"error": "<message>"}          (malformed request)
+
+A connection MAY carry any number of requests; responses are
+returned in request order.
+
+Normative Requirements:
+- The report MUST be identical to that of a direct invocation
+  with the same arguments and working directory.
+- The client MUST derive its exit code from the report verdict (§10).
+- If the server cannot be reached, the client MUST emit a BLOCKED report.
+
+The daemon MUST NOT alter lint outcomes.
+"""
+
+import json
+import os
+import socket
+import sys
+
+
+def _lint_request(cwd: str, path: str, stream: bool) -> dict:
+    # Runs in a worker process; workers handle one request at a time
+    from cli import batch
+    from cli.main import lint_path
+
+    os.chdir(cwd)
+    return lint_path(path, stream=stream, cache=None if stream else batch._worker_cache)
+
+
+def _parse_request(line: bytes):
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return None, f"Invalid request: {e}"
+    if not isinstance(request, dict) or not isinstance(request.get("cwd"), str) \
+            or not isinstance(request.get("manifest"), str) \
+            or not isinstance(request.get("stream", False), bool):
+        return None, "Invalid request: expected cwd, manifest and optional stream."
+    return request, None
+
+
+def serve(socket_path: str, cache_dir: str = None, max_workers: int = None) -> int:
+    """
+    Serve lint requests on `socket_path` until interrupted.
+
+    Returns an exit code: 2 if the socket is already served or
+    cannot be bound, 0 after a clean shutdown.
+    """
+    import signal
+    import socketserver
+    from concurrent.futures import ProcessPoolExecutor
+
+    from cli.batch import _init_worker
+
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(socket_path)
+        except OSError:
+            # Stale socket of a server that did not shut down cleanly
+            os.unlink(socket_path)
+        else:
+            print(f"A lint server is already listening on {socket_path}.", file=sys.stderr)
+            return 2
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(cache_dir,)
+    )
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                request, error = _parse_request(line)
+                if request is None:
+                    response = {"error": error}
+                else:
+                    future = pool.submit(_lint_request, request["cwd"], request["manifest"],
+                                         request.get("stream", False))
+                    try:
+                        response = {"report": future.result()}
+                    except Exception as e:
+                        response = {"error": f"Request failed: {e}"}
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    try:
+        server = Server(socket_path, Handler)
+    except OSError as e:
+        print(f"Failed to bind {socket_path}: {e}", file=sys.stderr)
+        pool.shutdown()
+        return 2
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+
+    # Start every worker now so that the first request is served warm
+    for future in [pool.submit(os.getpid) for _ in range(max_workers)]:
+        future.result()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown(cancel_futures=True)
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+    return 0
+
+
+def request(socket_path: str, path: str, stream: bool = False) -> dict:
+    """
+    Lint `path` on the server at `socket_path` and return the ABI report.
+
+    Raises OSError if the server cannot be reached and ValueError
+    if it rejects the request.
+    """
+    message = {"cwd": os.getcwd(), "manifest": path, "stream": stream}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with conn.makefile("rb") as f:
+            line = f.readline()
+
+    if not line:
+        raise ConnectionError("Lint server closed the connection.")
+    response = json.loads(line)
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response["report"]
@@ -21,78 +21,430 @@ Exit Semantics:
 - Exit code 1: Invalid WorldSeed compliance
 - Exit code 2: Invocation or IO error
 
+Invocation Forms:
+- worldseed-lint [--stream] [--cache-dir <dir> | --no-cache] [--jobs <n> | --profile <out>]
+                 [--verdict-only] <manifest.json>
+- worldseed-lint --incremental <state> [--verify] <manifest.json>
+- worldseed-lint --batch [--cache-dir <dir> | --no-cache] <path|dir|@listfile> [...]
+- worldseed-lint --watch [--interval <seconds>] <path|dir|@listfile> [...]
+- worldseed-lint serve [--cache-dir <dir> | --no-cache] <socket>
+- worldseed-lint --connect <socket> [--stream] <manifest.json>
+
 The CLI is not a policy engine.
 """
 
+import io
 import json
+import os
 import sys
 
 from engine.semantic_context import SemanticContext
 from engine import run_axiom_rules
-from engine.report import generate_report
+from engine.manifest_reader import read_manifest
+from engine.manifest_stream import RootTypeError
+from engine.schema_check import StreamSchemaCheck, check_schema, check_stream, root_type_violation
+from engine.report import (
+    VerdictDecided, VerdictSink, ViolationSink, build_report, generate_report, violation, write_report
+)
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: worldseed-lint <manifest.json>")
-        sys.exit(2)
+USAGE = (
+    "Usage: worldseed-lint [--stream] [--cache-dir <dir> | --no-cache] [--jobs <n> | --profile <out>]\n"
+    "                      [--verdict-only] <manifest.json>\n"
+    "       worldseed-lint --incremental <state> [--verify] <manifest.json>\n"
+    "       worldseed-lint --batch [--cache-dir <dir> | --no-cache] <path|dir|@listfile> [...]\n"
+    "       worldseed-lint --watch [--interval <seconds>] <path|dir|@listfile> [...]\n"
+    "       worldseed-lint serve [--cache-dir <dir> | --no-cache] <socket>\n"
+    "       worldseed-lint --connect <socket> [--stream] <manifest.json>"
+)
+
+
+def exit_code_for(verdict: str) -> int:
+    """
+    Map a report verdict to its exit code according to interface.md §10.
+    """
+    if verdict == "COMPLIANT":
+        return 0
+    elif verdict == "NON-COMPLIANT":
+        return 1
+    else:  # BLOCKED
+        return 2
+
+
+def _blocked_violation(rule: str, path: str, message: str) -> tuple:
+    return violation(rule=rule, axiom=None, path=path, message=message)
+
+
+class _Unprofiled:
+    # Stands in for Profile.phase() when not profiling
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        return False
+
+
+_UNPROFILED = _Unprofiled()
+
+
+def _unprofiled(name: str) -> _Unprofiled:
+    return _UNPROFILED
+
+
+def lint_into(path: str, sink: ViolationSink, stream: bool = False, cache=None, state: str = None,
+              jobs: int = None, profile=None, linter=None):
+    """
+    Lint a single manifest file, feeding every violation into `sink`.
+
+    With `stream`, actions[] and observers[] are read incrementally
+    instead of materializing the parsed manifest.
+
+    With `state`, the manifest is re-linted incrementally against the
+    incremental state file at that path (see engine.incremental),
+    which is updated afterwards. With a `linter` (an IncrementalLinter),
+    the manifest is re-linted incrementally against its in-memory state.
 
+    With a `cache` (see cli.cache), returns (key, text): `text` is the
+    stored report on a cache hit, in which case the sink is left empty
+    and no rule is run; `key` is None if the manifest could not be
+    parsed. Streaming bypasses the cache. Returns (None, None) otherwise.
+
+    With `jobs` > 1, rules are executed on that many processes
+    (see engine.parallel); the violations are the same.
+
+    With a `profile` (see engine.profiling), the load, cache, schema,
+    context and rules phases and every rule are measured. With
+    `stream`, the load phase includes schema validation and context
+    construction.
+
+    IO, JSON, schema and construction failures are reported as BLOCKED.
+    """
+    phase = profile.phase if profile is not None else _unprofiled
+    context = None
     try:
-        with open(sys.argv[1]) as f:
-            manifest = json.load(f)
-    except (FileNotFoundError, PermissionError) as e:
-        violations = [{
-            "severity": "ERROR",
-            "rule": "CLI-IO-ERROR",
-            "axiom": None,
-            "path": sys.argv[1],
-            "message": f"Failed to read manifest: {str(e)}"
-        }]
-        report = generate_report(violations)
-        print(json.dumps(report, indent=2))
+        if stream:
+            with phase("load"), open(path, encoding="utf-8") as f:
+                check = StreamSchemaCheck()
+                try:
+                    context = SemanticContext.from_stream(f, inspect=check)
+                except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+                    raise
+                except Exception:
+                    # Schema errors take precedence over construction failures,
+                    # which only structurally invalid manifests can cause
+                    f.seek(0)
+                    errors = check_stream(f)
+                    if not errors:
+                        raise
+                else:
+                    errors = check_stream(f, check)
+            if errors:
+                sink.extend(errors)
+                return None, None
+        else:
+            with phase("load"):
+                manifest = read_manifest(path)
+    except OSError as e:
+        # Including directories and failures to map the file
+        sink.append(_blocked_violation("CLI-IO-ERROR", path, f"Failed to read manifest: {str(e)}"))
+        return None, None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        sink.append(_blocked_violation("CLI-JSON-ERROR", path, f"Invalid JSON in manifest: {str(e)}"))
+        return None, None
+    except RootTypeError as e:
+        # A streamed manifest that is not an object, as check_schema reports it
+        sink.append(root_type_violation(e.value))
+        return None, None
+    except ValueError as e:
+        sink.append(_blocked_violation("CONSTRUCTION-ERROR", "manifest", str(e)))
+        return None, None
+
+    key = None
+    if context is None:
+        if cache is not None:
+            with phase("cache"):
+                key = cache.key(manifest)
+                text = cache.get(key)
+            if text is not None:
+                return key, text
+
+        # Structural validation precedes every semantic stage (§8)
+        with phase("schema"):
+            errors = check_schema(manifest)
+        if errors:
+            sink.extend(errors)
+            return key, None
+
+        if state is not None or linter is not None:
+            if linter is None:
+                from engine.incremental import IncrementalLinter
+                linter = IncrementalLinter.load(state)
+            try:
+                with phase("rules"):
+                    sink.extend(linter.lint(manifest))
+            except ValueError as e:
+                sink.append(_blocked_violation("CONSTRUCTION-ERROR", "manifest", str(e)))
+                return key, None
+            if state is not None:
+                try:
+                    linter.save(state)
+                except OSError:
+                    # The state only speeds up the next run
+                    pass
+            return key, None
+
+        try:
+            # Semantic context construction (pure builder)
+            with phase("context"):
+                context = SemanticContext(manifest)
+        except ValueError as e:
+            # Convert construction errors to violations
+            sink.append(_blocked_violation("CONSTRUCTION-ERROR", "manifest", str(e)))
+            return key, None
+
+    # Rule execution
+    with phase("rules"):
+        run_axiom_rules(context, violations=sink, workers=jobs, profile=profile)
+    return key, None
+
+
+def lint_path(path: str, stream: bool = False, cache=None) -> dict:
+    """
+    Lint a single manifest file and return its ABI report.
+    """
+    with ViolationSink() as sink:
+        key, text = lint_into(path, sink, stream=stream, cache=cache)
+        if text is not None:
+            return json.loads(text)
+
+        report = build_report(sink)
+        if key is not None:
+            cache.put(key, json.dumps(report, indent=2))
+        return report
+
+
+def parse_args(argv: list[str]):
+    """
+    Split argv into (options, operands).
+
+    Options: batch, watch, serve, stream, no_cache, verify, verdict_only (flags) and
+    cache_dir, incremental, connect, jobs, profile, interval (valued).
+    Returns None on malformed invocations.
+    """
+    options = {
+        "batch": False, "watch": False, "serve": False, "stream": False, "no_cache": False,
+        "verify": False, "verdict_only": False, "interval": None,
+        "cache_dir": None, "incremental": None, "connect": None, "jobs": None,
+        "profile": None
+    }
+    operands = []
+
+    if argv[:1] == ["serve"]:
+        options["serve"] = True
+        argv = argv[1:]
+
+    args = iter(argv)
+    for arg in args:
+        if arg == "--batch" and not operands:
+            options["batch"] = True
+        elif arg == "--watch" and not operands:
+            options["watch"] = True
+        elif arg == "--stream":
+            options["stream"] = True
+        elif arg == "--no-cache":
+            options["no_cache"] = True
+        elif arg == "--verify":
+            options["verify"] = True
+        elif arg == "--verdict-only":
+            options["verdict_only"] = True
+        elif arg in ("--cache-dir", "--incremental", "--connect", "--profile"):
+            value = next(args, None)
+            if value is None:
+                return None
+            options[arg[2:].replace("-", "_")] = value
+        elif arg == "--jobs":
+            value = next(args, None)
+            if value is None or not (value.isascii() and value.isdigit()) or int(value) < 1:
+                return None
+            options["jobs"] = int(value)
+        elif arg == "--interval":
+            value = next(args, None)
+            try:
+                options["interval"] = float(value)
+            except (TypeError, ValueError):
+                return None
+            if not 0 < options["interval"] < float("inf"):
+                return None
+        else:
+            operands.append(arg)
+
+    return options, operands
+
+
+def cache_dir_for(options: dict):
+    """
+    Return the report cache directory selected by the invocation, or None.
+
+    The cache is used only when requested through --cache-dir or
+    the WORLDSEED_LINT_CACHE_DIR environment variable; --no-cache
+    overrides both.
+    """
+    if options["no_cache"]:
+        return None
+    return options["cache_dir"] or os.environ.get("WORLDSEED_LINT_CACHE_DIR") or None
+
+
+def _full_report(path: str) -> str:
+    with ViolationSink() as sink:
+        lint_into(path, sink)
+        out = io.StringIO()
+        write_report(sink, out)
+        return out.getvalue()
+
+
+def _write_profile(destination: str, document: dict):
+    # The report owns STDOUT; "-" selects STDERR
+    text = json.dumps(document, indent=2) + "\n"
+    if destination == "-":
+        sys.stderr.write(text)
+        return
+    try:
+        with open(destination, "w", encoding="utf-8") as f:
+            f.write(text)
+    except OSError as e:
+        print(f"Failed to write profile: {str(e)}", file=sys.stderr)
+
+
+def _discard(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parsed = parse_args(argv)
+    if parsed is None:
+        print(USAGE)
         sys.exit(2)
-    except json.JSONDecodeError as e:
-        violations = [{
-            "severity": "ERROR",
-            "rule": "CLI-JSON-ERROR",
-            "axiom": None,
-            "path": sys.argv[1],
-            "message": f"Invalid JSON in manifest: {str(e)}"
-        }]
-        report = generate_report(violations)
-        print(json.dumps(report, indent=2))
+    options, operands = parsed
+    cache_dir = cache_dir_for(options)
+
+    single = ("stream", "incremental", "verify", "connect", "cache_dir", "no_cache", "jobs", "profile",
+              "verdict_only")
+    if options["watch"]:
+        if not operands or options["batch"] or options["serve"] or any(options[o] for o in single):
+            print(USAGE)
+            sys.exit(2)
+
+        from cli.watch import DEFAULT_INTERVAL, watch
+        sys.exit(watch(operands, interval=options["interval"] or DEFAULT_INTERVAL))
+    if options["interval"] is not None:
+        print(USAGE)
         sys.exit(2)
 
-    try:
-        # Semantic context construction (pure builder)
-        context = SemanticContext(manifest)
-    except ValueError as e:
-        # Convert construction errors to violations
-        violations = [{
-            "severity": "ERROR",
-            "rule": "CONSTRUCTION-ERROR",
-            "axiom": None,
-            "path": "manifest",
-            "message": str(e)
-        }]
-        report = generate_report(violations)
+    if options["batch"]:
+        if not operands or options["stream"] or options["incremental"] or options["verify"] \
+                or options["connect"] or options["jobs"] or options["profile"] or options["verdict_only"]:
+            print(USAGE)
+            sys.exit(2)
+
+        from cli.batch import run_batch
+        sys.exit(run_batch(operands, cache_dir=cache_dir))
+
+    if options["serve"]:
+        if len(operands) != 1 or options["stream"] or options["incremental"] \
+                or options["verify"] or options["connect"] or options["jobs"] or options["profile"] \
+                or options["verdict_only"]:
+            print(USAGE)
+            sys.exit(2)
+
+        from cli.daemon import serve
+        sys.exit(serve(operands[0], cache_dir=cache_dir))
+
+    if options["connect"]:
+        if len(operands) != 1 or options["incremental"] or options["verify"] \
+                or options["cache_dir"] or options["no_cache"] or options["jobs"] or options["profile"] \
+                or options["verdict_only"]:
+            print(USAGE)
+            sys.exit(2)
+
+        from cli.daemon import request
+        try:
+            report = request(options["connect"], operands[0], stream=options["stream"])
+        except (OSError, ValueError) as e:
+            report = generate_report([_blocked_violation(
+                "CLI-IO-ERROR", options["connect"], f"Failed to reach lint server: {str(e)}")])
         print(json.dumps(report, indent=2))
+        sys.exit(exit_code_for(report["verdict"]))
+
+    if len(operands) != 1 or (options["stream"] and options["incremental"]) \
+            or (options["verify"] and not options["incremental"]) \
+            or (options["jobs"] and (options["incremental"] or options["profile"])) \
+            or (options["verdict_only"] and options["incremental"]):
+        print(USAGE)
         sys.exit(2)
+    path = operands[0]
 
-    # Rule execution
-    violations = run_axiom_rules(context)
+    # A verdict-only report is incomplete: it is neither cached nor served from the cache
+    cache = None
+    if cache_dir is not None and not options["stream"] and not options["verify"] \
+            and not options["verdict_only"]:
+        from cli.cache import ReportCache
+        cache = ReportCache(cache_dir)
+
+    profile = None
+    if options["profile"]:
+        from engine.profiling import Profile
+        profile = Profile()
+    phase = profile.phase if profile is not None else _unprofiled
+
+    with (VerdictSink() if options["verdict_only"] else ViolationSink()) as sink:
+        try:
+            key, text = lint_into(path, sink, stream=options["stream"], cache=cache,
+                                  state=options["incremental"], jobs=options["jobs"], profile=profile)
+        except VerdictDecided:
+            # Rule evaluation stopped at the deciding violation
+            key, text = None, None
+
+        if text is not None:
+            verdict = json.loads(text)["verdict"]
+        elif key is not None or options["verify"]:
+            out = io.StringIO()
+            with phase("report"):
+                write_report(sink, out)
+            text = out.getvalue()
+            verdict = sink.verdict
+            if key is not None:
+                cache.put(key, text)
 
-    # Reporting
-    report = generate_report(violations)
-    print(json.dumps(report, indent=2))
+        if options["verify"]:
+            full = _full_report(path)
+            if text != full:
+                print("Incremental report differs from full relint; state discarded.", file=sys.stderr)
+                _discard(options["incremental"])
+                sys.stdout.write(full)
+                sys.stdout.write("\n")
+                sys.exit(2)
+
+        if text is not None:
+            sys.stdout.write(text)
+        else:
+            # Reporting: violations are merged straight into the output
+            with phase("report"):
+                write_report(sink, sys.stdout)
+            verdict = sink.verdict
+        sys.stdout.write("\n")
+
+    if profile is not None:
+        profile.close()
+        _write_profile(options["profile"], profile.as_dict())
 
     # Determine exit code according to interface.md ABI
-    if report["verdict"] == "COMPLIANT":
-        sys.exit(0)
-    elif report["verdict"] == "NON-COMPLIANT":
-        sys.exit(1)
-    else:  # BLOCKED
-        sys.exit(2)
+    sys.exit(exit_code_for(verdict))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+"""
+WorldSeed Lint Watch Mode
+
+Status: Normative
+Scope: Repeated invocation and orchestration only
+
+Responsibilities:
+- Poll watched inputs (paths, directories, @listfiles) for changes
+- Re-lint changed manifests incrementally, with warm per-manifest state
+- Stream one ABI report per (re-)linted manifest
+
+Change Detection:
+Inputs are re-expanded on every poll, so manifests added to a
+watched directory are picked up. A manifest is re-linted when its
+stat signature (modification time, size, inode) changed and its
+content digest differs from that of its last lint. A manifest that
+can no longer be read is reported once, as BLOCKED, and so is an
+@listfile that cannot be expanded.
+
+Each manifest keeps an IncrementalLinter (see engine.incremental)
+for the lifetime of the watch, so a re-lint recomputes only the
+violations of changed elements. All linters share the compiled
+rule plan.
+
+Output Format:
+One JSON object per line on STDOUT, as in batch mode, written as
+soon as the manifest is linted:
+
+    {"manifest": "<path>", "report": { ...ABI report... }}
+
+Within one poll, lines follow the order of the expanded inputs.
+
+This module MUST NOT alter per-manifest lint outcomes.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+from cli.batch import expand_inputs, listfile_report
+from cli.main import exit_code_for, lint_into
+from engine import default_plan
+from engine.incremental import IncrementalLinter
+from engine.report import ViolationSink, build_report
+
+
+DEFAULT_INTERVAL = 0.5
+
+_READ_CHUNK = 1 << 20
+
+
+def _signature(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _content_digest(path: str):
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class _Watched:
+    """
+    Per-manifest watch state.
+
+    Fields:
+    - signature: stat signature at the last poll, None if unreadable
+    - digest: content digest at the last lint, None if unreadable
+    - linter: incremental lint state of the manifest
+    - exit_code: exit code of the last report
+    """
+    __slots__ = ("signature", "digest", "linter", "exit_code")
+
+    def __init__(self, plan):
+        self.signature = self.digest = self.exit_code = None
+        self.linter = IncrementalLinter(plan)
+
+
+def lint_watched(path: str, watched: _Watched) -> dict:
+    """
+    Re-lint a watched manifest and return its ABI report.
+    """
+    with ViolationSink() as sink:
+        lint_into(path, sink, linter=watched.linter)
+        return build_report(sink)
+
+
+def poll(args: list[str], state: dict, plan, out) -> int:
+    """
+    Lint every new or changed manifest named by `args` once.
+
+    `state` maps paths to their _Watched entry and is updated in
+    place; entries of manifests no longer named are dropped.
+    Returns the number of reports written.
+    """
+    failures = {}
+    paths = expand_inputs(args, failures)
+    linted = 0
+
+    for path in paths:
+        watched = state.get(path)
+        if watched is None:
+            watched = state[path] = _Watched(plan)
+
+        if path in failures:
+            # Reported once, until the listfile can be expanded
+            if watched.exit_code is None:
+                report = listfile_report(path, failures[path])
+                watched.exit_code = exit_code_for(report["verdict"])
+                out.write(json.dumps({"manifest": path, "report": report}) + "\n")
+                out.flush()
+                linted += 1
+            continue
+
+        signature = _signature(path)
+        if watched.exit_code is not None and signature == watched.signature:
+            continue
+        watched.signature = signature
+
+        digest = _content_digest(path) if signature is not None else None
+        if watched.exit_code is not None and digest == watched.digest:
+            continue
+        watched.digest = digest
+
+        report = lint_watched(path, watched)
+        watched.exit_code = exit_code_for(report["verdict"])
+        out.write(json.dumps({"manifest": path, "report": report}) + "\n")
+        out.flush()
+        linted += 1
+
+    for path in set(state).difference(paths):
+        del state[path]
+
+    return linted
+
+
+def watch(args: list[str], interval: float = DEFAULT_INTERVAL, polls: int = None, out=None) -> int:
+    """
+    Watch the manifests named by `args`, streaming a report for each
+    (re-)lint, until interrupted or after `polls` polls.
+
+    Returns the maximum exit code of the latest reports of the
+    watched manifests (0 if none).
+    """
+    if out is None:
+        out = sys.stdout
+    plan = default_plan()
+    state = {}
+
+    try:
+        done = 0
+        while True:
+            poll(args, state, plan, out)
+            done += 1
+            if polls is not None and done >= polls:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+    return max((w.exit_code for w in state.values() if w.exit_code is not None), default=0)
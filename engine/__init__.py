@@ -24,21 +24,37 @@ Authority:
 This package introduces NO new semantics.
 """
 
-import importlib
-from mapping.axiom_mapping import AXIOM_RULE_MODULES
+from engine.rule_plan import RulePlan, compile_plan
 
 
-def run_axiom_rules(context):
+_default_plan = None
+
+
+def default_plan() -> RulePlan:
+    """
+    Return the axiom-only rule plan, compiling it on first use.
+    """
+    global _default_plan
+
+    if _default_plan is None:
+        _default_plan = compile_plan()
+    return _default_plan
+
+
+def run_axiom_rules(context, plan=None, violations=None, workers=None, profile=None):
     """
     Execute all axiom rules in canonical order.
 
     Rules are executed strictly according to axiom mapping.
-    """
-    violations = []
 
-    for axiom, module_path in AXIOM_RULE_MODULES.items():
-        module = importlib.import_module(module_path)
-        check_fn = getattr(module, "check")
-        violations.extend(check_fn(context))
+    If no plan is given, the default axiom-only plan is used.
+    If `violations` is given (a list or a ViolationSink),
+    violations are appended to it and it is returned.
+    With `workers` > 1, large contexts are sharded over that
+    many processes; violations are delivered in the same order.
+    With a `profile` (see engine.profiling), every rule is measured.
+    """
+    if plan is None:
+        plan = default_plan()
 
-    return violations
+    return plan.run(context, violations, workers, profile)
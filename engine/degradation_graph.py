@@ -13,6 +13,36 @@ The graph encodes:
 - preserved distinctions,
 - and non-invertible transformations.
 
+Manifest Section:
+The graph is built from the optional top-level `degradation` array.
+Each entry declares one transformation between two representations:
+
+    {
+      "source": "raw_audio",
+      "target": "mp3_audio",
+      "irreversible": true,
+      "destroyed": ["ultrasonic content"],
+      "preserved": ["speech content"],
+      "reconstruction": false
+    }
+
+- source, target: representation identifiers (the graph nodes)
+- irreversible: whether the transformation is irreversible
+- destroyed, preserved: distinctions destroyed and preserved
+- reconstruction: true if the transformation is a declared
+  reconstruction of previously destroyed distinctions
+
+Undeclared fields remain undeclared; the graph does not default them.
+
+Representation:
+Node identifiers are interned to dense integer ids in order of first
+appearance. Adjacency is stored in compressed sparse row form, with
+edges grouped by source (forward) and by target (reverse), so that
+every graph algorithm runs in O(V + E).
+
+Reachability queries are answered by a ReachabilityIndex per edge
+selection, built once and shared by the S14, S15 and S19 rules.
+
 Normative Requirements:
 - The graph MUST include only declared transformations.
 - Undeclared degradation MUST NOT be assumed.
@@ -25,14 +55,491 @@ This module is authoritative for enforcing:
 - S19 (Distinguishability Preservation)
 """
 
+# Edge selections for strongly connected components
+ALL_EDGES = "all"
+IRREVERSIBLE_EDGES = "irreversible"
+IMPLICIT_EDGES = "implicit"
+
+# Largest condensation indexed by a transitive closure bit matrix
+CLOSURE_MAX_COMPONENTS = 1 << 12
+
+
 class DegradationGraph:
     """
-    Runtime holder for degradation semantics.
+    Graph of declared degradation and irreversibility.
+
+    Fields:
+    - nodes: representation identifiers, indexed by node id
+    - ids: representation identifier -> node id
+    - edges: degradation edges, in declaration order
+    - edge_source, edge_target: node ids of each edge's endpoints
+    - out_offsets, out_edges: forward adjacency; the edges leaving
+      node n are out_edges[out_offsets[n]:out_offsets[n + 1]]
+    - in_offsets, in_edges: reverse adjacency, grouped by target
+    - distinctions: distinction names, indexed by distinction id
+    - distinction_ids: distinction name -> distinction id
+    - destroyed_bits, preserved_bits: per edge, the bitset (int) of
+      its destroyed and preserved distinction ids; 0 if undeclared
+
+    Invariants:
+    - Graph MUST include only explicitly declared transformations.
+    - Graph MUST be acyclic with respect to irreversibility.
+    - Reconstruction paths MUST NOT exist unless explicitly declared.
+    """
+    def __init__(self, edges=()):
+        self.edges = list(edges)
+        self.nodes = []
+        self.ids = {}
+        self._components = {}
+        self._witnesses = {}
+        self._destroyers = None
+        self._reachability = {}
+
+        ids = self.ids
+        nodes = self.nodes
+        sources = self.edge_source = []
+        targets = self.edge_target = []
+        for edge in self.edges:
+            for name, ends in ((edge.source, sources), (edge.target, targets)):
+                n = ids.get(name)
+                if n is None:
+                    n = ids[name] = len(nodes)
+                    nodes.append(name)
+                ends.append(n)
+
+        self.out_offsets, self.out_edges = _group(len(nodes), sources)
+        self.in_offsets, self.in_edges = _group(len(nodes), targets)
+
+        self.distinctions = []
+        self.distinction_ids = {}
+        self.destroyed_bits = [self.bits(edge.destroyed_distinctions or ()) for edge in self.edges]
+        self.preserved_bits = [self.bits(edge.preserved_distinctions or ()) for edge in self.edges]
+
+    def bits(self, names) -> int:
+        """
+        Bitset of distinction names, interning new names.
+        """
+        ids = self.distinction_ids
+        bits = 0
+        for name in names:
+            d = ids.get(name)
+            if d is None:
+                d = ids[name] = len(self.distinctions)
+                self.distinctions.append(name)
+            bits |= 1 << d
+        return bits
+
+    def names(self, bits: int) -> list:
+        """
+        Sorted distinction names of a bitset.
+        """
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self.distinctions[low.bit_length() - 1])
+            bits ^= low
+        names.sort()
+        return names
+
+    def successors(self, n: int):
+        """
+        Yield (edge id, target node id) for the edges leaving node n.
+        """
+        targets = self.edge_target
+        for e in self.out_edges[self.out_offsets[n]:self.out_offsets[n + 1]]:
+            yield e, targets[e]
+
+    def predecessors(self, n: int):
+        """
+        Yield (edge id, source node id) for the edges entering node n.
+        """
+        sources = self.edge_source
+        for e in self.in_edges[self.in_offsets[n]:self.in_offsets[n + 1]]:
+            yield e, sources[e]
+
+    def selection(self, which: str) -> list:
+        """
+        Per-edge membership flags of an edge selection:
+        ALL_EDGES, IRREVERSIBLE_EDGES, or IMPLICIT_EDGES
+        (every edge that is not a declared reconstruction).
+        """
+        if which == ALL_EDGES:
+            return [True] * len(self.edges)
+        if which == IRREVERSIBLE_EDGES:
+            return [edge.irreversible is True for edge in self.edges]
+        if which == IMPLICIT_EDGES:
+            return [edge.reconstruction is not True for edge in self.edges]
+        raise ValueError(f"Unknown edge selection: {which}")
+
+    def components(self, which: str = ALL_EDGES) -> list:
+        """
+        Strongly connected component id of every node, over the
+        edges of a selection.
+
+        Component ids are numbered in reverse topological order of
+        the condensation: every selected edge between two components
+        leads from a higher id to a lower one.
+
+        Computed once per selection, in O(V + E).
+        """
+        comp = self._components.get(which)
+        if comp is None:
+            comp = self._components[which] = self._tarjan(self.selection(which))
+        return comp
+
+    def _tarjan(self, selected: list) -> list:
+        # Iterative Tarjan: recursion depth would grow with pipeline length
+        count = len(self.nodes)
+        out_offsets, out_edges, targets = self.out_offsets, self.out_edges, self.edge_target
+        index = [-1] * count
+        low = [0] * count
+        comp = [-1] * count
+        stack = []
+        next_index = 0
+        next_comp = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = next_index
+            next_index += 1
+            stack.append(root)
+            work = [(root, out_offsets[root])]
+
+            while work:
+                n, i = work[-1]
+                end = out_offsets[n + 1]
+                while i < end:
+                    e = out_edges[i]
+                    i += 1
+                    if not selected[e]:
+                        continue
+                    m = targets[e]
+                    if index[m] == -1:
+                        work[-1] = (n, i)
+                        index[m] = low[m] = next_index
+                        next_index += 1
+                        stack.append(m)
+                        work.append((m, out_offsets[m]))
+                        break
+                    if comp[m] == -1 and index[m] < low[n]:
+                        low[n] = index[m]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[n] < low[parent]:
+                            low[parent] = low[n]
+                    if low[n] == index[n]:
+                        while True:
+                            m = stack.pop()
+                            comp[m] = next_comp
+                            if m == n:
+                                break
+                        next_comp += 1
+
+        return comp
+
+    def topological_order(self, which: str = ALL_EDGES) -> list:
+        """
+        Node ids ordered so that every selected edge between two
+        components leads forward; nodes of one component are adjacent.
+        """
+        comp = self.components(which)
+        count = max(comp) + 1 if comp else 0
+        order = _group(count, comp)[1]
+        order.reverse()
+        return order
+
+    def on_cycle(self, e: int, which: str = ALL_EDGES) -> bool:
+        """
+        Whether edge e lies on a cycle of selected edges
+        (e itself MUST be selected).
+        """
+        comp = self.components(which)
+        return comp[self.edge_source[e]] == comp[self.edge_target[e]]
+
+    def reappearances(self):
+        """
+        Yield (edge id, bitset) for every implicit transformation that
+        declares preserved distinctions destroyed upstream of its source.
+
+        A distinction is destroyed upstream of node n if some path of
+        implicit transformations into n contains an edge destroying
+        it. A declared reconstruction does not carry upstream losses
+        to its target; its own destroyed distinctions are carried on.
+        Nodes on a common cycle of implicit transformations share
+        one bitset.
+
+        One pass over the condensation in topological order. The
+        bitset of a component is released once its last successor
+        has absorbed it, so memory follows the width of the graph,
+        not its depth.
+        """
+        comp = self.components(IMPLICIT_EDGES)
+        count = max(comp) + 1 if comp else 0
+        edges, sources = self.edges, self.edge_source
+        destroyed, preserved = self.destroyed_bits, self.preserved_bits
+        in_offsets, in_edges = self.in_offsets, self.in_edges
+        out_offsets, out_edges = self.out_offsets, self.out_edges
+
+        acc = [0] * count
+        pending = [0] * count
+        for e, edge in enumerate(edges):
+            c, t = comp[sources[e]], comp[self.edge_target[e]]
+            if edge.reconstruction is True:
+                acc[t] |= destroyed[e]
+            elif c != t:
+                pending[c] += 1
+
+        order = self.topological_order(IMPLICIT_EDGES)
+        i = 0
+        while i < len(order):
+            c = comp[order[i]]
+            j = i
+            while j < len(order) and comp[order[j]] == c:
+                j += 1
+            members = order[i:j]
+            i = j
+
+            bits = acc[c]
+            for n in members:
+                for e in in_edges[in_offsets[n]:in_offsets[n + 1]]:
+                    if edges[e].reconstruction is True:
+                        continue
+                    source = comp[sources[e]]
+                    if source != c:
+                        bits |= acc[source]
+                        pending[source] -= 1
+                        if not pending[source]:
+                            acc[source] = 0
+                    bits |= destroyed[e]
+            acc[c] = bits if pending[c] else 0
+
+            if not bits:
+                continue
+            for n in members:
+                for e in out_edges[out_offsets[n]:out_offsets[n + 1]]:
+                    hit = preserved[e] & bits
+                    if hit and edges[e].reconstruction is not True:
+                        yield e, hit
+
+    def destroyers(self, d: int) -> list:
+        """
+        Ids of the transformations destroying distinction d.
+        """
+        if self._destroyers is None:
+            self._destroyers = [[] for _ in self.distinctions]
+            for e, bits in enumerate(self.destroyed_bits):
+                while bits:
+                    low = bits & -bits
+                    self._destroyers[low.bit_length() - 1].append(e)
+                    bits ^= low
+        return self._destroyers[d]
+
+    def destroyed_by(self, d: int, n: int) -> int:
+        """
+        Id of a transformation destroying distinction d upstream of
+        node n, where d is known to be destroyed upstream of n
+        (as reported by reappearances()).
+
+        Answered from one labelling of the implicit condensation per
+        distinction, naming the first destroyer in declaration order.
+        """
+        destroyers = self.destroyers(d)
+        if len(destroyers) == 1:
+            return destroyers[0]
+
+        index = self.reachability(IMPLICIT_EDGES)
+        first = self._witnesses.get(d)
+        if first is None:
+            targets = self.edge_target
+            first = self._witnesses[d] = index.first_reaching([targets[e] for e in destroyers])
+        i = first[index.comp[n]]
+        return destroyers[i] if i >= 0 else -1
+
+    def reachability(self, which: str = ALL_EDGES) -> "ReachabilityIndex":
+        """
+        Reachability index over the edges of a selection,
+        built once per selection and shared by all rules.
+        """
+        index = self._reachability.get(which)
+        if index is None:
+            index = self._reachability[which] = ReachabilityIndex(self, which)
+        return index
+
+
+class ReachabilityIndex:
+    """
+    Reachability queries over one edge selection of a DegradationGraph.
+
+    Queries are answered on the condensation (the DAG of strongly
+    connected components), whose component ids are in reverse
+    topological order:
 
-    The graph MUST be constructed only from explicitly
-    declared degradation operations.
+    - nodes of one component reach each other, and a component
+      reaches only components with lower ids: O(1);
+    - up to CLOSURE_MAX_COMPONENTS components, the transitive
+      closure is held as one bitset row per component: O(1);
+    - beyond, every component carries two post-order interval
+      labels, from two depth-first traversals in opposite child
+      order. A label not contained in the other's proves
+      unreachability in O(1); otherwise a depth-first search
+      pruned by both labels decides.
+
+    The labels and the closure are built on the first query that
+    needs them, in O(V + E) and O(C * E / w) respectively.
+
+    Many-to-all queries (first_reaching) take one pass over the
+    condensation instead.
     """
+    def __init__(self, graph, which: str):
+        self.comp = graph.components(which)
+        self._graph = graph
+        self._which = which
+        self._successors = None
+        self._closure = None
+        self._labels = None
+
+    def reaches(self, u: int, v: int) -> bool:
+        """
+        Whether node v is reachable from node u (every node reaches itself).
+        """
+        cu, cv = self.comp[u], self.comp[v]
+        if cu == cv:
+            return True
+        if cu < cv:
+            return False
+
+        if self._closure is None and self._labels is None:
+            self._label()
+        if self._closure is not None:
+            return self._closure[cu] >> cv & 1 == 1
+
+        labels = self._labels
+        for low, post in labels:
+            if not (low[cu] <= low[cv] and post[cv] <= post[cu]):
+                return False
+
+        # Depth-first search, entering only components whose labels
+        # contain those of the target
+        successors = self._condensation()
+        seen = {cu}
+        stack = [cu]
+        while stack:
+            c = stack.pop()
+            for s in successors[c]:
+                if s == cv:
+                    return True
+                if s in seen or s < cv:
+                    continue
+                if all(low[s] <= low[cv] and post[cv] <= post[s] for low, post in labels):
+                    seen.add(s)
+                    stack.append(s)
+        return False
+
+    def first_reaching(self, starts: list) -> list:
+        """
+        For every component, the position in `starts` (node ids) of
+        the first start node reaching it, or -1 if none does.
+        One pass over the condensation.
+        """
+        successors = self._condensation()
+        none = len(starts)
+        first = [none] * len(successors)
+        comp = self.comp
+        for i, n in enumerate(starts):
+            if first[comp[n]] == none:
+                first[comp[n]] = i
+
+        # Predecessors have higher ids and are final first
+        for c in range(len(successors) - 1, -1, -1):
+            f = first[c]
+            if f != none:
+                for s in successors[c]:
+                    if f < first[s]:
+                        first[s] = f
+        return [-1 if f == none else f for f in first]
+
+    def _condensation(self) -> list:
+        # Successor components of every component, without duplicates
+        if self._successors is None:
+            graph, comp = self._graph, self.comp
+            count = max(comp) + 1 if comp else 0
+            successors = [[] for _ in range(count)]
+            last = [-1] * count
+            selected = graph.selection(self._which)
+            offsets, edges, targets = graph.out_offsets, graph.out_edges, graph.edge_target
+            # Nodes of one component are adjacent in topological order
+            for n in graph.topological_order(self._which):
+                c = comp[n]
+                for e in edges[offsets[n]:offsets[n + 1]]:
+                    t = comp[targets[e]]
+                    if selected[e] and t != c and last[t] != c:
+                        last[t] = c
+                        successors[c].append(t)
+            self._successors = successors
+        return self._successors
+
+    def _label(self):
+        successors = self._condensation()
+        count = len(successors)
+        if count <= CLOSURE_MAX_COMPONENTS:
+            # Successors have lower ids and are complete first
+            closure = [0] * count
+            for c in range(count):
+                bits = 1 << c
+                for s in successors[c]:
+                    bits |= closure[s]
+                closure[c] = bits
+            self._closure = closure
+        else:
+            self._labels = [_intervals(successors, False), _intervals(successors, True)]
+
+
+def _group(count: int, keys: list):
+    # Counting sort of edge ids by key: offsets plus grouped edge ids
+    offsets = [0] * (count + 1)
+    for k in keys:
+        offsets[k + 1] += 1
+    for n in range(count):
+        offsets[n + 1] += offsets[n]
+
+    grouped = [0] * len(keys)
+    fill = offsets[:-1]
+    for e, k in enumerate(keys):
+        grouped[fill[k]] = e
+        fill[k] += 1
+    return offsets, grouped
+
+
+def _intervals(successors: list, reverse: bool):
+    # Post-order rank of every component in a depth-first traversal,
+    # and the lowest rank among the components it reaches
+    count = len(successors)
+    post = [-1] * count
+    rank = 0
+    for root in range(count - 1, -1, -1):
+        if post[root] != -1:
+            continue
+        post[root] = -2
+        work = [(root, iter(reversed(successors[root]) if reverse else successors[root]))]
+        while work:
+            c, children = work[-1]
+            for s in children:
+                if post[s] == -1:
+                    post[s] = -2
+                    work.append((s, iter(reversed(successors[s]) if reverse else successors[s])))
+                    break
+            else:
+                work.pop()
+                post[c] = rank
+                rank += 1
 
-    def __init__(self):
-        self.nodes = set()
-        self.edges = set()
+    # Successors have lower ids and are complete first
+    low = post[:]
+    for c in range(count):
+        for s in successors[c]:
+            if low[s] < low[c]:
+                low[c] = low[s]
+    return low, post
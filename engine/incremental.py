@@ -0,0 +1,393 @@
+"""
+Module: Incremental Linting
+
+Status: Normative
+Responsibility: Re-linting a manifest from the difference to a previous run
+
+The manifest is fingerprinted as a two-level Merkle tree:
+
+- header: every top-level member other than actions[] and observers[]
+- sections: one digest per section over its element fingerprints
+- elements: one fingerprint per actions[] and observers[] entry,
+  keyed by name (the entry the context retains for that name)
+
+Violations are attributed to units:
+
+- ("actions", name) / ("observers", name): the node callbacks of every
+  rule for that element, including on_quantity for its quantities
+- ("rule", i): the whole-context part of the i-th applicable rule
+  (check() of rules without node callbacks, on_world and on_edge otherwise)
+
+On a subsequent run, element units are recomputed only for added or
+changed elements, on a context holding just those elements; units of
+removed elements are dropped. Rule units are recomputed only if the
+rule's declared SECTIONS intersect the changed sections; reordering
+the elements of a section changes it. A changed header re-lints
+everything.
+
+The context kept between runs is patched to hold its elements and
+quantities in manifest order, exactly as a full build would.
+
+Normative Requirements:
+- The incremental violation set MUST equal that of a full run.
+- Node callbacks MUST depend only on their node and the header.
+- Manifests whose elements cannot be attributed (non-object entries,
+  non-string names, action names containing ":") MUST be linted in full.
+
+This module introduces NO new semantics.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+
+from engine import default_plan
+from engine.semantic_context import SemanticContext
+from engine.symbols import ACTION_PARAMETER, OBSERVER_NOISE, SymbolTable
+from engine.traversal import NODE_HOOKS
+
+
+STATE_FORMAT = 3
+
+ELEMENT_SECTIONS = ("actions", "observers")
+
+# Context sections read by rules whose elements changed
+_AFFECTED_SECTIONS = {
+    "actions": {"actions", "quantities"},
+    "observers": {"observers", "quantities"},
+}
+
+
+def _digest(value) -> str:
+    # marshal is exact for JSON values (it distinguishes 1, 1.0 and True);
+    # version 2 writes no back-references, so equal values encode equally
+    # however their objects are shared. Key order only causes spurious changes.
+    return hashlib.blake2b(marshal.dumps(value, 2), digest_size=16).hexdigest()
+
+
+def fingerprint(manifest: dict):
+    """
+    Return (header, sections, elements) for a parsed manifest, or None
+    if its elements cannot be attributed.
+
+    - header: digest of the header members
+    - sections: section -> digest of its element fingerprints
+    - elements: section -> {name: (fingerprint, element)}
+    """
+    header = {k: v for k, v in manifest.items() if k not in ELEMENT_SECTIONS}
+
+    sections = {}
+    elements = {}
+    for section in ELEMENT_SECTIONS:
+        entries = manifest.get(section, [])
+        if not isinstance(entries, list):
+            return None
+
+        named = {}
+        for entry in entries:
+            if type(entry) is not dict:
+                return None
+            if "name" not in entry:
+                # Dropped by the context builder
+                continue
+            name = entry["name"]
+            if type(name) is not str or (section == "actions" and ":" in name):
+                return None
+            named[name] = (_digest(entry), entry)
+
+        elements[section] = named
+        sections[section] = _digest([(name, fp) for name, (fp, _) in named.items()])
+
+    return _digest(header), sections, elements
+
+
+class _RuleHooks:
+    """
+    Callbacks of one rule module, split into whole-context
+    and per-element parts.
+    """
+    def __init__(self, rule):
+        module = rule.module
+        self.sections = rule.sections
+        self.element = any(hasattr(module, hook) for hook in NODE_HOOKS)
+        self.check = None if self.element else module.check
+        self.on_world = getattr(module, "on_world", None)
+        self.on_action = getattr(module, "on_action", None)
+        self.on_observer = getattr(module, "on_observer", None)
+        self.on_quantity = getattr(module, "on_quantity", None)
+        self.on_edge = getattr(module, "on_edge", None)
+
+    def reads(self, changed: set) -> bool:
+        return self.sections is None or not changed.isdisjoint(self.sections)
+
+    def run_world(self, context, violations):
+        if self.check is not None:
+            violations.extend(self.check(context))
+            return
+        if self.on_world is not None:
+            self.on_world(context, violations)
+        if self.on_edge is not None:
+            for edge in context.degradation_graph.edges:
+                self.on_edge(context, edge, violations)
+
+
+class IncrementalLinter:
+    """
+    Lints successive versions of a manifest, reusing the results
+    of unchanged elements.
+
+    Fields:
+    - plan: compiled rule plan
+    - header: header digest of the previous run (None before the first)
+    - sections: section digests of the previous run
+    - fingerprints: section -> {name: element fingerprint}
+    - units: unit -> violation records
+    - context: context of the previous run, kept in sync when available
+    - symbols: symbol table shared by every context since the last
+      full run, so that registry keys agree across contexts
+    """
+    def __init__(self, plan=None):
+        self.plan = plan if plan is not None else default_plan()
+        self.reset()
+
+    def reset(self):
+        self.header = None
+        self.sections = {}
+        self.fingerprints = {section: {} for section in ELEMENT_SECTIONS}
+        self.units = {}
+        self.context = None
+        self.symbols = SymbolTable()
+
+    def violations(self) -> list:
+        return [v for unit in self.units.values() for v in unit]
+
+    def lint(self, manifest: dict) -> list:
+        """
+        Lint `manifest` and return its violations.
+
+        Raises ValueError on construction errors, after which
+        the next run is a full one.
+        """
+        try:
+            return self._lint(manifest)
+        except BaseException:
+            self.reset()
+            raise
+
+    def _lint(self, manifest: dict) -> list:
+        prints = fingerprint(manifest)
+        if prints is None:
+            self.reset()
+            return self.plan.run(SemanticContext(manifest, self.symbols))
+
+        header, sections, elements = prints
+        if header != self.header:
+            self._full(manifest, header, sections, elements)
+            return self.violations()
+
+        changed = {section: [] for section in ELEMENT_SECTIONS}
+        removed = {section: [] for section in ELEMENT_SECTIONS}
+        reordered = set()
+        for section in ELEMENT_SECTIONS:
+            if sections[section] == self.sections[section]:
+                continue
+            previous = self.fingerprints[section]
+            current = elements[section]
+            changed[section] = [name for name, (fp, _) in current.items() if previous.get(name) != fp]
+            removed[section] = [name for name in previous if name not in current]
+            kept = [name for name in current if name in previous]
+            if kept != [name for name in previous if name in current]:
+                reordered.add(section)
+
+        if any(changed.values()) or any(removed.values()) or reordered:
+            self._update(manifest, elements, changed, removed, reordered)
+
+        self.sections = sections
+        return self.violations()
+
+    def _hooks(self, context) -> list:
+        return [_RuleHooks(rule) for rule in self.plan.rules_for(context.profile)]
+
+    def _element_violations(self, hooks, context, section: str, name: str) -> list:
+        violations = []
+        intern = context.symbols.intern
+        if section == "actions":
+            action = context.actions[name]
+            for rule in hooks:
+                if rule.on_action is not None:
+                    rule.on_action(context, name, action, violations)
+            a = intern(name)
+            for pname, q in action.parameters.items():
+                key = (ACTION_PARAMETER, a, intern(pname))
+                for rule in hooks:
+                    if rule.on_quantity is not None:
+                        rule.on_quantity(context, key, q, violations)
+        else:
+            obs = context.observers[name]
+            for rule in hooks:
+                if rule.on_observer is not None:
+                    rule.on_observer(context, name, obs, violations)
+            key = (OBSERVER_NOISE, intern(name))
+            for rule in hooks:
+                if rule.on_quantity is not None:
+                    rule.on_quantity(context, key, obs.noise, violations)
+        return violations
+
+    def _full(self, manifest, header, sections, elements):
+        self.reset()
+        context = SemanticContext(manifest, self.symbols)
+        hooks = self._hooks(context)
+
+        for i, rule in enumerate(hooks):
+            violations = []
+            rule.run_world(context, violations)
+            self.units[("rule", i)] = violations
+
+        for section in ELEMENT_SECTIONS:
+            for name in getattr(context, section):
+                self.units[(section, name)] = self._element_violations(hooks, context, section, name)
+
+        self.header = header
+        self.sections = sections
+        self.fingerprints = {s: {name: fp for name, (fp, _) in elements[s].items()} for s in ELEMENT_SECTIONS}
+        self.context = context
+
+    def _update(self, manifest, elements, changed, removed, reordered):
+        # Context holding only the added and changed elements; the
+        # degradation graph is unchanged and not read by element hooks
+        partial = {k: v for k, v in manifest.items() if k not in ELEMENT_SECTIONS and k != "degradation"}
+        for section in ELEMENT_SECTIONS:
+            partial[section] = [elements[section][name][1] for name in changed[section]]
+        delta = SemanticContext(partial, self.symbols)
+        hooks = self._hooks(delta)
+
+        touched = set()
+        for section in ELEMENT_SECTIONS:
+            for name in removed[section]:
+                self.units.pop((section, name), None)
+            for name in changed[section]:
+                self.units[(section, name)] = self._element_violations(hooks, delta, section, name)
+            if removed[section] or changed[section] or section in reordered:
+                # Kept in manifest order, to detect reordering
+                self.fingerprints[section] = {name: fp for name, (fp, _) in elements[section].items()}
+                touched.update(_AFFECTED_SECTIONS[section])
+
+        if self.context is not None:
+            self._patch(delta, elements, changed, removed)
+
+        stale = [i for i, rule in enumerate(hooks) if rule.reads(touched)]
+        if stale and self.context is None:
+            self.context = SemanticContext(manifest, self.symbols)
+        for i in stale:
+            violations = []
+            hooks[i].run_world(self.context, violations)
+            self.units[("rule", i)] = violations
+
+    def _patch(self, delta, elements, changed, removed):
+        context = self.context
+        quantities = context.quantities
+        intern = self.symbols.intern
+
+        # Changed elements that keep their position and quantity keys
+        # are replaced in place; otherwise the registries are rebuilt
+        # in manifest order
+        rebuild = False
+
+        for name in removed["actions"]:
+            action = context.actions.pop(name, None)
+            if action is not None:
+                a = intern(name)
+                for pname in action.parameters:
+                    quantities.pop((ACTION_PARAMETER, a, intern(pname)), None)
+        for name in changed["actions"]:
+            old, new = context.actions.get(name), delta.actions.get(name)
+            if old is None or new is None or list(old.parameters) != list(new.parameters):
+                rebuild = True
+            if new is None:
+                context.actions.pop(name, None)
+                continue
+            context.actions[name] = new
+            if not rebuild:
+                a = intern(name)
+                for pname, q in new.parameters.items():
+                    quantities[ACTION_PARAMETER, a, intern(pname)] = q
+
+        for name in removed["observers"]:
+            if context.observers.pop(name, None) is not None:
+                quantities.pop((OBSERVER_NOISE, intern(name)), None)
+        for name in changed["observers"]:
+            old, new = context.observers.get(name), delta.observers.get(name)
+            if old is None or new is None:
+                rebuild = True
+            if new is None:
+                context.observers.pop(name, None)
+                continue
+            context.observers[name] = new
+            if not rebuild:
+                quantities[OBSERVER_NOISE, intern(name)] = new.noise
+
+        for section in ELEMENT_SECTIONS:
+            nodes = getattr(context, section)
+            order = [name for name in elements[section] if name in nodes]
+            if list(nodes) != order:
+                setattr(context, section, {name: nodes[name] for name in order})
+                rebuild = True
+
+        if rebuild:
+            context._build_registries()
+
+    # ── Persistence ─────────────────────────────────────────
+
+    def save(self, path: str):
+        """
+        Atomically write the fingerprints and violations to `path`.
+
+        The context is not persisted.
+        """
+        state = {
+            "format": STATE_FORMAT,
+            "plan": self.plan.fingerprint,
+            "header": self.header,
+            "sections": self.sections,
+            "fingerprints": self.fingerprints,
+            "units": [[kind, key, violations] for (kind, key), violations in self.units.items()],
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str, plan=None) -> "IncrementalLinter":
+        """
+        Restore a linter from `path`.
+
+        A missing or unreadable state, or one written for a different
+        rule plan, yields a linter whose next run is a full one.
+        """
+        self = cls(plan)
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return self
+
+        if not isinstance(state, dict) or state.get("format") != STATE_FORMAT \
+                or state.get("plan") != self.plan.fingerprint:
+            return self
+
+        self.header = state["header"]
+        self.sections = state["sections"]
+        self.fingerprints = state["fingerprints"]
+        # Violation records are stored as JSON arrays
+        self.units = {
+            (kind, key): [tuple(v) for v in violations] for kind, key, violations in state["units"]
+        }
+        return self
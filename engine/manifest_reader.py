@@ -0,0 +1,122 @@
+"""
+Module: Manifest Reader
+
+Status: Normative
+Responsibility: Whole-manifest reading and JSON decoding
+
+This module reads a WorldSeed manifest file into its parsed value.
+The file is memory-mapped and decoded straight from the mapping.
+
+Decoding uses the standard library unless a fast decoder backend
+from FAST_DECODERS is installed and the manifest is large enough to
+benefit. A fast backend only ever produces a value when it accepts
+the input; the standard library decides every rejection, so
+accepted input and error messages are exactly those of json.load.
+
+Normative Requirements:
+- Manifests MUST be decoded as strict UTF-8; a BOM MUST be rejected.
+- Accepted input MUST be exactly the input accepted by json.load,
+  and values MUST be produced exactly as json.load would decode them.
+- Malformed input MUST raise json.JSONDecodeError, and invalid UTF-8
+  UnicodeDecodeError, with the messages of json.load.
+- This module MUST NOT interpret manifest semantics.
+"""
+
+import json
+import mmap
+
+
+# Optional decoder modules providing loads(bytes), in order of preference
+FAST_DECODERS = ("orjson",)
+
+# Smaller manifests are decoded by the standard library only
+FAST_DECODE_MIN_BYTES = 1 << 20
+
+# Fast decoders may round integers beyond 64 bits to floats. Any
+# 19-digit run not preceded by a decimal point sends the manifest
+# to the standard library; fractional digits never do.
+_DIGITS = bytes(
+    0x30 if 0x30 <= b <= 0x39 else 0x2E if b == 0x2E else 0x20 for b in range(256)
+)
+_WIDE_INTEGER = b" " + b"0" * 19
+_SCAN_CHUNK = 1 << 18
+
+_fast_loads = None
+_probed = False
+
+
+def fast_loads():
+    """
+    Return loads() of the first installed fast decoder, or None.
+    """
+    global _fast_loads, _probed
+    if not _probed:
+        _probed = True
+        for name in FAST_DECODERS:
+            try:
+                module = __import__(name)
+            except ImportError:
+                continue
+            _fast_loads = module.loads
+            break
+    return _fast_loads
+
+
+def _has_wide_integers(data) -> bool:
+    # Scanned in cache-sized windows; overlapping by one pattern length
+    overlap = len(_WIDE_INTEGER) - 1
+    for start in range(0, len(data), _SCAN_CHUNK):
+        window = data[start:start + _SCAN_CHUNK + overlap].translate(_DIGITS)
+        if start == 0:
+            window = b" " + window
+        if window.find(_WIDE_INTEGER) >= 0:
+            return True
+    return False
+
+
+def decode(data):
+    """
+    Decode a manifest from a bytes-like object.
+
+    Cyclic garbage collection is paused while the value is built:
+    a manifest allocates millions of containers and no cycles.
+    """
+    import gc
+
+    fast = fast_loads() if len(data) >= FAST_DECODE_MIN_BYTES else None
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if fast is not None and not _has_wide_integers(data):
+            try:
+                with memoryview(data) as view:
+                    return fast(view)
+            except ValueError:
+                # Rejections and their messages are the standard library's
+                pass
+        return json.loads(str(data, "utf-8"))
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def read_manifest(path: str):
+    """
+    Read and decode the manifest file at `path`.
+
+    Files that cannot be mapped (empty files, pipes) are read instead.
+
+    Raises:
+    - OSError if the file cannot be opened, inspected or read
+      (e.g. IsADirectoryError)
+    - UnicodeDecodeError on invalid UTF-8
+    - json.JSONDecodeError on malformed input
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return decode(f.read())
+        with mapped:
+            return decode(mapped)
@@ -0,0 +1,214 @@
+"""
+Module: Manifest Stream
+
+Status: Normative
+Responsibility: Bounded-memory incremental reading of manifest files
+
+This module reads a WorldSeed manifest from a text stream
+without materializing the whole document.
+
+Top-level members are produced one at a time.
+Members listed as streamed (e.g. actions[], observers[]) are
+produced element by element, so that peak memory is bounded by
+the largest single element rather than by the whole manifest.
+
+Normative Requirements:
+- Accepted input MUST be exactly the input accepted by json.load.
+- Malformed input MUST raise json.JSONDecodeError.
+- Values MUST be produced exactly as json.load would decode them.
+- This module MUST NOT interpret manifest semantics.
+"""
+
+import json
+
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+
+class RootTypeError(ValueError):
+    """
+    Raised when the top-level value of a manifest is not an object.
+
+    Fields:
+    - value: the decoded top-level value
+    """
+    def __init__(self, value):
+        super().__init__("Manifest MUST be a JSON object.")
+        self.value = value
+
+
+class _Buffer:
+    """
+    Sliding text window over a stream.
+
+    Fields:
+    - text: currently buffered text
+    - pos: read position within text
+    - offset: absolute character offset of text[0]
+    - eof: whether the stream is exhausted
+    """
+    def __init__(self, fp):
+        self.fp = fp
+        self.text = ""
+        self.pos = 0
+        self.offset = 0
+        self.line = 1
+        self.line_start = 0
+        self.eof = False
+
+    def fill(self, size: int = CHUNK_SIZE) -> bool:
+        """
+        Discard consumed text and append up to `size` characters.
+
+        Returns False once the stream is exhausted.
+        """
+        if self.eof:
+            return False
+
+        chunk = self.fp.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        consumed = self.text[:self.pos]
+        newlines = consumed.count("\n")
+        if newlines:
+            self.line += newlines
+            self.line_start = self.offset + consumed.rindex("\n") + 1
+        self.offset += self.pos
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, msg: str, pos: int) -> json.JSONDecodeError:
+        """
+        Build a JSONDecodeError located at buffer position `pos`.
+        """
+        prefix = self.text[:pos]
+        newlines = prefix.count("\n")
+        if newlines:
+            lineno = self.line + newlines
+            colno = pos - prefix.rindex("\n")
+        else:
+            lineno = self.line
+            colno = self.offset + pos - self.line_start + 1
+
+        err = json.JSONDecodeError(msg, self.text, pos)
+        err.pos = self.offset + pos
+        err.lineno = lineno
+        err.colno = colno
+        err.args = (f"{msg}: line {lineno} column {colno} (char {err.pos})",)
+        return err
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character ("" at EOF).
+        """
+        while True:
+            text, pos = self.text, self.pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str, msg: str) -> str:
+        c = self.peek()
+        if not c or c not in chars:
+            raise self.error(msg, self.pos)
+        self.pos += 1
+        return c
+
+    def value(self):
+        """
+        Decode the next complete JSON value.
+
+        The window grows geometrically until the value fits,
+        so a value of size n is decoded in O(n) amortized time.
+        """
+        self.peek()
+        size = CHUNK_SIZE
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                # A value that runs to the end of the window may be
+                # truncated rather than malformed; read more first.
+                if self.fill(size):
+                    size *= 2
+                    continue
+                raise self.error(e.msg, e.pos)
+
+            if end == len(self.text) and isinstance(obj, (int, float)) and self.fill(size):
+                # A number ending at the window edge may continue.
+                continue
+
+            self.pos = end
+            return obj
+
+
+def iter_manifest(fp, streamed=("actions", "observers")):
+    """
+    Incrementally read a manifest from a text stream.
+
+    Yields:
+    - ("value", key, value) for each top-level member not in `streamed`
+    - ("begin", key, None) when a streamed array member starts
+    - ("item", key, element) for each element of a streamed array
+
+    A streamed member whose value is not an array is produced
+    as a single ("value", key, value) event.
+
+    Raises:
+    - json.JSONDecodeError on malformed input
+    - RootTypeError if the top-level value is not an object
+    """
+    buf = _Buffer(fp)
+
+    c = buf.peek()
+    if c == "\ufeff":
+        raise buf.error("Unexpected UTF-8 BOM (decode using utf-8-sig)", buf.pos)
+    if c != "{":
+        value = buf.value()
+        if buf.peek():
+            raise buf.error("Extra data", buf.pos)
+        raise RootTypeError(value)
+    buf.pos += 1
+
+    if buf.peek() == "}":
+        buf.pos += 1
+    else:
+        while True:
+            if buf.peek() != '"':
+                raise buf.error("Expecting property name enclosed in double quotes", buf.pos)
+            key = buf.value()
+            buf.expect(":", "Expecting ':' delimiter")
+
+            if key in streamed and buf.peek() == "[":
+                buf.pos += 1
+                yield ("begin", key, None)
+                if buf.peek() == "]":
+                    buf.pos += 1
+                else:
+                    while True:
+                        if not buf.peek():
+                            raise buf.error("Expecting value", buf.pos)
+                        yield ("item", key, buf.value())
+                        if buf.expect(",]", "Expecting ',' delimiter") == "]":
+                            break
+            else:
+                if not buf.peek():
+                    raise buf.error("Expecting value", buf.pos)
+                yield ("value", key, buf.value())
+
+            if buf.expect(",}", "Expecting ',' delimiter") == "}":
+                break
+
+    if buf.peek():
+        raise buf.error("Extra data", buf.pos)
@@ -0,0 +1,167 @@
+"""
+Module: Sharded Traversal
+
+Status: Normative
+Responsibility: Parallel dispatch of rules over one large SemanticContext
+
+This module runs a FusedTraversal (see engine.traversal) with the
+per-element phases split into shards evaluated on a process pool:
+
+- actions and observers, through on_action and on_observer;
+- quantities, through on_quantity (row by row).
+
+Whole-world rules (check() of rules without node callbacks, on_world
+and on_edge) and vectorized quantity callbacks run once, in the
+calling process, while the shards are evaluated.
+
+Workers are forked after the context is built and share it with
+the calling process copy-on-write; only shard bounds and violation
+records cross process boundaries. Where processes cannot be forked,
+the traversal runs sequentially.
+
+Shard results are delivered as they complete, in order. If
+delivering a violation raises (e.g. engine.report.VerdictDecided
+from a VerdictSink), shards not yet started are cancelled; only
+those already running are awaited.
+
+Normative Requirements:
+- Violations MUST be delivered in exactly the order of the
+  sequential traversal, so that reports are byte-identical.
+- Sharding MUST NOT mutate the context.
+
+This module introduces NO new semantics.
+"""
+
+import gc
+import os
+from itertools import islice
+
+from engine.quantity_store import build_columns
+
+
+# Contexts with fewer nodes are traversed sequentially
+PARALLEL_MIN_NODES = 100_000
+
+# Shards per worker, and the smallest shard
+SHARDS_PER_WORKER = 4
+MIN_SHARD_NODES = 10_000
+
+# (traversal, context) of the run being sharded, inherited by forked workers
+_shared = None
+
+
+def _shard_bounds(count: int, workers: int) -> list:
+    size = max(MIN_SHARD_NODES, -(-count // (workers * SHARDS_PER_WORKER)))
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+def _run_shard(task: tuple) -> list:
+    phase, start, stop = task
+    traversal, context = _shared
+    violations = []
+
+    if phase == "actions":
+        hooks = traversal.action_hooks
+        for name, action in islice(context.actions.items(), start, stop):
+            for hook in hooks:
+                hook(context, name, action, violations)
+    elif phase == "observers":
+        hooks = traversal.observer_hooks
+        for name, obs in islice(context.observers.items(), start, stop):
+            for hook in hooks:
+                hook(context, name, obs, violations)
+    else:
+        hooks = traversal.quantity_row_hooks if phase == "rows" else traversal.quantity_hooks
+        for key, q in islice(context.quantities.items(), start, stop):
+            for hook in hooks:
+                hook(context, key, q, violations)
+
+    return violations
+
+
+def fork_available() -> bool:
+    """
+    Whether worker processes can be forked on this platform.
+    """
+    import multiprocessing
+
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def run_sharded(traversal, context, violations=None, workers: int = None):
+    """
+    Walk the context like traversal.run(), evaluating per-element
+    phases on `workers` processes (default: one per CPU).
+
+    Small contexts, single workers and platforms without fork
+    are traversed sequentially.
+    """
+    global _shared
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    nodes = len(context.actions) + len(context.observers) + len(context.quantities)
+    if workers < 2 or nodes < PARALLEL_MIN_NODES or not fork_available():
+        return traversal.run(context, violations)
+
+    if violations is None:
+        violations = []
+
+    columns = traversal.quantity_hooks and traversal.use_columns(context)
+    phases = []
+    if traversal.action_hooks:
+        phases.append(("actions", len(context.actions)))
+    if traversal.observer_hooks:
+        phases.append(("observers", len(context.observers)))
+    if traversal.quantity_hooks:
+        if not columns:
+            phases.append(("quantities", len(context.quantities)))
+        elif traversal.quantity_row_hooks:
+            phases.append(("rows", len(context.quantities)))
+    tasks = [(phase, start, stop) for phase, count in phases for start, stop in _shard_bounds(count, workers)]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Frozen objects are never visited by the collector, so workers
+    # do not copy the shared context pages by collecting it
+    _shared = (traversal, context)
+    gc.freeze()
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)) or 1,
+                                 mp_context=multiprocessing.get_context("fork")) as pool:
+            futures = [pool.submit(_run_shard, task) for task in tasks]
+            try:
+                # Sequential order: whole-world rules, element phases, edges
+                for check_fn in traversal.world_checks:
+                    violations.extend(check_fn(context))
+                for hook in traversal.world_hooks:
+                    hook(context, violations)
+
+                column_violations = []
+                if columns:
+                    view = build_columns(context)
+                    for hook in traversal.quantity_column_hooks:
+                        hook(context, view, column_violations)
+
+                for (phase, _, _), future in zip(tasks, futures):
+                    if phase == "rows" and column_violations:
+                        violations.extend(column_violations)
+                        column_violations = []
+                    violations.extend(future.result())
+                violations.extend(column_violations)
+            except BaseException:
+                # The run is over (e.g. its verdict is decided): stop dispatching
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        gc.unfreeze()
+        _shared = None
+
+    hooks = traversal.edge_hooks
+    if hooks:
+        for edge in context.degradation_graph.edges:
+            for hook in hooks:
+                hook(context, edge, violations)
+
+    return violations
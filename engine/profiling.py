@@ -0,0 +1,170 @@
+"""
+Module: Run Profiling
+
+Status: Informative
+Responsibility: Per-phase and per-rule cost measurement
+
+A Profile records, for each named phase of a lint run and for each
+rule, the wall time, the number of calls and the peak memory
+allocated during a call (measured with tracemalloc):
+
+    profile = Profile()
+    with profile.phase("context"):
+        context = SemanticContext(manifest)
+    with profile.phase("rules"):
+        run_axiom_rules(context, profile=profile)
+    profile.close()
+    profile.as_dict()
+
+Rules are measured per callback invocation: a rule with node
+callbacks is called once per node (see engine.traversal). Phases
+may nest; a phase's peak includes that of the phases and rules
+measured within it.
+
+Profiling is opt-in. Without a Profile, no rule is wrapped and no
+allocation is traced. Memory tracing slows allocation-heavy code,
+so profiled timings are upper bounds of unprofiled ones.
+
+Normative Requirements:
+- Profiling MUST NOT alter violations or their order.
+
+This module introduces NO new semantics.
+"""
+
+import time
+import tracemalloc
+
+
+# Rule module attributes that are wrapped when profiling
+RULE_CALLBACKS = (
+    "check", "on_world", "on_action", "on_observer",
+    "on_quantity", "on_quantity_columns", "on_edge",
+)
+
+
+class _Entry:
+    __slots__ = ("seconds", "calls", "peak")
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+        self.peak = 0
+
+    def as_dict(self) -> dict:
+        return {"seconds": round(self.seconds, 6), "calls": self.calls, "peak_bytes": self.peak}
+
+
+class _Phase:
+    __slots__ = ("profile", "entry", "start")
+
+    def __init__(self, profile, entry: _Entry):
+        self.profile = profile
+        self.entry = entry
+
+    def __enter__(self):
+        self.start = self.profile._enter()
+
+    def __exit__(self, *exc):
+        self.profile._exit(self.entry, self.start)
+        return False
+
+
+class _ProfiledModule:
+    # Stand-in for a rule module whose callbacks are measured
+    pass
+
+
+class Profile:
+    """
+    Accumulated measurements of one run.
+
+    Fields:
+    - phases: phase name -> measurements, in order of first entry
+    - rules: rule module path -> measurements, in plan order
+    """
+    def __init__(self):
+        self.phases = {}
+        self.rules = {}
+        # Traced memory at entry, and highest peak seen since, per open measurement
+        self._stack = []
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+
+    def close(self):
+        """
+        Stop memory tracing if this profile started it.
+        """
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def _enter(self) -> float:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            outer = self._stack[-1]
+            outer[1] = max(outer[1], peak)
+        self._stack.append([current, current])
+        tracemalloc.reset_peak()
+        return time.perf_counter()
+
+    def _exit(self, entry: _Entry, start: float):
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        base, seen = self._stack.pop()
+        peak = max(peak, seen)
+        if self._stack:
+            outer = self._stack[-1]
+            outer[1] = max(outer[1], peak)
+        tracemalloc.reset_peak()
+
+        entry.seconds += elapsed
+        entry.calls += 1
+        entry.peak = max(entry.peak, peak - base)
+
+    def phase(self, name: str) -> _Phase:
+        """
+        Context manager measuring one entry into phase `name`.
+        """
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = _Entry()
+        return _Phase(self, entry)
+
+    def wrap(self, name: str, fn):
+        """
+        Return `fn` measured as (a callback of) rule `name`.
+        """
+        entry = self.rules.get(name)
+        if entry is None:
+            entry = self.rules[name] = _Entry()
+        enter, exit_ = self._enter, self._exit
+
+        def measured(*args):
+            start = enter()
+            try:
+                return fn(*args)
+            finally:
+                exit_(entry, start)
+
+        return measured
+
+    def wrap_module(self, name: str, module):
+        """
+        Return a stand-in for rule `module` whose callbacks are measured.
+        """
+        profiled = _ProfiledModule()
+        for attr in RULE_CALLBACKS:
+            fn = getattr(module, attr, None)
+            if fn is not None:
+                setattr(profiled, attr, self.wrap(name, fn))
+        return profiled
+
+    def as_dict(self) -> dict:
+        """
+        Return the measurements as a JSON-serializable document.
+        """
+        return {
+            "phases": {name: entry.as_dict() for name, entry in self.phases.items()},
+            "rules": {name: entry.as_dict() for name, entry in self.rules.items()}
+        }
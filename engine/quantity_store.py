@@ -0,0 +1,210 @@
+"""
+Module: Quantity Store
+
+Status: Normative
+Responsibility: Optional columnar representation of the quantity registry
+
+This module provides a column-oriented view of
+SemanticContext.quantities as parallel NumPy arrays, so that
+quantity rules can be evaluated as vectorized mask operations.
+
+Columns (one row per registry entry, in registry order):
+- keys: registry keys
+- value: value as float64 (NaN where not numeric)
+- value_unknown: value == "unknown"
+- uncertainty: uncertainty as float64 (NaN where not numeric)
+- uncertainty_numeric: uncertainty is an int or float
+- uncertainty_unknown: uncertainty == "unknown"
+- uncertainty_none: uncertainty is None
+- unit_id: int32 code into `units` (UNIT_NONE for None, UNIT_EMPTY for "");
+  `units` is available once unit_id has been accessed
+- provenance_present: bool(provenance)
+
+Rule modules MAY expose:
+
+- on_quantity_columns(context, columns, violations)
+
+which MUST produce exactly the violations of on_quantity
+over every row, emitting records only for offending rows.
+
+NumPy is an optional dependency. Without it, the columnar
+view is unavailable and rules run row by row.
+
+This module introduces NO new semantics.
+"""
+
+import math
+from functools import cached_property
+from operator import attrgetter
+
+
+# Minimum registry size for which the columnar view is used automatically
+COLUMNAR_MIN_QUANTITIES = 10_000
+
+_numpy = None
+
+
+def numpy_available() -> bool:
+    """
+    Whether NumPy can be imported. NumPy is imported on first call only.
+    """
+    global _numpy
+
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            _numpy = False
+        else:
+            _numpy = numpy
+    return _numpy is not False
+
+
+def _as_float(x) -> float:
+    if isinstance(x, (int, float)):
+        try:
+            return float(x)
+        except OverflowError:
+            return -math.inf if x < 0 else math.inf
+    return math.nan
+
+
+# isinstance(x, (int, float)) by exact type, for the types JSON decoding produces
+_NUMBER_TYPES = {
+    int: True, float: True, bool: True,
+    str: False, type(None): False, list: False, dict: False,
+}
+
+
+class QuantityColumns:
+    """
+    Columnar view of a quantity registry.
+
+    Each column is computed on first access and cached,
+    so a plan pays only for the columns its rules read.
+    See the module docstring for the column definitions.
+    """
+    UNIT_NONE = 0
+    UNIT_EMPTY = 1
+
+    def __init__(self, quantities: dict):
+        self.keys = list(quantities)
+        self._quantities = list(quantities.values())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _field(self, name: str) -> list:
+        return list(map(attrgetter(name), self._quantities))
+
+    def _objects(self, name: str):
+        array = _numpy.empty(len(self), dtype=object)
+        array[:] = self._field(name)
+        return array
+
+    def _numeric_mask(self, objects):
+        np = _numpy
+        numeric = list(map(_NUMBER_TYPES.get, map(type, objects)))
+        if None in numeric:
+            numeric = [isinstance(x, (int, float)) for x in objects]
+        return np.array(numeric, dtype=bool)
+
+    def _floats(self, objects, numeric):
+        np = _numpy
+        column = np.full(len(self), np.nan, dtype=np.float64)
+        selected = objects[numeric]
+        try:
+            column[numeric] = selected.astype(np.float64)
+        except OverflowError:
+            column[numeric] = np.fromiter(map(_as_float, selected), dtype=np.float64, count=len(selected))
+        return column
+
+    @cached_property
+    def _values(self):
+        return self._objects("value")
+
+    @cached_property
+    def _uncertainties(self):
+        return self._objects("uncertainty")
+
+    @cached_property
+    def value(self):
+        return self._floats(self._values, self._numeric_mask(self._values))
+
+    @cached_property
+    def value_unknown(self):
+        return self._values == "unknown"
+
+    @cached_property
+    def uncertainty(self):
+        return self._floats(self._uncertainties, self.uncertainty_numeric)
+
+    @cached_property
+    def uncertainty_numeric(self):
+        return self._numeric_mask(self._uncertainties)
+
+    @cached_property
+    def uncertainty_unknown(self):
+        return self._uncertainties == "unknown"
+
+    @cached_property
+    def uncertainty_none(self):
+        return self._uncertainties == None  # elementwise comparison
+
+    @cached_property
+    def provenance_present(self):
+        np = _numpy
+        return np.fromiter(map(bool, self._field("provenance")), dtype=bool, count=len(self))
+
+    @cached_property
+    def unit_id(self):
+        np = _numpy
+        units = self._field("unit")
+        self.units = [None, ""]
+        codes = {None: self.UNIT_NONE, "": self.UNIT_EMPTY}
+        try:
+            distinct = dict.fromkeys(units)
+        except TypeError:
+            # Unhashable declarations are kept as distinct units
+            unit_ids = []
+            for unit in units:
+                try:
+                    code = codes[unit]
+                except KeyError:
+                    code = codes[unit] = len(self.units)
+                    self.units.append(unit)
+                except TypeError:
+                    code = len(self.units)
+                    self.units.append(unit)
+                unit_ids.append(code)
+            return np.array(unit_ids, dtype=np.int32)
+
+        for unit in distinct:
+            if unit not in codes:
+                codes[unit] = len(self.units)
+                self.units.append(unit)
+        return np.fromiter(map(codes.__getitem__, units), dtype=np.int32, count=len(units))
+
+    def rows(self, mask) -> list:
+        """
+        Return the row indices selected by a boolean mask, ascending.
+        """
+        return _numpy.flatnonzero(mask).tolist()
+
+    def offending_keys(self, mask) -> list:
+        """
+        Return the registry keys of the rows selected by a boolean mask.
+        """
+        keys = self.keys
+        return [keys[row] for row in self.rows(mask)]
+
+
+def build_columns(context) -> QuantityColumns:
+    """
+    Build the columnar view of context.quantities.
+
+    Raises ImportError if NumPy is not installed.
+    """
+    if not numpy_available():
+        raise ImportError("The columnar quantity store requires NumPy.")
+    return QuantityColumns(context.quantities)
@@ -20,88 +20,307 @@ Supported outputs:
 - Machine-readable structured format (e.g., JSON)
 - Human-readable textual format
 
+Violation Records:
+Rules report violations as compact records, built with violation():
+
+    (severity, rule, axiom, path, message)
+
+Records are accumulated, counted and sorted as they are; the ABI
+violation objects are produced only when a report is serialized
+or materialized. Violation dicts with the ABI keys are accepted
+wherever records are.
+
+Verdict-Only Reporting:
+A VerdictSink stops the run (raising VerdictDecided) at the first
+violation that decides the verdict: a blocking or ERROR-level one.
+Its report carries that verdict, with the violations received up
+to that point. Such a report is ABI-valid but not complete, and
+MUST only be produced on explicit request.
+
 This module MUST NOT:
 - aggregate away violations,
 - suggest fixes,
 - or reinterpret rule severity.
 """
 
-def generate_report(violations: list[dict]) -> dict:
+import heapq
+import json
+import marshal
+
+
+BLOCKING_RULES = ("CLI-IO-ERROR", "CLI-JSON-ERROR", "SCHEMA-ERROR", "CONSTRUCTION-ERROR")
+
+# Distinct strings whose JSON encoding write_report keeps
+_ENCODED_MAX = 4096
+
+# Fields of a violation record, in record order
+FIELDS = ("severity", "rule", "axiom", "path", "message")
+
+# Number of buffered violations after which a sorted run is spilled to disk
+DEFAULT_SPILL_THRESHOLD = 1 << 20
+
+# Records per marshalled block of a spilled run
+_SPILL_BLOCK = 1 << 12
+
+
+def violation(rule: str, axiom, path: str, message: str, severity: str = "ERROR") -> tuple:
     """
-    Generate deterministic lint report according to interface.md ABI.
+    Build a violation record.
     """
-    # Count errors and warnings
-    error_count = 0
-    warning_count = 0
-    blocked_count = 0
-
-    # Determine blocked status
-    is_blocked = any(v.get('rule') in ['CLI-IO-ERROR', 'CLI-JSON-ERROR', 'CONSTRUCTION-ERROR'] for v in violations)
-    blocked_count = 1 if is_blocked else 0
-
-    # Count errors and warnings
-    for v in violations:
-        if v.get('severity', 'ERROR') == 'ERROR':
-            error_count += 1
-        elif v.get('severity') == 'WARNING':
-            warning_count += 1
-
-    # Determine verdict
-    if blocked_count == 1:
-        verdict = "BLOCKED"
-        compliance_status = "invalid"  # For backward compatibility
-    elif error_count > 0:
-        verdict = "NON-COMPLIANT"
-        compliance_status = "invalid"  # For backward compatibility
-    else:
-        verdict = "COMPLIANT"
-        compliance_status = "valid"  # For backward compatibility
-
-    # Build summary
-    summary = {
-        "errors": error_count,
-        "warnings": warning_count,
-        "blocked": blocked_count
-    }
+    return (severity, rule, axiom, path, message)
+
+
+def _record(v) -> tuple:
+    # Normalizes a violation dict; records are kept as they are
+    if type(v) is tuple:
+        return v
+    return (
+        v.get("severity", "ERROR"),
+        v.get("rule", "UNKNOWN-RULE"),
+        v.get("axiom", None),
+        v.get("path", "unknown"),
+        v.get("message", "Unknown violation")
+    )
+
+
+def as_dict(record: tuple) -> dict:
+    """
+    Return the ABI violation object of a record.
+    """
+    return dict(zip(FIELDS, record))
+
+
+def _sort_key(record: tuple) -> tuple:
+    # §3.2.1: severity_rank (ERROR=0, WARNING=1), then rule, path, message
+    return (0 if record[0] == "ERROR" else 1, record[1], record[3], record[4])
+
+
+class ViolationSink:
+    """
+    Accumulator for violation records.
+
+    Records are stored as they arrive (violation dicts are normalized
+    to records) and summary counters are maintained on the fly.
+    Once `spill_threshold` records are buffered, the buffer is sorted
+    and spilled to a temporary file as a run of marshalled blocks;
+    sorted_records() k-way merges all runs.
+
+    The sink accepts violations through append() and extend(),
+    so it can be passed wherever a violation list is expected.
+
+    Fields:
+    - errors: count of ERROR-level violations
+    - warnings: count of WARNING-level violations
+    - blocked: 1 if any blocking violation was added, else 0
+    """
+    def __init__(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD):
+        self.spill_threshold = spill_threshold
+        self.errors = 0
+        self.warnings = 0
+        self.blocked = 0
+        self._buffer = []
+        self._runs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, v):
+        record = v if type(v) is tuple else _record(v)
+        severity = record[0]
+
+        if severity == "ERROR":
+            self.errors += 1
+        elif severity == "WARNING":
+            self.warnings += 1
+        if record[1] in BLOCKING_RULES:
+            self.blocked = 1
+
+        self._buffer.append(record)
+        if len(self._buffer) >= self.spill_threshold:
+            self._spill()
+
+    def extend(self, violations):
+        for v in violations:
+            self.append(v)
+
+    def _spill(self):
+        # Imported on first spill only; most reports never spill
+        import tempfile
+
+        buffer = self._buffer
+        buffer.sort(key=_sort_key)
+        run = tempfile.TemporaryFile()
+        for start in range(0, len(buffer), _SPILL_BLOCK):
+            marshal.dump(buffer[start:start + _SPILL_BLOCK], run)
+        run.seek(0)
+        self._runs.append(run)
+        self._buffer = []
+
+    @property
+    def verdict(self) -> str:
+        if self.blocked == 1:
+            return "BLOCKED"
+        elif self.errors > 0:
+            return "NON-COMPLIANT"
+        else:
+            return "COMPLIANT"
 
-    # Ensure all violations have required fields
-    normalized_violations = []
-    for v in violations:
-        normalized_v = {
-            "severity": v.get("severity", "ERROR"),
-            "rule": v.get("rule", "UNKNOWN-RULE"),
-            "axiom": v.get("axiom", None),
-            "path": v.get("path", "unknown"),
-            "message": v.get("message", "Unknown violation")
+    def summary(self) -> dict:
+        return {
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "blocked": self.blocked
         }
-        normalized_violations.append(normalized_v)
-
-    # Sort violations according to §3.2.1: severity_rank (ERROR=0, WARNING=1), then rule, path, message
-    normalized_violations.sort(key=lambda v: (
-        0 if v["severity"] == "ERROR" else 1,  # severity_rank
-        v["rule"],                              # rule (lexicographic ascending)
-        v["path"],                              # path (lexicographic ascending)
-        v["message"]                            # message (lexicographic ascending)
-    ))
-
-    # Ensure verdict-summary consistency according to §6.1
-    if verdict == "BLOCKED":
-        summary["blocked"] = 1
-    else:
-        summary["blocked"] = 0
-
-    # Fix compliance mapping according to §4.1.1
-    if verdict == "COMPLIANT":
-        compliance_status = "valid"
-    else:  # NON-COMPLIANT or BLOCKED
-        compliance_status = "invalid"
+
+    def sorted_records(self):
+        """
+        Return an iterable of the violation records in §3.2.1 order.
+
+        May be consumed only once.
+        """
+        if self._runs:
+            if self._buffer:
+                self._spill()
+            return heapq.merge(*map(_read_run, self._runs), key=_sort_key)
+        self._buffer.sort(key=_sort_key)
+        return self._buffer
+
+    def sorted_violations(self):
+        """
+        Yield ABI violation dicts in §3.2.1 order.
+
+        May be consumed only once.
+        """
+        return map(as_dict, self.sorted_records())
+
+    def close(self):
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._buffer = []
+
+
+class VerdictDecided(Exception):
+    """
+    Raised by a VerdictSink once the verdict is decided.
+    """
+
+
+class VerdictSink(ViolationSink):
+    """
+    A ViolationSink for verdict-only runs.
+
+    Raises VerdictDecided from append() and extend() on the first
+    blocking or ERROR-level violation, after recording it. Callers
+    catch it and report the sink as it stands.
+    """
+    def append(self, v):
+        ViolationSink.append(self, v)
+        if self.errors or self.blocked:
+            raise VerdictDecided()
+
+
+def _read_run(run):
+    while True:
+        try:
+            block = marshal.load(run)
+        except EOFError:
+            return
+        yield from block
+
+
+def generate_report(violations: list) -> dict:
+    """
+    Generate deterministic lint report according to interface.md ABI.
+    """
+    with ViolationSink() as sink:
+        sink.extend(violations)
+        return build_report(sink)
+
+
+def build_report(sink: ViolationSink) -> dict:
+    """
+    Materialize the report of a sink as a dict.
+    """
+    verdict = sink.verdict
 
     # Build final report
     report = {
         "verdict": verdict,
-        "summary": summary,
-        "violations": normalized_violations,
-        "compliance": compliance_status  # For backward compatibility
+        "summary": sink.summary(),
+        "violations": list(sink.sorted_violations()),
+        # For backward compatibility, §4.1.1
+        "compliance": "valid" if verdict == "COMPLIANT" else "invalid"
     }
 
     return report
+
+
+class _Encodings(dict):
+    # JSON encoding of a field value, kept for up to _ENCODED_MAX strings.
+    # Numbers are never kept: equal numbers can encode differently.
+    __slots__ = ()
+
+    def __missing__(self, value) -> str:
+        text = json.dumps(value)
+        if (value is None or type(value) is str) and len(self) < _ENCODED_MAX:
+            self[value] = text
+        return text
+
+
+def write_report(sink: ViolationSink, fp):
+    """
+    Serialize the report of a sink to a text stream.
+
+    Output is byte-identical to json.dumps(build_report(sink), indent=2),
+    but violations are written as they are merged and never
+    materialized as a list.
+    """
+    verdict = sink.verdict
+    summary = sink.summary()
+    dumps = json.dumps
+
+    fp.write(
+        "{\n"
+        f'  "verdict": {dumps(verdict)},\n'
+        '  "summary": {\n'
+        f'    "errors": {summary["errors"]},\n'
+        f'    "warnings": {summary["warnings"]},\n'
+        f'    "blocked": {summary["blocked"]}\n'
+        "  },\n"
+        '  "violations": ['
+    )
+
+    # Severities, rule and axiom IDs and most messages repeat
+    # across records; their encodings are kept
+    encode = _Encodings()
+
+    separator = "\n"
+    for severity, rule, axiom, path, message in sink.sorted_records():
+        try:
+            severity, rule, axiom, message = encode[severity], encode[rule], encode[axiom], encode[message]
+        except TypeError:
+            # Unhashable field values are encoded as they come
+            severity, rule, axiom, message = dumps(severity), dumps(rule), dumps(axiom), dumps(message)
+        fp.write(
+            f"{separator}    {{\n"
+            f'      "severity": {severity},\n'
+            f'      "rule": {rule},\n'
+            f'      "axiom": {axiom},\n'
+            f'      "path": {dumps(path)},\n'
+            f'      "message": {message}\n'
+            "    }"
+        )
+        separator = ",\n"
+    if separator != "\n":
+        fp.write("\n  ")
+
+    compliance = "valid" if verdict == "COMPLIANT" else "invalid"
+    fp.write(
+        "],\n"
+        f'  "compliance": {dumps(compliance)}\n'
+        "}"
+    )
@@ -0,0 +1,192 @@
+"""
+Module: Rule Plan
+
+Status: Normative
+Responsibility: Resolution and freezing of the rule execution order
+
+A rule plan is the ordered, immutable list of rule check callables
+that a lint run executes.
+
+Compilation resolves every rule module exactly once.
+Executing a compiled plan performs NO module lookups and walks
+the context in a single fused traversal (see engine.traversal).
+
+Applicability:
+Rule modules MAY declare the scope in which they can produce
+violations:
+
+- PROFILES: tuple of profiles the rule applies to
+  (absent: the rule applies to every profile)
+- SECTIONS: tuple of context sections the rule reads, drawn from
+  world, ontology, actions, observers, quantities, degradation
+  (empty: the rule inspects nothing and can never fire)
+
+At compile time the plan precomputes, for each of L0–L3,
+the minimal ordered rule set and executes only that set.
+A rule MUST NOT be excluded unless its declaration guarantees
+that it produces no violations for the profile.
+
+Normative Requirements:
+- Rule order MUST follow the authoritative mapping order.
+- The axiom pack MUST always be included.
+- A compiled plan MUST NOT be mutated.
+- Compilation MUST be explicitly invoked; importing this
+  module MUST NOT resolve any rule.
+
+This module introduces NO new semantics.
+"""
+
+import importlib
+import os
+from functools import cached_property
+
+from engine.traversal import FusedTraversal
+from mapping.axiom_mapping import RULE_PACKS
+
+
+DEFAULT_PACKS = ("axioms",)
+
+KNOWN_PROFILES = ("L0", "L1", "L2", "L3")
+
+
+class CompiledRule:
+    """
+    A resolved rule entry.
+
+    Fields:
+    - pack: rule pack name (e.g. "axioms")
+    - key: mapping key within the pack (e.g. "S12")
+    - module_path: dotted path of the rule module
+    - module: resolved rule module
+    - check: resolved check(context) callable
+    - profiles: declared profiles, or None for all profiles
+    - sections: declared context sections, or None if undeclared
+    """
+    def __init__(self, pack: str, key: str, module_path: str, module):
+        self.pack = pack
+        self.key = key
+        self.module_path = module_path
+        self.module = module
+        self.check = getattr(module, "check")
+        self.profiles = getattr(module, "PROFILES", None)
+        self.sections = getattr(module, "SECTIONS", None)
+
+    def applies_to(self, profile: str) -> bool:
+        """
+        Whether the rule can produce violations under `profile`.
+        """
+        if self.sections == ():
+            return False
+        return self.profiles is None or profile in self.profiles
+
+
+class RulePlan:
+    """
+    Frozen, ordered sequence of compiled rules.
+
+    Fields:
+    - packs: rule packs included, in execution order
+    - rules: compiled rules, in execution order
+    - columnar: columnar quantity evaluation mode (see engine.traversal)
+    - fingerprint: digest identifying the rule set (see below)
+    """
+    def __init__(self, packs: tuple, rules: tuple, columnar=None):
+        self.packs = packs
+        self.rules = rules
+        self.columnar = columnar
+
+        # Applicability index: profile -> (rules, traversal).
+        # Undeclared profiles only admit rules without a profile restriction.
+        self._index = {}
+        for profile in KNOWN_PROFILES + (None,):
+            selected = tuple(rule for rule in rules if rule.applies_to(profile))
+            traversal = FusedTraversal((r.module for r in selected), columnar)
+            self._index[profile] = (selected, traversal)
+
+    def _entry(self, profile) -> tuple:
+        # Undeclared, unknown and non-string (possibly unhashable) profiles
+        if type(profile) is not str:
+            return self._index[None]
+        return self._index.get(profile, self._index[None])
+
+    def rules_for(self, profile: str) -> tuple:
+        """
+        Return the minimal ordered rule set executed for `profile`.
+        """
+        return self._entry(profile)[0]
+
+    def run(self, context, violations=None, workers: int = None, profile=None):
+        """
+        Execute every applicable compiled rule against the context.
+
+        Violations are appended to `violations` (a list or a
+        ViolationSink) if given; otherwise a new list is returned.
+
+        With `workers` > 1, per-element rules of large contexts are
+        evaluated on that many processes (see engine.parallel).
+
+        With a `profile` (see engine.profiling), every rule is
+        measured; profiled runs are sequential.
+        """
+        selected, traversal = self._entry(context.profile)
+        if profile is not None:
+            modules = (profile.wrap_module(rule.module_path, rule.module) for rule in selected)
+            return FusedTraversal(modules, self.columnar).run(context, violations)
+        if workers is not None and workers > 1:
+            from engine.parallel import run_sharded
+            return run_sharded(traversal, context, violations, workers)
+        return traversal.run(context, violations)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Hex digest of the packs, the rule order, every rule's source and
+        the source of the engine package, which builds the contexts rules
+        read and the reports they feed.
+
+        Two plans with equal fingerprints produce equal reports.
+        Computed on first access.
+        """
+        import hashlib
+
+        digest = hashlib.sha256()
+        digest.update(repr(self.packs).encode("utf-8"))
+        engine_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(engine_dir)):
+            if name.endswith(".py"):
+                with open(os.path.join(engine_dir, name), "rb") as f:
+                    digest.update(b"\0" + name.encode("utf-8") + b"\0" + f.read())
+        for rule in self.rules:
+            digest.update(b"\0" + rule.module_path.encode("utf-8") + b"\0")
+            origin = getattr(rule.module, "__file__", None)
+            if origin is not None:
+                with open(origin, "rb") as f:
+                    digest.update(f.read())
+
+        return digest.hexdigest()
+
+
+def compile_plan(packs=DEFAULT_PACKS, columnar=None) -> RulePlan:
+    """
+    Resolve the check callable of every rule in the requested packs.
+
+    Packs are executed in mapping order: axioms, features,
+    consistency, profiles. Unknown pack names are rejected.
+
+    `columnar` selects vectorized quantity evaluation:
+    True (always; requires NumPy), False (never),
+    or None (automatic for large registries).
+    """
+    unknown = [p for p in packs if p not in RULE_PACKS]
+    if unknown:
+        raise ValueError(f"Unknown rule pack(s): {', '.join(unknown)}")
+
+    selected = tuple(p for p in RULE_PACKS if p == "axioms" or p in packs)
+
+    rules = []
+    for pack in selected:
+        for key, module_path in RULE_PACKS[pack].items():
+            module = importlib.import_module(module_path)
+            rules.append(CompiledRule(pack, key, module_path, module))
+
+    return RulePlan(selected, tuple(rules), columnar)
@@ -5,18 +5,261 @@ Status: Normative
 Responsibility: Structural validation of WorldSeed manifests
 
 This module validates a manifest against the authoritative
-WorldSeed JSON Schema.
+WorldSeed JSON Schema of its declared version.
+
+Each supported schema is compiled once into specialized Python
+code (see engine.schema_compiler) and kept per process. Compiling
+takes milliseconds; compiled code is also cached on disk only when
+WORLDSEED_LINT_SCHEMA_CACHE names a directory, keyed by the schema
+version, the exact schema bytes, the compiler version and the
+interpreter. Code loaded from that directory is executed: it MUST
+only be writable by the user running the linter.
 
 Normative Requirements:
 - MUST validate against the declared schema version.
 - MUST reject manifests that fail schema validation.
+- MUST report every schema error with its manifest field path.
 - MUST NOT perform semantic checks.
 - MUST NOT infer or repair missing fields.
 
 Schema validity MUST NOT be interpreted as WorldSeed compliance.
 """
 
-import jsonschema
+import binascii
+import json
+import marshal
+import os
+import sys
+
+from engine.report import violation
+from engine.schema_compiler import COMPILER_VERSION, render_path
+
+
+SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "schemas")
+
+# Supported specification versions. Paths are never derived
+# from the manifest itself.
+SCHEMA_FILES = {
+    "1.0.0": "worldseed-1.0.0.json",
+}
+
+SCHEMA_RULE = "SCHEMA-ERROR"
+
+# Compiled validator namespaces, per specification version
+_validators = {}
+
+
+def schema_cache_dir():
+    """
+    Directory of compiled schema code: WORLDSEED_LINT_SCHEMA_CACHE,
+    or None (no disk cache) if it is unset or empty.
+    """
+    return os.environ.get("WORLDSEED_LINT_SCHEMA_CACHE") or None
+
+
+def schema_digest() -> str:
+    """
+    Content hash of every supported schema, for keys of derived results.
+    """
+    import hashlib
+
+    h = hashlib.sha256()
+    for version in sorted(SCHEMA_FILES):
+        with open(os.path.join(SCHEMA_DIR, SCHEMA_FILES[version]), "rb") as f:
+            h.update(version.encode("utf-8") + b"\0" + f.read() + b"\0")
+    return h.hexdigest()
+
+
+def _compile(name: str, source: bytes):
+    from engine.schema_compiler import generate
+
+    return compile(generate(json.loads(source)), f"<schema {name}>", "exec")
+
+
+def _compiled_code(version: str, name: str, source: bytes):
+    directory = schema_cache_dir()
+    if directory is None:
+        return _compile(name, source)
+
+    tag = sys.implementation.cache_tag or sys.implementation.name
+    path = os.path.join(directory, f"{version}-{binascii.crc32(source):08x}-c{COMPILER_VERSION}.{tag}")
+
+    try:
+        with open(path, "rb") as f:
+            stored, code = marshal.loads(f.read())
+        # The checksum only names the file; the schema bytes decide
+        if stored == source:
+            return code
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    code = _compile(name, source)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps((source, code)))
+        os.replace(tmp, path)
+    except OSError:
+        # The cache only saves compilation time
+        pass
+    return code
+
+
+def compiled_validator(version):
+    """
+    Return the compiled validator namespace for a specification
+    version, or None if the version is not supported.
+
+    The namespace provides validate(instance) and ITEMS
+    (see engine.schema_compiler).
+    """
+    if type(version) is not str or version not in SCHEMA_FILES:
+        return None
+
+    validator = _validators.get(version)
+    if validator is None:
+        name = SCHEMA_FILES[version]
+        with open(os.path.join(SCHEMA_DIR, name), "rb") as f:
+            source = f.read()
+        validator = {"__name__": f"worldseed_schema_{version.replace('.', '_')}"}
+        exec(_compiled_code(version, name, source), validator)
+        _validators[version] = validator
+    return validator
+
+
+def _violation(path: str, message: str) -> tuple:
+    return violation(rule=SCHEMA_RULE, axiom=None, path=path, message=message)
+
+
+def _check(manifest: dict, extra=()) -> list:
+    if "version" not in manifest:
+        return [_violation("version", "'version' is a required property")]
+
+    version = manifest["version"]
+    validator = compiled_validator(version)
+    if validator is None:
+        return [_violation("version", f"Unsupported specification version: {version!r}")]
+
+    errors = validator["validate"](manifest)
+    errors.extend(extra)
+    return [_violation(render_path(path), message) for path, message in errors]
+
+
+def root_type_violation(value) -> tuple:
+    """
+    SCHEMA-ERROR violation record for a manifest whose top-level value
+    is not a JSON object, as every supported schema requires.
+    """
+    # Arrays are not echoed, as in compiled validator messages
+    shown = "[...]" if type(value) is list else repr(value)
+    return _violation("manifest", f"{shown} is not of type 'object'")
+
+
+def check_schema(manifest) -> list:
+    """
+    Validate a parsed manifest against the schema of its declared version.
+
+    Returns one SCHEMA-ERROR violation record per schema error.
+    A manifest that is not a JSON object declares no version; it is
+    reported as a single SCHEMA-ERROR at the root.
+    """
+    if not isinstance(manifest, dict):
+        return [root_type_violation(manifest)]
+    return _check(manifest)
+
+
+class StreamSchemaCheck:
+    """
+    Schema check fed with the events of engine.manifest_stream.iter_manifest.
+
+    Streamed elements are validated on arrival and then dropped;
+    the rest of the manifest is validated once complete. Elements
+    that arrive before the version they are validated against is
+    known leave the check incomplete, and another pass is needed
+    (see check_stream).
+
+    Fields:
+    - header: top-level members, with streamed arrays left empty
+    - complete: whether every streamed element was validated against
+      the final declared version
+    """
+    def __init__(self, version=None):
+        self.header = {}
+        self._forced = version
+        self._items = {}
+        self._counts = {}
+        self._seen = False
+        self._used = None
+        self._deferred = False
+
+    def __call__(self, event: str, key: str, value):
+        if event == "item":
+            self._seen = True
+            version = self._forced if self._forced is not None else self.header.get("version")
+            validator = compiled_validator(version)
+            if validator is None:
+                self._deferred = True
+                return
+            if self._used is None:
+                self._used = version
+            elif self._used != version:
+                self._deferred = True
+
+            i = self._counts[key]
+            self._counts[key] = i + 1
+            fn = validator["ITEMS"].get(key)
+            if fn is not None:
+                fn(value, ((None, key), i), self._items[key])
+        elif event == "begin":
+            # A repeated member replaces the earlier one, as in json.load
+            self.header[key] = []
+            self._items[key] = []
+            self._counts[key] = 0
+        else:
+            self.header[key] = value
+            self._items.pop(key, None)
+
+    @property
+    def complete(self) -> bool:
+        if not self._seen:
+            return True
+        version = self.header.get("version")
+        if compiled_validator(version) is None:
+            # Only the version itself is reported
+            return True
+        return not self._deferred and self._used == version
+
+    def violations(self) -> list:
+        extra = [error for errors in self._items.values() for error in errors]
+        return _check(self.header, extra)
+
+
+def check_stream(fp, first: StreamSchemaCheck = None) -> list:
+    """
+    Validate a manifest text stream positioned at its start.
+
+    `first` MAY be a check already fed one complete pass over `fp`.
+    At most two passes are read from `fp`.
+
+    Raises the errors of engine.manifest_stream.iter_manifest.
+    """
+    from engine.manifest_stream import iter_manifest
+
+    check = first
+    if check is None:
+        check = StreamSchemaCheck()
+        for event in iter_manifest(fp):
+            check(*event)
+
+    if not check.complete:
+        fp.seek(0)
+        check = StreamSchemaCheck(version=check.header.get("version"))
+        for event in iter_manifest(fp):
+            check(*event)
+
+    return check.violations()
+
 
 def validate_schema(manifest: dict, schema: dict):
     """
@@ -25,4 +268,7 @@ def validate_schema(manifest: dict, schema: dict):
     This function performs STRUCTURAL validation only.
     Semantic validity is explicitly out of scope.
     """
+    # jsonschema is imported on first use only (CLI startup budget)
+    import jsonschema
+
     jsonschema.validate(instance=manifest, schema=schema)
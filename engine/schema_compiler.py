@@ -0,0 +1,305 @@
+"""
+Module: Schema Compiler
+
+Status: Normative
+Responsibility: Translation of a JSON Schema into specialized Python code
+
+The compiler emits one Python function per schema node. Each function
+checks exactly the keywords present on its node, with the JSON type
+tests inlined, so validation performs no schema interpretation.
+
+Supported keywords (any other keyword is rejected at compile time):
+- type, enum, const
+- required, properties, additionalProperties
+- items
+- $ref (local references into $defs or definitions)
+- annotations: $schema, $id, $comment, title, description, $defs, definitions
+
+The generated module exposes:
+
+- validate(instance) -> list of (path, message)
+- ITEMS: top-level property -> item function(v, p, e), for array
+  properties, so that streamed elements can be validated one by one
+
+where `path` is a linked tuple (parent, key) rendered by render_path().
+
+Normative Requirements:
+- Every error MUST be reported, each with the path of its instance.
+- Results MUST equal those of a conforming JSON Schema validator
+  for the supported keywords.
+- Unsupported keywords MUST NOT be silently ignored.
+
+This module introduces NO new semantics.
+"""
+
+import json
+
+
+# Bumped whenever the generated code changes for a given schema
+COMPILER_VERSION = 1
+
+ANNOTATIONS = frozenset({"$schema", "$id", "$comment", "title", "description", "$defs", "definitions"})
+KEYWORDS = frozenset({"type", "enum", "const", "required", "properties", "additionalProperties", "items", "$ref"})
+
+# Inline type tests on `v` and its exact type `t`.
+# JSON decoding yields exactly dict, list, str, int, float, bool and None.
+_TYPE_TESTS = {
+    "object": "t is dict",
+    "array": "t is list",
+    "string": "t is str",
+    "boolean": "t is bool",
+    "null": "v is None",
+    "number": "t is int or t is float",
+    "integer": "t is int or (t is float and v.is_integer())",
+}
+
+_RUNTIME = '''
+def _equal(a, b):
+    # JSON equality: booleans are distinct from numbers
+    if type(a) is bool or type(b) is bool:
+        return type(a) is type(b) and a == b
+    if type(a) is list and type(b) is list:
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    if type(a) is dict and type(b) is dict:
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _missing(name):
+    return f"{name!r} is a required property"
+
+
+def _show(v):
+    # Containers are not echoed: a rejected array may hold the whole world
+    if type(v) is dict:
+        return "{...}"
+    if type(v) is list:
+        return "[...]"
+    return repr(v)
+'''
+
+
+class SchemaCompileError(ValueError):
+    """
+    Raised for schemas outside the supported subset.
+    """
+
+
+def render_path(path) -> str:
+    """
+    Render a linked path tuple as a manifest field path,
+    e.g. actions[0].parameters.dx; the root renders as "manifest".
+    """
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+
+    out = []
+    for key in reversed(keys):
+        if type(key) is int:
+            out.append(f"[{key}]")
+        else:
+            out.append(f".{key}" if out else key)
+    return "".join(out) or "manifest"
+
+
+class _Generator:
+    def __init__(self, root: dict):
+        self.root = root
+        self.constants = []
+        self.functions = []
+        self.names = {}
+
+    def constant(self, value, python: str = None) -> str:
+        name = f"_c{len(self.constants)}"
+        if python is None:
+            python = f"_json.loads({json.dumps(value)!r})"
+        self.constants.append(f"{name} = {python}")
+        return name
+
+    def resolve(self, ref: str) -> dict:
+        if not ref.startswith("#/"):
+            raise SchemaCompileError(f"Only local references are supported: {ref}")
+        node = self.root
+        for part in ref[2:].split("/"):
+            part = part.replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[part]
+            except (KeyError, TypeError):
+                raise SchemaCompileError(f"Unresolvable reference: {ref}")
+        return node
+
+    def function(self, node):
+        """
+        Return the name of the function validating `node`,
+        or None if the node accepts every instance.
+        """
+        if node is True or node == {}:
+            return None
+        if node is False:
+            if "_reject" not in self.names:
+                self.names["_reject"] = "_reject"
+                self.functions.append(
+                    "def _reject(v, p, e):\n"
+                    "    e.append((p, f\"False schema does not allow {_show(v)}\"))"
+                )
+            return "_reject"
+        if not isinstance(node, dict):
+            raise SchemaCompileError(f"Invalid schema node: {node!r}")
+
+        key = id(node)
+        if key in self.names:
+            return self.names[key]
+
+        unknown = set(node) - KEYWORDS - ANNOTATIONS
+        if unknown:
+            raise SchemaCompileError(f"Unsupported schema keyword(s): {', '.join(sorted(unknown))}")
+
+        if "$ref" in node and not (set(node) & KEYWORDS) - {"$ref"}:
+            # A bare reference validates exactly as its target
+            self.names[key] = None
+            target = self.names[key] = self.function(self.resolve(node["$ref"]))
+            return target
+
+        name = self.names[key] = f"_v{len(self.names)}"
+        # Reserve the slot first: recursive references resolve to `name`
+        slot = len(self.functions)
+        self.functions.append(None)
+        self.functions[slot] = "\n".join(self.body(name, node))
+        return name
+
+    def body(self, name: str, node: dict) -> list:
+        lines = [f"def {name}(v, p, e):"]
+        emit = lines.append
+
+        if "$ref" in node:
+            target = self.function(self.resolve(node["$ref"]))
+            if target is not None:
+                emit(f"    {target}(v, p, e)")
+
+        emit("    t = type(v)")
+
+        types = node.get("type")
+        known_object = False
+        if types is not None:
+            types = [types] if isinstance(types, str) else list(types)
+            unknown = [t for t in types if t not in _TYPE_TESTS]
+            if unknown:
+                raise SchemaCompileError(f"Unknown type(s): {', '.join(unknown)}")
+            test = " or ".join(f"({_TYPE_TESTS[t]})" for t in types)
+            described = repr(types[0]) if len(types) == 1 else repr(types)
+            emit(f"    if not ({test}):")
+            emit(f"        e.append((p, f\"{{_show(v)}} is not of type {described}\"))")
+            emit(f"        return")
+            known_object = types == ["object"]
+
+        if "enum" in node:
+            members = node["enum"]
+            if not isinstance(members, list):
+                raise SchemaCompileError("enum MUST be an array")
+            if all(type(m) is str for m in members):
+                c = self.constant(None, repr(frozenset(members)))
+                emit(f"    if t is not str or v not in {c}:")
+            else:
+                c = self.constant(members)
+                emit(f"    if not any(_equal(v, m) for m in {c}):")
+            tail = self.constant(None, repr(f" is not one of {members!r}"))
+            emit(f"        e.append((p, _show(v) + {tail}))")
+
+        if "const" in node:
+            c = self.constant(node["const"])
+            emit(f"    if not _equal(v, {c}):")
+            emit(f"        e.append((p, f\"{{{c}!r}} was expected\"))")
+
+        object_lines = self.object_checks(node)
+        if object_lines:
+            if known_object:
+                lines.extend("    " + line for line in object_lines)
+            else:
+                emit("    if t is dict:")
+                lines.extend("        " + line for line in object_lines)
+
+        if "items" in node:
+            item = self.function(node["items"])
+            if item is not None:
+                indent = "    "
+                if types != ["array"]:
+                    emit("    if t is list:")
+                    indent = "        "
+                emit(f"{indent}for i, x in enumerate(v):")
+                emit(f"{indent}    {item}(x, (p, i), e)")
+
+        return lines
+
+    def object_checks(self, node: dict) -> list:
+        lines = []
+        emit = lines.append
+
+        required = node.get("required", [])
+        for prop in required:
+            emit(f"if {prop!r} not in v:")
+            emit(f"    e.append(((p, {prop!r}), _missing({prop!r})))")
+
+        properties = node.get("properties", {})
+        for prop, sub in properties.items():
+            fn = self.function(sub)
+            if fn is None:
+                continue
+            emit(f"x = v.get({prop!r}, _MISSING)")
+            emit(f"if x is not _MISSING:")
+            emit(f"    {fn}(x, (p, {prop!r}), e)")
+
+        if "additionalProperties" in node:
+            extra = node["additionalProperties"]
+            known = self.constant(None, repr(frozenset(properties)))
+            if extra is False:
+                emit(f"for k in v:")
+                emit(f"    if k not in {known}:")
+                emit(f"        e.append(((p, k), f\"Additional properties are not allowed ({{k!r}} was unexpected)\"))")
+            else:
+                fn = self.function(extra)
+                if fn is not None:
+                    emit(f"for k, x in v.items():")
+                    if properties:
+                        emit(f"    if k not in {known}:")
+                        emit(f"        {fn}(x, (p, k), e)")
+                    else:
+                        emit(f"    {fn}(x, (p, k), e)")
+
+        return lines
+
+    def items(self) -> dict:
+        items = {}
+        root = self.root
+        if isinstance(root, dict):
+            for prop, sub in root.get("properties", {}).items():
+                while isinstance(sub, dict) and "$ref" in sub and "items" not in sub:
+                    sub = self.resolve(sub["$ref"])
+                if isinstance(sub, dict) and "items" in sub:
+                    fn = self.function(sub["items"])
+                    if fn is not None:
+                        items[prop] = fn
+        return items
+
+    def module(self) -> str:
+        entry = self.function(self.root)
+        call = f"    {entry}(instance, None, e)\n" if entry is not None else ""
+        items = ", ".join(f"{prop!r}: {fn}" for prop, fn in self.items().items())
+        return "\n\n".join([
+            "import json as _json\n\n_MISSING = object()",
+            _RUNTIME.strip(),
+            "\n".join(self.constants),
+            *self.functions,
+            f"def validate(instance):\n    e = []\n{call}    return e",
+            f"ITEMS = {{{items}}}\n",
+        ])
+
+
+def generate(schema: dict) -> str:
+    """
+    Return the Python source of a validator module for `schema`.
+
+    Raises SchemaCompileError for unsupported schemas.
+    """
+    return _Generator(schema).module()
@@ -58,16 +58,46 @@ This module defines:
 
 Violation of any invariant defined herein constitutes
 an ERROR-level WorldSeed Lint violation.
+
+────────────────────────────────────────────────────────────
+IV. Representation
+────────────────────────────────────────────────────────────
+
+Entity records are slotted and carry no per-instance __dict__.
+Unit and provenance strings are interned, so repeated declarations
+share a single string object. Names are interned in the context's
+symbol table (see engine.symbols).
+
+Entities do not store their own manifest paths. Quantities are
+registered under structured paths of symbol ids, rendered to text
+only when a violation reports them.
 """
 
-from typing import Dict, Set, Optional, Union, Literal
+from __future__ import annotations
+
+import sys
+
+from engine.degradation_graph import DegradationGraph
+from engine.symbols import ACTION_PARAMETER, OBSERVER_NOISE, SymbolTable
+
+# Annotations are not evaluated at runtime; typing is imported
+# only by type checkers, keeping it off the CLI startup path.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Set, Optional, Union, Literal
 
 
 # ────────────────────────────────────────────────────────────
 # Atomic Types
 # ────────────────────────────────────────────────────────────
 
-Unknown = Literal["unknown"]
+if TYPE_CHECKING:
+    Unknown = Literal["unknown"]
+
+
+def _intern(value):
+    # Interning is representation-only: non-string values are kept as declared
+    return sys.intern(value) if type(value) is str else value
 
 
 # ────────────────────────────────────────────────────────────
@@ -91,20 +121,19 @@ class Quantity:
     - uncertainty == 0 is forbidden for measured quantities.
     - "unknown" MUST be explicit, never implicit.
     """
+    __slots__ = ("value", "unit", "uncertainty", "provenance")
+
     def __init__(
         self,
         value: Union[float, Unknown],
         unit: str,
         uncertainty: Union[float, Unknown],
-        provenance: str,
-        *,
-        _path: str
+        provenance: str
     ):
         self.value = value
-        self.unit = unit
+        self.unit = _intern(unit)
         self.uncertainty = uncertainty
-        self.provenance = provenance
-        self._path = _path
+        self.provenance = _intern(provenance)
 
 
 # ────────────────────────────────────────────────────────────
@@ -123,6 +152,8 @@ class WorldIdentity:
     - id MUST be non-empty.
     - id MUST be immutable within a semantic context.
     """
+    __slots__ = ("id", "description")
+
     def __init__(self, id: str, description: Optional[str]):
         self.id = id
         self.description = description
@@ -143,6 +174,8 @@ class Ontology:
     - All referenced state dimensions MUST belong to entities.
     - Ontology MUST NOT depend on observers or observations.
     """
+    __slots__ = ("entities",)
+
     def __init__(self, entities: Set[str]):
         self.entities = entities
 
@@ -165,6 +198,8 @@ class Action:
     - State change MUST NOT occur outside declared actions.
     - If stochastic is False, repeated execution MUST be equivalent.
     """
+    __slots__ = ("name", "parameters", "stochastic")
+
     def __init__(
         self,
         name: str,
@@ -191,6 +226,8 @@ class Boundary:
     - Boundary MUST define limits on distinguishability.
     - Any inference outside the boundary is invalid.
     """
+    __slots__ = ("description",)
+
     def __init__(self, description: str):
         self.description = description
 
@@ -215,6 +252,8 @@ class Observer:
     - Boundary MUST be declared.
     - Noise uncertainty MUST NOT be implicit.
     """
+    __slots__ = ("name", "operator", "boundary", "noise")
+
     def __init__(
         self,
         name: str,
@@ -232,6 +271,8 @@ class Observer:
 # Degradation Graph
 # ────────────────────────────────────────────────────────────
 
+# The graph itself (DegradationGraph) is defined in engine.degradation_graph.
+
 class DegradationEdge:
     """
     Directed degradation edge.
@@ -240,45 +281,38 @@ class DegradationEdge:
     - source: source representation
     - target: target representation
     - irreversible: whether the transformation is irreversible
+      (None if undeclared)
     - destroyed_distinctions: set of destroyed distinctions
+      (None if undeclared)
+    - preserved_distinctions: set of preserved distinctions
+      (None if undeclared)
+    - reconstruction: whether the transformation is a declared
+      reconstruction
 
     Invariants:
     - Irreversible edges MUST NOT be invertible.
     - Destroyed distinctions MUST NOT reappear downstream.
     """
+    __slots__ = (
+        "source", "target", "irreversible",
+        "destroyed_distinctions", "preserved_distinctions", "reconstruction"
+    )
+
     def __init__(
         self,
         source: str,
         target: str,
-        irreversible: bool,
-        destroyed_distinctions: Set[str]
+        irreversible: Optional[bool],
+        destroyed_distinctions: Optional[Set[str]],
+        preserved_distinctions: Optional[Set[str]] = None,
+        reconstruction: bool = False
     ):
         self.source = source
         self.target = target
         self.irreversible = irreversible
         self.destroyed_distinctions = destroyed_distinctions
-
-
-class DegradationGraph:
-    """
-    Graph of declared degradation and irreversibility.
-
-    Fields:
-    - nodes: semantic representation identifiers
-    - edges: degradation edges
-
-    Invariants:
-    - Graph MUST include only explicitly declared transformations.
-    - Graph MUST be acyclic with respect to irreversibility.
-    - Reconstruction paths MUST NOT exist unless explicitly declared.
-    """
-    def __init__(
-        self,
-        nodes: Set[str],
-        edges: Set[DegradationEdge]
-    ):
-        self.nodes = nodes
-        self.edges = edges
+        self.preserved_distinctions = preserved_distinctions
+        self.reconstruction = reconstruction
 
 
 # ────────────────────────────────────────────────────────────
@@ -298,8 +332,9 @@ class SemanticContext:
     - actions: declared actions
     - observers: declared observers
 
-    - quantities: registry of all quantities
+    - quantities: registry of all quantities, keyed by structured path
     - degradation_graph: declared degradation semantics
+    - symbols: interned identifiers (see engine.symbols)
 
     Global Invariants:
     - spec_version MUST match lint-supported spec version.
@@ -308,7 +343,93 @@ class SemanticContext:
     - No implicit actions, observers, units, uncertainty, or degradation.
     - No implicit reconstruction of destroyed distinctions.
     """
-    def __init__(self, manifest: dict):
+    def __init__(self, manifest: dict, symbols: SymbolTable = None):
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self._build_header(manifest)
+
+        # ── Actions ──────────────────────────────────────────
+        self.actions: Dict[str, Action] = {}
+        for action in manifest.get("actions", []):
+            self._add_action(action)
+
+        # ── Observers ────────────────────────────────────────
+        self.observers: Dict[str, Observer] = {}
+        for obs in manifest.get("observers", []):
+            self._add_observer(obs)
+
+        self._build_registries()
+        self._build_degradation(manifest.get("degradation", []))
+
+    @classmethod
+    def from_stream(cls, fp, inspect=None, symbols: SymbolTable = None) -> "SemanticContext":
+        """
+        Construct a SemanticContext from a manifest text stream.
+
+        actions[] and observers[] are consumed element by element,
+        so the parsed manifest is never materialized as a whole.
+        The resulting context is identical to SemanticContext(json.load(fp)).
+
+        `inspect`, if given, is called with every (event, key, value)
+        of engine.manifest_stream.iter_manifest before it is applied.
+        `symbols`, if given, is the symbol table to intern into.
+
+        A member replaced by a repeated member of the same name does not
+        affect the result, even if its elements cannot be constructed.
+
+        Raises:
+        - json.JSONDecodeError on malformed input
+        - ValueError if the manifest is not a JSON object
+        - the construction error of a final actions[] or observers[]
+          element, as SemanticContext(json.load(fp)) would
+        """
+        from engine.manifest_stream import iter_manifest
+
+        self = cls.__new__(cls)
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.actions = {}
+        self.observers = {}
+        header = {}
+        # First construction failure of each actions/observers member;
+        # raised only if no repeated member replaces it
+        failures = {}
+
+        for event, key, value in iter_manifest(fp):
+            if inspect is not None:
+                inspect(event, key, value)
+            if event == "item":
+                if key not in failures:
+                    try:
+                        if key == "actions":
+                            self._add_action(value)
+                        else:
+                            self._add_observer(value)
+                    except Exception as e:
+                        failures[key] = e
+            elif event == "begin":
+                # A repeated member replaces the earlier one, as in json.load
+                getattr(self, key).clear()
+                failures.pop(key, None)
+            elif key in ("actions", "observers"):
+                getattr(self, key).clear()
+                failures.pop(key, None)
+                add = self._add_action if key == "actions" else self._add_observer
+                try:
+                    for element in value:
+                        add(element)
+                except Exception as e:
+                    failures[key] = e
+            else:
+                header[key] = value
+
+        for e in failures.values():
+            raise e
+
+        self._build_header(header)
+        self._build_registries()
+        self._build_degradation(header.get("degradation", []))
+        return self
+
+    def _build_header(self, manifest: dict):
         # Initialize with default values to avoid None issues
         self.spec_version: str = manifest.get("version", "")
         self.profile: str = manifest.get("profile", "")
@@ -322,78 +443,94 @@ class SemanticContext:
 
         # ── Ontology ─────────────────────────────────────────
         ontology = manifest.get("ontology", {})
+        canonical = self.symbols.canonical
         self.ontology = Ontology(
-            entities=set(ontology.get("entities", []))
+            entities=set(map(canonical, ontology.get("entities", [])))
         )
 
-        # ── Actions ──────────────────────────────────────────
-        self.actions: Dict[str, Action] = {}
-        for action in manifest.get("actions", []):
-            try:
-                params: Dict[str, Quantity] = {}
-
-                for pname, p in action.get("parameters", {}).items():
-                    try:
-                        params[pname] = Quantity(
-                            value=p.get("value", "unknown"),
-                            unit=p.get("unit", ""),
-                            uncertainty=p.get("uncertainty", "unknown"),
-                            provenance=p.get("provenance", ""),
-                            _path=f"actions[{action['name']}].parameters[{pname}]"
-                        )
-                    except ValueError:
-                        # Quantity validation failed, skip this parameter
-                        continue
-
-                self.actions[action["name"]] = Action(
-                    name=action["name"],
-                    parameters=params,
-                    stochastic=action.get("stochastic", False)
-                )
-            except (KeyError, ValueError):
-                # Action validation failed, skip this action
-                continue
-
-        # ── Observers ────────────────────────────────────────
-        self.observers: Dict[str, Observer] = {}
-        for obs in manifest.get("observers", []):
-            try:
-                if "boundary" not in obs:
-                    boundary = None
-                else:
-                    boundary = Boundary(obs["boundary"])
-
-                noise_src = obs.get("noise", {})
-                noise = Quantity(
-                    value=noise_src.get("value", "unknown"),
-                    unit=noise_src.get("unit", ""),
-                    uncertainty=noise_src.get("uncertainty", "unknown"),
-                    provenance=noise_src.get("provenance", ""),
-                    _path=f"observers[{obs['name']}].noise"
-                )
-
-                self.observers[obs["name"]] = Observer(
-                    name=obs["name"],
-                    operator=obs.get("operator", ""),
-                    boundary=boundary,
-                    noise=noise
-                )
-            except (KeyError, ValueError):
-                # Observer validation failed, skip this observer
-                continue
-
+    def _add_action(self, action: dict):
+        try:
+            params: Dict[str, Quantity] = {}
+
+            for pname, p in action.get("parameters", {}).items():
+                try:
+                    params[pname] = Quantity(
+                        value=p.get("value", "unknown"),
+                        unit=p.get("unit", ""),
+                        uncertainty=p.get("uncertainty", "unknown"),
+                        provenance=p.get("provenance", "")
+                    )
+                except ValueError:
+                    # Quantity validation failed, skip this parameter
+                    continue
+
+            self.actions[action["name"]] = Action(
+                name=action["name"],
+                parameters=params,
+                stochastic=action.get("stochastic", False)
+            )
+        except (KeyError, ValueError):
+            # Action validation failed, skip this action
+            pass
+
+    def _add_observer(self, obs: dict):
+        try:
+            if "boundary" not in obs:
+                boundary = None
+            else:
+                boundary = Boundary(obs["boundary"])
+
+            noise_src = obs.get("noise", {})
+            noise = Quantity(
+                value=noise_src.get("value", "unknown"),
+                unit=noise_src.get("unit", ""),
+                uncertainty=noise_src.get("uncertainty", "unknown"),
+                provenance=noise_src.get("provenance", "")
+            )
+
+            self.observers[obs["name"]] = Observer(
+                name=obs["name"],
+                operator=obs.get("operator", ""),
+                boundary=boundary,
+                noise=noise
+            )
+        except (KeyError, ValueError):
+            # Observer validation failed, skip this observer
+            pass
+
+    def _build_registries(self):
         # ── Quantities Registry ──────────────────────────────
-        self.quantities: Dict[str, Quantity] = {}
+        self.quantities: Dict[tuple, Quantity] = {}
+        quantities = self.quantities
+        intern, ids = self.symbols.intern, self.symbols.ids
         for action in self.actions.values():
+            a = intern(action.name)
             for pname, q in action.parameters.items():
-                self.quantities[f"action:{action.name}:{pname}"] = q
+                quantities[ACTION_PARAMETER, a, ids[pname]] = q
 
         for obs in self.observers.values():
-            self.quantities[f"observer:{obs.name}:noise"] = obs.noise
+            quantities[OBSERVER_NOISE, intern(obs.name)] = obs.noise
 
+    def _build_degradation(self, transformations: list):
         # ── Degradation Graph ────────────────────────────────
-        # NOTE: constructed empty; populated only if explicitly declared
-        self.degradation_graph = DegradationGraph(
-            nodes=set(),
-            edges=set()
-        )
\ No newline at end of file
+        # Populated only from explicitly declared transformations
+        edges = []
+        for t in transformations:
+            try:
+                if type(t["source"]) is not str or type(t["target"]) is not str:
+                    continue
+                destroyed = t.get("destroyed")
+                preserved = t.get("preserved")
+                edges.append(DegradationEdge(
+                    source=t["source"],
+                    target=t["target"],
+                    irreversible=t.get("irreversible"),
+                    destroyed_distinctions=None if destroyed is None else set(destroyed),
+                    preserved_distinctions=None if preserved is None else set(preserved),
+                    reconstruction=t.get("reconstruction") is True
+                ))
+            except (AttributeError, KeyError, TypeError):
+                # Transformation validation failed, skip this transformation
+                continue
+
+        self.degradation_graph = DegradationGraph(edges)
@@ -0,0 +1,91 @@
+"""
+Module: Symbol Table
+
+Status: Normative
+Responsibility: Interned identifiers and structured manifest paths
+
+A SymbolTable interns the identifiers of a semantic context
+(action, observer, parameter and entity names, units and
+provenance) to dense integer ids, in order of first appearance.
+Repeated declarations share one string object.
+
+Paths into the manifest are held as structured paths: tuples of
+a path kind followed by symbol ids, e.g.
+
+    (ACTION_PARAMETER, id("move"), id("dx"))
+
+Structured paths are rendered to text only when a violation
+reports them:
+
+    "action:move:dx"
+
+Normative Requirements:
+- Interning MUST NOT alter declared values; non-string values are
+  kept as declared.
+- A rendered path MUST equal the text path it represents.
+
+This module introduces NO new semantics.
+"""
+
+# Path kinds:
+# - (ACTION_PARAMETER, action, parameter): "action:{action}:{parameter}"
+# - (OBSERVER_NOISE, observer): "observer:{observer}:noise"
+ACTION_PARAMETER = "action"
+OBSERVER_NOISE = "observer"
+
+
+class _Ids(dict):
+    # Text -> id; unseen text is assigned the next id on lookup
+    __slots__ = ("names",)
+
+    def __init__(self, names: list):
+        self.names = names
+
+    def __missing__(self, name: str) -> int:
+        i = self[name] = len(self.names)
+        self.names.append(name)
+        return i
+
+
+class SymbolTable:
+    """
+    Context-wide table of interned identifiers.
+
+    Fields:
+    - names: symbol id -> text
+    - ids: text -> symbol id; looking up unseen text interns it.
+      Keys MUST be strings (see intern() for other values).
+    """
+    def __init__(self):
+        self.names = []
+        self.ids = _Ids(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, name) -> int:
+        """
+        Return the id of `name`, as its text appears in paths.
+        """
+        return self.ids[name if type(name) is str else f"{name}"]
+
+    def canonical(self, value):
+        """
+        Return the table's instance of a string value, interning it;
+        any other value is returned as declared.
+        """
+        return self.names[self.ids[value]] if type(value) is str else value
+
+    def render(self, path) -> str:
+        """
+        Render a structured path to text; text paths are returned as is.
+        """
+        if type(path) is str:
+            return path
+        names = self.names
+        kind = path[0]
+        if kind == ACTION_PARAMETER:
+            return f"action:{names[path[1]]}:{names[path[2]]}"
+        if kind == OBSERVER_NOISE:
+            return f"observer:{names[path[1]]}:noise"
+        raise ValueError(f"Unknown path kind: {kind!r}")
@@ -0,0 +1,154 @@
+"""
+Module: Fused Traversal
+
+Status: Normative
+Responsibility: Single-pass dispatch of rules over a SemanticContext
+
+Rule modules MAY expose per-node callbacks in addition to check():
+
+- on_world(context, violations)
+- on_action(context, name, action, violations)
+- on_observer(context, name, obs, violations)
+- on_quantity(context, key, q, violations)
+- on_edge(context, edge, violations)
+
+Each callback appends violation records (see engine.report)
+to `violations`.
+A module that exposes any node callback MUST NOT perform node
+iteration in on_world; its check() MUST be equivalent to running
+its callbacks over the whole context.
+
+Modules without node callbacks are executed through check().
+
+Quantity rules MAY additionally expose on_quantity_columns
+(see engine.quantity_store). When the columnar view is in use,
+it replaces on_quantity for those rules.
+
+The traversal walks each context collection exactly once
+and dispatches every node to all interested rules.
+
+Normative Requirements:
+- The set of violations MUST equal that of running every
+  rule's check() independently.
+- Traversal MUST NOT mutate the context.
+
+This module introduces NO new semantics.
+"""
+
+from engine.quantity_store import COLUMNAR_MIN_QUANTITIES, build_columns, numpy_available
+
+
+NODE_HOOKS = ("on_action", "on_observer", "on_quantity", "on_edge")
+
+
+class FusedTraversal:
+    """
+    Per-plan dispatch tables.
+
+    Fields:
+    - world_checks: check() callables of rules without node callbacks
+    - world_hooks: on_world callbacks
+    - action_hooks, observer_hooks, quantity_hooks, edge_hooks:
+      node callbacks, in plan order
+    - quantity_column_hooks: vectorized quantity callbacks
+    - quantity_row_hooks: quantity callbacks of rules without a
+      vectorized form
+    - columnar: True to always use the columnar view, False to never
+      use it, None to use it for large registries when NumPy is available
+    """
+    def __init__(self, modules, columnar=None):
+        self.columnar = columnar
+        self.quantity_column_hooks = []
+        self.quantity_row_hooks = []
+        self.world_checks = []
+        self.world_hooks = []
+        self.action_hooks = []
+        self.observer_hooks = []
+        self.quantity_hooks = []
+        self.edge_hooks = []
+
+        for module in modules:
+            if not any(hasattr(module, hook) for hook in NODE_HOOKS):
+                self.world_checks.append(module.check)
+                continue
+
+            if hasattr(module, "on_world"):
+                self.world_hooks.append(module.on_world)
+            if hasattr(module, "on_action"):
+                self.action_hooks.append(module.on_action)
+            if hasattr(module, "on_observer"):
+                self.observer_hooks.append(module.on_observer)
+            if hasattr(module, "on_quantity"):
+                self.quantity_hooks.append(module.on_quantity)
+                if hasattr(module, "on_quantity_columns"):
+                    self.quantity_column_hooks.append(module.on_quantity_columns)
+                else:
+                    self.quantity_row_hooks.append(module.on_quantity)
+            if hasattr(module, "on_edge"):
+                self.edge_hooks.append(module.on_edge)
+
+        self.world_checks = tuple(self.world_checks)
+        self.world_hooks = tuple(self.world_hooks)
+        self.action_hooks = tuple(self.action_hooks)
+        self.observer_hooks = tuple(self.observer_hooks)
+        self.quantity_hooks = tuple(self.quantity_hooks)
+        self.quantity_column_hooks = tuple(self.quantity_column_hooks)
+        self.quantity_row_hooks = tuple(self.quantity_row_hooks)
+        self.edge_hooks = tuple(self.edge_hooks)
+
+    def run(self, context, violations=None):
+        """
+        Walk the context once and return the collected violations.
+
+        `violations` may be any object with append() and extend();
+        a new list is used if none is given.
+        """
+        if violations is None:
+            violations = []
+
+        for check_fn in self.world_checks:
+            violations.extend(check_fn(context))
+
+        for hook in self.world_hooks:
+            hook(context, violations)
+
+        hooks = self.action_hooks
+        if hooks:
+            for name, action in context.actions.items():
+                for hook in hooks:
+                    hook(context, name, action, violations)
+
+        hooks = self.observer_hooks
+        if hooks:
+            for name, obs in context.observers.items():
+                for hook in hooks:
+                    hook(context, name, obs, violations)
+
+        hooks = self.quantity_hooks
+        if hooks and self.use_columns(context):
+            columns = build_columns(context)
+            for hook in self.quantity_column_hooks:
+                hook(context, columns, violations)
+            hooks = self.quantity_row_hooks
+        if hooks:
+            for key, q in context.quantities.items():
+                for hook in hooks:
+                    hook(context, key, q, violations)
+
+        hooks = self.edge_hooks
+        if hooks:
+            for edge in context.degradation_graph.edges:
+                for hook in hooks:
+                    hook(context, edge, violations)
+
+        return violations
+
+    def use_columns(self, context) -> bool:
+        """
+        Whether quantities of `context` are evaluated through the columnar view.
+        """
+        if self.columnar is False or not self.quantity_column_hooks:
+            return False
+        if self.columnar:
+            return True
+        return len(context.quantities) >= COLUMNAR_MIN_QUANTITIES and numpy_available()
@@ -0,0 +1,347 @@
+"""
+Module: Unit Engine
+
+Status: Normative
+Responsibility: Canonical dimensions of declared unit expressions
+
+A unit expression is parsed into a canonical Unit: a scale factor
+relative to coherent base units, and a dimension vector of integer
+exponents over the base dimensions
+
+    length, mass, time, current, temperature, amount,
+    luminous intensity, pixel, information
+
+Pixels and information are counted as dimensions of their own, as
+sensor worlds declare them; plane and solid angles are dimensionless,
+as in SI.
+
+Grammar (whitespace-insensitive):
+
+    expression := term (("*" | "·" | "/" | "per" | juxtaposition) term)*
+    term       := factor (("^" | "**") integer | superscript | integer)?
+    factor     := unit | number | "(" expression ")"
+
+Units are SI symbols and names with SI prefixes ("km", "kilometer",
+"µs"), plural names ("meters") and common non-SI units ("min",
+"hour", "degree", "liter", "px", "byte", "percent"). "/" and "per"
+divide by the next term only: "m/s*kg" is "m·kg/s".
+
+Parsing is memoized in a bounded LRU cache (UNIT_CACHE_SIZE):
+worlds reuse few distinct unit strings.
+
+Normative Requirements:
+- Parsing MUST be deterministic and MUST NOT depend on the context.
+- Expressions that cannot be parsed are opaque: they have no
+  canonical form, and MUST NOT be reported as conflicting.
+- Affine offsets (e.g. degree Celsius, degree Fahrenheit) are not
+  part of the canonical form.
+- A bare angle unit ("deg", "°", "degree") MUST NOT be juxtaposed
+  with a following unit: "deg C" is opaque, not an angle times a
+  coulomb.
+
+This module introduces NO new semantics.
+"""
+
+import math
+import re
+from functools import lru_cache
+
+
+BASE_DIMENSIONS = (
+    "length", "mass", "time", "current", "temperature", "amount",
+    "luminous_intensity", "pixel", "information",
+)
+
+# Distinct unit expressions kept parsed
+UNIT_CACHE_SIZE = 1024
+
+
+def _dim(**exponents) -> tuple:
+    return tuple(exponents.get(name, 0) for name in BASE_DIMENSIONS)
+
+
+DIMENSIONLESS = _dim()
+
+_L, _M, _T, _I = _dim(length=1), _dim(mass=1), _dim(time=1), _dim(current=1)
+_FORCE = _dim(length=1, mass=1, time=-2)
+_ENERGY = _dim(length=2, mass=1, time=-2)
+_POWER = _dim(length=2, mass=1, time=-3)
+_CHARGE = _dim(time=1, current=1)
+_VOLTAGE = _dim(length=2, mass=1, time=-3, current=-1)
+
+# name -> (scale, dimension); symbols are case-sensitive
+_SYMBOLS = {
+    "m": (1.0, _L),
+    "g": (1e-3, _M),
+    "s": (1.0, _T),
+    "A": (1.0, _I),
+    "K": (1.0, _dim(temperature=1)),
+    "mol": (1.0, _dim(amount=1)),
+    "cd": (1.0, _dim(luminous_intensity=1)),
+    "rad": (1.0, DIMENSIONLESS),
+    "sr": (1.0, DIMENSIONLESS),
+    "Hz": (1.0, _dim(time=-1)),
+    "N": (1.0, _FORCE),
+    "Pa": (1.0, _dim(length=-1, mass=1, time=-2)),
+    "J": (1.0, _ENERGY),
+    "W": (1.0, _POWER),
+    "Wh": (3600.0, _ENERGY),
+    "C": (1.0, _CHARGE),
+    "Ah": (3600.0, _CHARGE),
+    "V": (1.0, _VOLTAGE),
+    "Ω": (1.0, _dim(length=2, mass=1, time=-3, current=-2)),
+    "ohm": (1.0, _dim(length=2, mass=1, time=-3, current=-2)),
+    "F": (1.0, _dim(length=-2, mass=-1, time=4, current=2)),
+    "H": (1.0, _dim(length=2, mass=1, time=-2, current=-2)),
+    "T": (1.0, _dim(mass=1, time=-2, current=-1)),
+    "Wb": (1.0, _dim(length=2, mass=1, time=-2, current=-1)),
+    "lm": (1.0, _dim(luminous_intensity=1)),
+    "lx": (1.0, _dim(length=-2, luminous_intensity=1)),
+    "L": (1e-3, _dim(length=3)),
+    "l": (1e-3, _dim(length=3)),
+    "min": (60.0, _T),
+    "h": (3600.0, _T),
+    "d": (86400.0, _T),
+    "deg": (math.pi / 180, DIMENSIONLESS),
+    "°": (math.pi / 180, DIMENSIONLESS),
+    "°C": (1.0, _dim(temperature=1)),
+    "degC": (1.0, _dim(temperature=1)),
+    "°F": (5.0 / 9.0, _dim(temperature=1)),
+    "degF": (5.0 / 9.0, _dim(temperature=1)),
+    "px": (1.0, _dim(pixel=1)),
+    "bit": (1.0, _dim(information=1)),
+    "B": (8.0, _dim(information=1)),
+    "%": (1e-2, DIMENSIONLESS),
+}
+
+# Case-insensitive names, singular
+_NAMES = {
+    "meter": "m", "metre": "m", "gram": "g", "second": "s", "ampere": "A",
+    "kelvin": "K", "mole": "mol", "candela": "cd", "radian": "rad",
+    "steradian": "sr", "hertz": "Hz", "newton": "N", "pascal": "Pa",
+    "joule": "J", "watt": "W", "coulomb": "C", "volt": "V", "farad": "F",
+    "henry": "H", "tesla": "T", "weber": "Wb", "lumen": "lm", "lux": "lx",
+    "liter": "L", "litre": "L", "minute": "min", "hour": "h", "day": "d",
+    "degree": "deg", "celsius": "°C", "fahrenheit": "°F", "pixel": "px",
+    "byte": "B", "percent": "%",
+}
+
+_PLAIN = {
+    "1": (1.0, DIMENSIONLESS),
+    "dimensionless": (1.0, DIMENSIONLESS),
+    "unitless": (1.0, DIMENSIONLESS),
+}
+
+_PREFIXES = {
+    "Y": 1e24, "Z": 1e21, "E": 1e18, "P": 1e15, "T": 1e12, "G": 1e9,
+    "M": 1e6, "k": 1e3, "h": 1e2, "da": 1e1, "d": 1e-1, "c": 1e-2,
+    "m": 1e-3, "µ": 1e-6, "μ": 1e-6, "u": 1e-6, "n": 1e-9, "p": 1e-12,
+    "f": 1e-15, "a": 1e-18, "z": 1e-21, "y": 1e-24,
+}
+
+_NAME_PREFIXES = {
+    "yotta": 1e24, "zetta": 1e21, "exa": 1e18, "peta": 1e15, "tera": 1e12,
+    "giga": 1e9, "mega": 1e6, "kilo": 1e3, "hecto": 1e2, "deka": 1e1,
+    "deca": 1e1, "deci": 1e-1, "centi": 1e-2, "milli": 1e-3, "micro": 1e-6,
+    "nano": 1e-9, "pico": 1e-12, "femto": 1e-15, "atto": 1e-18,
+    "zepto": 1e-21, "yocto": 1e-24,
+}
+
+# Prefixes do not apply to these symbols
+_UNPREFIXED = {"min", "h", "d", "deg", "°", "°C", "degC", "°F", "degF", "%", "px"}
+
+# Angle units that may not be juxtaposed with a following unit:
+# "deg C" and "° F" are ambiguous temperatures, not angle products
+_BARE_ANGLES = {"deg", "°", "degree", "degrees"}
+
+# Logarithmic units, which have no canonical form
+_LOGARITHMIC = {"dB", "Np"}
+
+_SUPERSCRIPTS = str.maketrans("⁻⁰¹²³⁴⁵⁶⁷⁸⁹", "-0123456789")
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)
+      | (?P<unit>°[CF]|[^\W\d_⁰¹²³⁴⁵⁶⁷⁸⁹]+|°|%)(?P<exponent>-?\d+)?
+      | (?P<superscript>[⁻⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+      | (?P<op>\*\*|[*·/^()-])
+    )""", re.VERBOSE)
+
+
+class Unit:
+    """
+    Canonical form of a unit expression.
+
+    Fields:
+    - scale: factor relative to the coherent base units
+    - dimension: exponents over BASE_DIMENSIONS
+    """
+    __slots__ = ("scale", "dimension")
+
+    def __init__(self, scale: float, dimension: tuple):
+        self.scale = scale
+        self.dimension = dimension
+
+    def __eq__(self, other):
+        return isinstance(other, Unit) and (self.scale, self.dimension) == (other.scale, other.dimension)
+
+    def __hash__(self):
+        return hash((self.scale, self.dimension))
+
+    def __repr__(self):
+        return f"Unit({self.scale!r}, {self.dimension!r})"
+
+
+def _lookup(name: str):
+    if name in _LOGARITHMIC:
+        return None
+    entry = _SYMBOLS.get(name) or _PLAIN.get(name.lower())
+    if entry is not None:
+        return entry
+
+    # Prefixed symbol (case-sensitive), e.g. km, µs, daN
+    for size in (2, 1):
+        prefix, rest = name[:size], name[size:]
+        if prefix in _PREFIXES and rest in _SYMBOLS and rest not in _UNPREFIXED:
+            scale, dimension = _SYMBOLS[rest]
+            return _PREFIXES[prefix] * scale, dimension
+
+    # Name, optionally prefixed and plural, e.g. kilometers
+    lowered = name.lower()
+    for prefix, factor in (("", 1.0), *_NAME_PREFIXES.items()):
+        if not lowered.startswith(prefix):
+            continue
+        rest = lowered[len(prefix):]
+        for singular in (rest, rest[:-1] if rest.endswith("s") else None,
+                         rest[:-2] if rest.endswith("es") else None):
+            symbol = _NAMES.get(singular)
+            if symbol is not None and (factor == 1.0 or symbol not in _UNPREFIXED):
+                scale, dimension = _SYMBOLS[symbol]
+                return factor * scale, dimension
+    return None
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = []
+        position = 0
+        text = text.strip()
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                raise ValueError(text)
+            self.tokens.append(match)
+            position = match.end()
+        self.i = 0
+        # Unit of the last factor read, None if not a unit
+        self.unit = None
+
+    def _peek(self):
+        return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+    def _next(self):
+        token = self._peek()
+        self.i += 1
+        return token
+
+    def expression(self):
+        scale, dimension = self.term()
+        while True:
+            token = self._peek()
+            if token is None or token["op"] == ")":
+                return scale, dimension
+            divide = token["op"] == "/" or (token["unit"] is not None and token["unit"].lower() == "per")
+            if divide or token["op"] in ("*", "·"):
+                self._next()
+            elif self.unit is not None and self.unit.lower() in _BARE_ANGLES:
+                raise ValueError(self.unit)
+            other_scale, other = self.term()
+            if divide:
+                scale /= other_scale
+                dimension = tuple(a - b for a, b in zip(dimension, other))
+            else:
+                scale *= other_scale
+                dimension = tuple(a + b for a, b in zip(dimension, other))
+
+    def term(self):
+        scale, dimension, exponent = self.factor()
+        token = self._peek()
+        if exponent is None and token is not None:
+            if token["op"] in ("^", "**"):
+                self._next()
+                exponent = self._integer()
+            elif token["superscript"] is not None:
+                self._next()
+                exponent = int(token["superscript"].translate(_SUPERSCRIPTS))
+        if exponent is None:
+            return scale, dimension
+        return scale ** exponent, tuple(a * exponent for a in dimension)
+
+    def _integer(self) -> int:
+        token = self._next()
+        sign = 1
+        if token is not None and token["op"] == "-":
+            sign, token = -1, self._next()
+        if token is None or token["number"] is None or not token["number"].isdigit():
+            raise ValueError("exponent")
+        return sign * int(token["number"])
+
+    def factor(self):
+        token = self._next()
+        if token is None:
+            raise ValueError("factor")
+        self.unit = token["unit"]
+        if token["op"] == "(":
+            scale, dimension = self.expression()
+            closing = self._next()
+            if closing is None or closing["op"] != ")":
+                raise ValueError("parenthesis")
+            self.unit = None
+            return scale, dimension, None
+        if token["number"] is not None:
+            return float(token["number"]), DIMENSIONLESS, None
+        if token["unit"] is not None:
+            entry = _lookup(token["unit"])
+            if entry is None:
+                raise ValueError(token["unit"])
+            exponent = token["exponent"]
+            return entry[0], entry[1], int(exponent) if exponent is not None else None
+        raise ValueError(token.group())
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _parse(text: str):
+    try:
+        parser = _Parser(text)
+        scale, dimension = parser.expression()
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return None
+    if parser.i != len(parser.tokens) or not math.isfinite(scale) or scale == 0.0:
+        return None
+    return Unit(scale, dimension)
+
+
+def parse_unit(text):
+    """
+    Return the canonical Unit of a unit expression, or None if it
+    is opaque (not a string, empty, or not parseable).
+    """
+    if type(text) is not str or not text:
+        return None
+    return _parse(text)
+
+
+def dimension_of(text):
+    """
+    Return the dimension vector of a unit expression, or None if it is opaque.
+    """
+    unit = parse_unit(text)
+    return unit.dimension if unit is not None else None
+
+
+def format_dimension(dimension: tuple) -> str:
+    """
+    Render a dimension vector, e.g. "length·time^-1"; "1" if dimensionless.
+    """
+    parts = [name if e == 1 else f"{name}^{e}" for name, e in zip(BASE_DIMENSIONS, dimension) if e]
+    return "·".join(parts) or "1"
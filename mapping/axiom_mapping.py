@@ -39,4 +39,39 @@ AXIOM_RULE_MODULES = {
     "S17": "rules.axioms.s17_no_implicit_casting",
     "S18": "rules.axioms.s18_claim_scope",
     "S19": "rules.axioms.s19_distinguishability",
-}
\ No newline at end of file
+}
+
+# ────────────────────────────────────────────────────────────
+# Supplementary Rule Packs
+# ────────────────────────────────────────────────────────────
+#
+# These packs are not executed by default.
+# They are included in a rule plan only when explicitly requested.
+
+FEATURE_RULE_MODULES = {
+    "actions": "rules.features.actions",
+    "irreversibility": "rules.features.irreversibility",
+    "numerical_semantics": "rules.features.numerical_semantics",
+    "observers": "rules.features.observers",
+    "sensing_boundary": "rules.features.sensing_boundary",
+}
+
+CONSISTENCY_RULE_MODULES = {
+    "provenance": "rules.consistency.provenance",
+    "uncertainty": "rules.consistency.uncertainty",
+    "units": "rules.consistency.units",
+}
+
+PROFILE_RULE_MODULES = {
+    "L0": "rules.profiles.l0_ontology",
+    "L1": "rules.profiles.l1_causal",
+    "L2": "rules.profiles.l2_sensing",
+    "L3": "rules.profiles.l3_numerical",
+}
+
+RULE_PACKS = {
+    "axioms": AXIOM_RULE_MODULES,
+    "features": FEATURE_RULE_MODULES,
+    "consistency": CONSISTENCY_RULE_MODULES,
+    "profiles": PROFILE_RULE_MODULES,
+}
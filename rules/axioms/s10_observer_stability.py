@@ -16,6 +16,9 @@ Rationale:
 Undeclared drift is silent degradation.
 """
 
+SECTIONS = ()
+
+
 def check(context):
     # Drift must be declared via actions; not representable otherwise
     return []
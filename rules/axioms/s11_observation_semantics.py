@@ -17,26 +17,35 @@ Rationale:
 Observation without semantics is undefined.
 """
 
+from engine.report import violation
+
+SECTIONS = ("observers",)
+
+
+def on_observer(context, name, obs, violations):
+    if not obs.operator:
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S11-OBSERVATION-SEMANTICS",
+            axiom="S11",
+            path=f"observers[{name}].operator",
+            message="Observer operator MUST be declared."
+        ))
+
+    if obs.noise.uncertainty == "unknown":
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S11-OBSERVATION-SEMANTICS",
+            axiom="S11",
+            path=f"observers[{name}].noise.uncertainty",
+            message="Observer uncertainty MUST NOT be implicit."
+        ))
+
+
 def check(context):
     violations = []
 
     for name, obs in context.observers.items():
-        if not obs.operator:
-            violations.append({
-                "severity": "ERROR",
-                "rule": "AXIOM-S11-OBSERVATION-SEMANTICS",
-                "axiom": "S11",
-                "path": f"observers[{name}].operator",
-                "message": "Observer operator MUST be declared."
-            })
-
-        if obs.noise.uncertainty == "unknown":
-            violations.append({
-                "severity": "ERROR",
-                "rule": "AXIOM-S11-OBSERVATION-SEMANTICS",
-                "axiom": "S11",
-                "path": f"observers[{name}].noise.uncertainty",
-                "message": "Observer uncertainty MUST NOT be implicit."
-            })
+        on_observer(context, name, obs, violations)
 
     return violations
@@ -15,17 +15,26 @@ Rationale:
 Learning beyond observability is invalid.
 """
 
+from engine.report import violation
+
+SECTIONS = ("observers",)
+
+
+def on_observer(context, name, obs, violations):
+    if obs.boundary is None:
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S12-SENSING-BOUNDARY",
+            axiom="S12",
+            path=f"observers[{name}].boundary",
+            message="Observer MUST declare sensing boundary."
+        ))
+
+
 def check(context):
     violations = []
 
     for name, obs in context.observers.items():
-        if obs.boundary is None:
-            violations.append({
-                "severity": "ERROR",
-                "rule": "AXIOM-S12-SENSING-BOUNDARY",
-                "axiom": "S12",
-                "path": f"observers[{name}].boundary",
-                "message": "Observer MUST declare sensing boundary."
-            })
+        on_observer(context, name, obs, violations)
 
     return violations
@@ -16,6 +16,9 @@ Rationale:
 Boundary violations invalidate claims.
 """
 
+SECTIONS = ()
+
+
 def check(context):
     # Boundary violations are checked against claims;
     # no implicit inference here.
@@ -10,11 +10,52 @@ All irreversible operations MUST be explicitly declared.
 
 Violation Conditions:
 - Quantization, compression, or projection without declaration
+- A transformation that does not declare whether it is irreversible
+- A transformation destroying distinctions declared reversible
+- An irreversible transformation on a cycle of irreversible
+  transformations (irreversible edges MUST NOT be invertible)
 
 Rationale:
 Irreversibility defines degradation.
 """
 
+from engine.degradation_graph import IRREVERSIBLE_EDGES
+from engine.report import violation
+
+SECTIONS = ("degradation",)
+
+
 def check(context):
-    # No implicit irreversibility allowed
-    return []
+    violations = []
+
+    graph = context.degradation_graph
+    reachable = graph.reachability(IRREVERSIBLE_EDGES).reaches
+    for e, edge in enumerate(graph.edges):
+        path = f"degradation[{edge.source}->{edge.target}]"
+        if type(edge.irreversible) is not bool:
+            violations.append(violation(
+                severity="ERROR",
+                rule="AXIOM-S14-EXPLICIT-IRREVERSIBILITY",
+                axiom="S14",
+                path=f"{path}.irreversible",
+                message="Transformation MUST declare whether it is irreversible."
+            ))
+        elif not edge.irreversible:
+            if edge.destroyed_distinctions:
+                violations.append(violation(
+                    severity="ERROR",
+                    rule="AXIOM-S14-EXPLICIT-IRREVERSIBILITY",
+                    axiom="S14",
+                    path=f"{path}.irreversible",
+                    message="Transformation destroying distinctions MUST be declared irreversible."
+                ))
+        elif reachable(graph.edge_target[e], graph.edge_source[e]):
+            violations.append(violation(
+                severity="ERROR",
+                rule="AXIOM-S14-EXPLICIT-IRREVERSIBILITY",
+                axiom="S14",
+                path=path,
+                message="Irreversible transformation MUST NOT lie on a cycle of irreversible transformations."
+            ))
+
+    return violations
@@ -11,11 +11,36 @@ MUST NOT be implicitly reconstructed.
 
 Violation Conditions:
 - Recovery of declared lost information
+- A path of transformations leading from the target of an
+  irreversible transformation back to its source, without
+  a declared reconstruction on the path
 
 Rationale:
 Reconstruction introduces undeclared priors.
 """
 
+from engine.degradation_graph import IMPLICIT_EDGES
+from engine.report import violation
+
+SECTIONS = ("degradation",)
+
+
 def check(context):
-    # Enforced via degradation_graph invariants
-    return []
+    violations = []
+
+    graph = context.degradation_graph
+    reachable = graph.reachability(IMPLICIT_EDGES).reaches
+    for e, edge in enumerate(graph.edges):
+        if edge.irreversible is not True or edge.reconstruction:
+            continue
+        if reachable(graph.edge_target[e], graph.edge_source[e]):
+            violations.append(violation(
+                severity="ERROR",
+                rule="AXIOM-S15-NO-IMPLICIT-RECONSTRUCTION",
+                axiom="S15",
+                path=f"degradation[{edge.source}->{edge.target}]",
+                message=f"'{edge.source}' is reachable from '{edge.target}' "
+                           "without a declared reconstruction."
+            ))
+
+    return violations
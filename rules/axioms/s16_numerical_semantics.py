@@ -16,17 +16,37 @@ Rationale:
 Numbers without semantics are meaningless.
 """
 
+from engine.report import violation
+
+SECTIONS = ("quantities",)
+
+
+def on_quantity(context, key, q, violations):
+    if q.unit is None:
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S16-NUMERICAL-SEMANTICS",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Numerical quantity missing unit."
+        ))
+
+
+def on_quantity_columns(context, columns, violations):
+    for key in columns.offending_keys(columns.unit_id == columns.UNIT_NONE):
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S16-NUMERICAL-SEMANTICS",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Numerical quantity missing unit."
+        ))
+
+
 def check(context):
     violations = []
 
     for key, q in context.quantities.items():
-        if q.unit is None:
-            violations.append({
-                "severity": "ERROR",
-                "rule": "AXIOM-S16-NUMERICAL-SEMANTICS",
-                "axiom": "S16",
-                "path": key,
-                "message": "Numerical quantity missing unit."
-            })
+        on_quantity(context, key, q, violations)
 
     return violations
@@ -16,6 +16,9 @@ Rationale:
 Implicit casting is silent degradation.
 """
 
+SECTIONS = ()
+
+
 def check(context):
     # Implicit casting cannot occur in SemanticContext
     return []
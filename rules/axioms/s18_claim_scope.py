@@ -17,6 +17,9 @@ Rationale:
 Claims outside scope are invalid.
 """
 
+SECTIONS = ()
+
+
 def check(context):
     # Claims live outside lint input; profile enforcement only
     return []
@@ -13,11 +13,55 @@ and which are destroyed.
 Violation Conditions:
 - Undeclared degradation
 - Silent preprocessing
+- A distinction declared both preserved and destroyed
+- A distinction destroyed upstream declared preserved downstream
+  by a transformation other than a declared reconstruction
 
 Rationale:
 WorldSeed is defined in terms of distinguishability.
 """
 
+from engine.report import violation
+
+SECTIONS = ("degradation",)
+
+
+def _violation(path: str, message: str) -> tuple:
+    return violation(
+        severity="ERROR",
+        rule="AXIOM-S19-DISTINGUISHABILITY",
+        axiom="S19",
+        path=path,
+        message=message
+    )
+
+
 def check(context):
-    # Enforced structurally via degradation_graph
-    return []
+    violations = []
+
+    graph = context.degradation_graph
+    for e, edge in enumerate(graph.edges):
+        path = f"degradation[{edge.source}->{edge.target}]"
+        if edge.destroyed_distinctions is None:
+            violations.append(_violation(f"{path}.destroyed", "Transformation MUST declare destroyed distinctions."))
+        if edge.preserved_distinctions is None:
+            violations.append(_violation(f"{path}.preserved", "Transformation MUST declare preserved distinctions."))
+
+        for d in graph.names(graph.preserved_bits[e] & graph.destroyed_bits[e]):
+            violations.append(_violation(
+                f"{path}.preserved",
+                f"Distinction '{d}' is declared both preserved and destroyed."
+            ))
+
+    for e, bits in graph.reappearances():
+        edge = graph.edges[e]
+        source = graph.edge_source[e]
+        for d in graph.names(bits):
+            origin = graph.edges[graph.destroyed_by(graph.distinction_ids[d], source)]
+            violations.append(_violation(
+                f"degradation[{edge.source}->{edge.target}].preserved",
+                f"Distinction '{d}' destroyed by degradation[{origin.source}->{origin.target}] "
+                "MUST NOT reappear."
+            ))
+
+    return violations
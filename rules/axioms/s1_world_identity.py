@@ -22,27 +22,32 @@ This rule introduces NO new semantics.
 
 import re
 
+from engine.report import violation
+
+SECTIONS = ("world",)
+
+
 def check(context):
     violations = []
 
     if not context.world.id:
-        violations.append({
-            "severity": "ERROR",
-            "rule": "AXIOM-S1-WORLD-IDENTITY",
-            "axiom": "S1",
-            "path": "world.id",
-            "message": "world.id MUST be non-empty."
-        })
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S1-WORLD-IDENTITY",
+            axiom="S1",
+            path="world.id",
+            message="world.id MUST be non-empty."
+        ))
     else:
         # Check if world.id is a valid UUID format
         uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
         if not re.match(uuid_pattern, context.world.id, re.IGNORECASE):
-            violations.append({
-                "severity": "ERROR",
-                "rule": "AXIOM-S1-WORLD-IDENTITY",
-                "axiom": "S1",
-                "path": "world.id",
-                "message": "world.id MUST be a valid UUID format."
-            })
+            violations.append(violation(
+                severity="ERROR",
+                rule="AXIOM-S1-WORLD-IDENTITY",
+                axiom="S1",
+                path="world.id",
+                message="world.id MUST be a valid UUID format."
+            ))
 
     return violations
@@ -17,6 +17,9 @@ Rationale:
 Observation is a readout operator, not part of world state.
 """
 
+SECTIONS = ()
+
+
 def check(context):
     violations = []
 
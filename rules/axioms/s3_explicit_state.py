@@ -16,16 +16,21 @@ Rationale:
 Implicit state collapses distinguishability.
 """
 
+from engine.report import violation
+
+SECTIONS = ("ontology",)
+
+
 def check(context):
     violations = []
 
     if not context.ontology.entities:
-        violations.append({
-            "severity": "ERROR",
-            "rule": "AXIOM-S3-EXPLICIT-STATE",
-            "axiom": "S3",
-            "path": "ontology.entities",
-            "message": "Ontology MUST declare at least one state entity."
-        })
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S3-EXPLICIT-STATE",
+            axiom="S3",
+            path="ontology.entities",
+            message="Ontology MUST declare at least one state entity."
+        ))
 
     return violations
@@ -15,6 +15,9 @@ Rationale:
 Undeclared change is indistinguishable from hidden intervention.
 """
 
+SECTIONS = ()
+
+
 def check(context):
     violations = []
 
@@ -16,16 +16,22 @@ Rationale:
 Incomplete action declaration breaks causal accounting.
 """
 
+from engine.report import violation
+
+PROFILES = ("L1", "L2", "L3")
+SECTIONS = ("actions",)
+
+
 def check(context):
     violations = []
 
     if context.profile in ("L1", "L2", "L3") and not context.actions:
-        violations.append({
-            "severity": "ERROR",
-            "rule": "AXIOM-S5-ACTION-COMPLETENESS",
-            "axiom": "S5",
-            "path": "actions",
-            "message": "Profile requires at least one declared action."
-        })
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S5-ACTION-COMPLETENESS",
+            axiom="S5",
+            path="actions",
+            message="Profile requires at least one declared action."
+        ))
 
     return violations
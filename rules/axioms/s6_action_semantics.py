@@ -18,26 +18,35 @@ Rationale:
 Action semantics define causal meaning.
 """
 
+from engine.report import violation
+
+SECTIONS = ("actions",)
+
+
+def on_action(context, name, action, violations):
+    for pname, q in action.parameters.items():
+        if not q.unit:
+            violations.append(violation(
+                severity="ERROR",
+                rule="AXIOM-S6-ACTION-SEMANTICS",
+                axiom="S6",
+                path=f"actions[{name}].parameters[{pname}].unit",
+                message="Action parameter missing unit."
+            ))
+        if q.provenance is None:
+            violations.append(violation(
+                severity="ERROR",
+                rule="AXIOM-S6-ACTION-SEMANTICS",
+                axiom="S6",
+                path=f"actions[{name}].parameters[{pname}].provenance",
+                message="Action parameter missing provenance."
+            ))
+
+
 def check(context):
     violations = []
 
     for name, action in context.actions.items():
-        for pname, q in action.parameters.items():
-            if not q.unit:
-                violations.append({
-                    "severity": "ERROR",
-                    "rule": "AXIOM-S6-ACTION-SEMANTICS",
-                    "axiom": "S6",
-                    "path": f"actions[{name}].parameters[{pname}].unit",
-                    "message": "Action parameter missing unit."
-                })
-            if q.provenance is None:
-                violations.append({
-                    "severity": "ERROR",
-                    "rule": "AXIOM-S6-ACTION-SEMANTICS",
-                    "axiom": "S6",
-                    "path": f"actions[{name}].parameters[{pname}].provenance",
-                    "message": "Action parameter missing provenance."
-                })
+        on_action(context, name, action, violations)
 
     return violations
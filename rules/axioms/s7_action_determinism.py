@@ -16,17 +16,26 @@ Rationale:
 Undeclared randomness is hidden noise.
 """
 
+from engine.report import violation
+
+SECTIONS = ("actions",)
+
+
+def on_action(context, name, action, violations):
+    if action.stochastic not in (True, False):
+        violations.append(violation(
+            severity="ERROR",
+            rule="AXIOM-S7-ACTION-DETERMINISM",
+            axiom="S7",
+            path=f"actions[{name}].stochastic",
+            message="Action stochasticity MUST be explicitly declared."
+        ))
+
+
 def check(context):
     violations = []
 
     for name, action in context.actions.items():
-        if action.stochastic not in (True, False):
-            violations.append({
-                "severity": "ERROR",
-                "rule": "AXIOM-S7-ACTION-DETERMINISM",
-                "axiom": "S7",
-                "path": f"actions[{name}].stochastic",
-                "message": "Action stochasticity MUST be explicitly declared."
-            })
+        on_action(context, name, action, violations)
 
     return violations
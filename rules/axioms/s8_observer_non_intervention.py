@@ -15,6 +15,9 @@ Rationale:
 Measurement is not intervention.
 """
 
+SECTIONS = ()
+
+
 def check(context):
     # SemanticContext forbids mutation paths
     return []
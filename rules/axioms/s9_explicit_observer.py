@@ -16,15 +16,21 @@ Rationale:
 Implicit observers erase world–measurement boundary.
 """
 
+from engine.report import violation
+
+PROFILES = ("L2", "L3")
+SECTIONS = ("observers",)
+
+
 def check(context):
     violations = []
 
     if context.profile in ("L2", "L3") and not context.observers:
-        violations.append({
-            "rule": "AXIOM-S9-EXPLICIT-OBSERVER",
-            "axiom": "S9",
-            "path": "observers",
-            "message": "Profile requires explicit observers."
-        })
+        violations.append(violation(
+            rule="AXIOM-S9-EXPLICIT-OBSERVER",
+            axiom="S9",
+            path="observers",
+            message="Profile requires explicit observers."
+        ))
 
     return violations
@@ -7,16 +7,35 @@ Validates that:
 - Provenance chains are not contradictory.
 """
 
+from engine.report import violation
+
+SECTIONS = ("quantities",)
+
+
+def on_quantity(context, key, q, violations):
+    if not q.provenance:
+        violations.append(violation(
+            rule="CONSISTENCY-PROVENANCE-MISSING",
+            axiom="S6",
+            path=context.symbols.render(key),
+            message="Quantity MUST declare provenance."
+        ))
+
+
+def on_quantity_columns(context, columns, violations):
+    for key in columns.offending_keys(~columns.provenance_present):
+        violations.append(violation(
+            rule="CONSISTENCY-PROVENANCE-MISSING",
+            axiom="S6",
+            path=context.symbols.render(key),
+            message="Quantity MUST declare provenance."
+        ))
+
+
 def check(context):
     violations = []
 
     for key, q in context.quantities.items():
-        if not q.provenance:
-            violations.append({
-                "rule": "CONSISTENCY-PROVENANCE-MISSING",
-                "axiom": "S6",
-                "path": key,
-                "message": "Quantity MUST declare provenance."
-            })
+        on_quantity(context, key, q, violations)
 
     return violations
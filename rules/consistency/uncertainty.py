@@ -7,25 +7,54 @@ Validates that:
 - Zero uncertainty is not declared for measured quantities.
 """
 
+from engine.report import violation
+
+SECTIONS = ("quantities",)
+
+
+def on_quantity(context, key, q, violations):
+    if isinstance(q.uncertainty, (int, float)):
+        if q.uncertainty < 0:
+            violations.append(violation(
+                rule="CONSISTENCY-UNCERTAINTY-NEGATIVE",
+                axiom="S16",
+                path=context.symbols.render(key),
+                message="Uncertainty MUST be non-negative."
+            ))
+
+    if q.value == "unknown" and q.uncertainty not in ("unknown", None):
+        violations.append(violation(
+            rule="CONSISTENCY-UNCERTAINTY-VALUE-CONFLICT",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Unknown value MUST NOT imply precise uncertainty."
+        ))
+
+
+def on_quantity_columns(context, columns, violations):
+    negative = columns.uncertainty_numeric & (columns.uncertainty < 0)
+    for key in columns.offending_keys(negative):
+        violations.append(violation(
+            rule="CONSISTENCY-UNCERTAINTY-NEGATIVE",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Uncertainty MUST be non-negative."
+        ))
+
+    conflict = columns.value_unknown & ~(columns.uncertainty_unknown | columns.uncertainty_none)
+    for key in columns.offending_keys(conflict):
+        violations.append(violation(
+            rule="CONSISTENCY-UNCERTAINTY-VALUE-CONFLICT",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Unknown value MUST NOT imply precise uncertainty."
+        ))
+
+
 def check(context):
     violations = []
 
     for key, q in context.quantities.items():
-        if isinstance(q.uncertainty, (int, float)):
-            if q.uncertainty < 0:
-                violations.append({
-                    "rule": "CONSISTENCY-UNCERTAINTY-NEGATIVE",
-                    "axiom": "S16",
-                    "path": key,
-                    "message": "Uncertainty MUST be non-negative."
-                })
-
-        if q.value == "unknown" and q.uncertainty not in ("unknown", None):
-            violations.append({
-                "rule": "CONSISTENCY-UNCERTAINTY-VALUE-CONFLICT",
-                "axiom": "S16",
-                "path": key,
-                "message": "Unknown value MUST NOT imply precise uncertainty."
-            })
+        on_quantity(context, key, q, violations)
 
     return violations
@@ -5,24 +5,71 @@ Validates that:
 - Units are compatible across related quantities.
 - No implicit unit conversion occurs.
 
+Related quantities share a semantic identity: the same-named
+parameter of different actions. Their units are compared by
+dimension (see engine.units): "m/s" and "km/h" are compatible,
+"meter" and "second" conflict. Opaque units are not compared.
+
+The reference dimension of an identity is the one most of its
+quantities declare (the smallest dimension vector among equally
+common ones), and its reference unit is the smallest unit text of
+that dimension. Every quantity of another dimension is reported.
+The result does not depend on declaration order.
+
 Violations may invalidate compliance.
 """
 
+from engine.report import violation
+from engine.symbols import ACTION_PARAMETER
+from engine.units import dimension_of, format_dimension
+
+SECTIONS = ("quantities",)
+
+
 def check(context):
     violations = []
 
-    seen = {}
+    # Parameter symbol -> dimension -> [(key, unit)]
+    declared = {}
+    # Unit text -> dimension (None if opaque), for this run
+    dimensions = {}
 
     for key, q in context.quantities.items():
-        if key in seen:
-            if seen[key] != q.unit:
-                violations.append({
-                    "rule": "CONSISTENCY-UNIT-MISMATCH",
-                    "axiom": "S16",
-                    "path": key,
-                    "message": "Same quantity declared with conflicting units."
-                })
-        else:
-            seen[key] = q.unit
+        unit = q.unit
+        if key[0] != ACTION_PARAMETER or type(unit) is not str:
+            continue
+
+        try:
+            dimension = dimensions[unit]
+        except KeyError:
+            dimension = dimensions[unit] = dimension_of(unit)
+        if dimension is None:
+            continue
+
+        by_dimension = declared.get(key[2])
+        if by_dimension is None:
+            by_dimension = declared[key[2]] = {}
+        by_dimension.setdefault(dimension, []).append((key, unit))
+
+    for by_dimension in declared.values():
+        if len(by_dimension) < 2:
+            continue
+
+        reference = min(by_dimension, key=lambda d: (-len(by_dimension[d]), d))
+        ref_unit = min(unit for _, unit in by_dimension[reference])
+        for dimension, quantities in by_dimension.items():
+            if dimension == reference:
+                continue
+            for key, unit in quantities:
+                violations.append(violation(
+                    rule="CONSISTENCY-UNIT-MISMATCH",
+                    axiom="S16",
+                    path=context.symbols.render(key),
+                    message=(
+                        f"Same quantity declared with conflicting units: {unit!r} "
+                        f"({format_dimension(dimension)}) and {ref_unit!r} "
+                        f"({format_dimension(reference)})."
+                    )
+                ))
 
     return violations
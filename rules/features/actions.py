@@ -15,16 +15,25 @@ This module validates that actions:
 - and declare stochasticity when applicable.
 """
 
+from engine.report import violation
+
+SECTIONS = ("actions",)
+
+
+def on_action(context, name, action, violations):
+    if not action.parameters:
+        violations.append(violation(
+            rule="FEATURE-ACTION-PARAMETERS",
+            axiom="S5",
+            path=f"actions[{name}].parameters",
+            message="Action MUST declare at least one parameter."
+        ))
+
+
 def check(context):
     violations = []
 
     for name, action in context.actions.items():
-        if not action.parameters:
-            violations.append({
-                "rule": "FEATURE-ACTION-PARAMETERS",
-                "axiom": "S5",
-                "path": f"actions[{name}].parameters",
-                "message": "Action MUST declare at least one parameter."
-            })
+        on_action(context, name, action, violations)
 
     return violations
@@ -12,17 +12,26 @@ This module validates that degradation
 and irreversibility are explicit and auditable.
 """
 
+from engine.report import violation
+
+SECTIONS = ("degradation",)
+
+
+def on_edge(context, edge, violations):
+    if edge.irreversible and not edge.destroyed_distinctions:
+        violations.append(violation(
+            rule="FEATURE-IRREVERSIBILITY",
+            axiom="S14",
+            path=f"degradation[{edge.source}->{edge.target}]",
+            message="Irreversible operation MUST declare destroyed distinctions."
+        ))
+
+
 def check(context):
     violations = []
 
     graph = context.degradation_graph
     for edge in graph.edges:
-        if edge.irreversible and not edge.destroyed_distinctions:
-            violations.append({
-                "rule": "FEATURE-IRREVERSIBILITY",
-                "axiom": "S14",
-                "path": f"degradation[{edge.source}->{edge.target}]",
-                "message": "Irreversible operation MUST declare destroyed distinctions."
-            })
+        on_edge(context, edge, violations)
 
     return violations
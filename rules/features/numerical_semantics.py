@@ -12,24 +12,52 @@ This module validates physical meaning
 of numerical representations.
 """
 
+from engine.report import violation
+
+SECTIONS = ("quantities",)
+
+
+def on_quantity(context, key, q, violations):
+    if q.unit is None or q.unit == "":
+        violations.append(violation(
+            rule="FEATURE-NUMERICAL-UNIT",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Numerical quantity MUST declare unit."
+        ))
+
+    if q.uncertainty is None:
+        violations.append(violation(
+            rule="FEATURE-NUMERICAL-UNCERTAINTY",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Numerical quantity MUST declare uncertainty."
+        ))
+
+
+def on_quantity_columns(context, columns, violations):
+    missing_unit = (columns.unit_id == columns.UNIT_NONE) | (columns.unit_id == columns.UNIT_EMPTY)
+    for key in columns.offending_keys(missing_unit):
+        violations.append(violation(
+            rule="FEATURE-NUMERICAL-UNIT",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Numerical quantity MUST declare unit."
+        ))
+
+    for key in columns.offending_keys(columns.uncertainty_none):
+        violations.append(violation(
+            rule="FEATURE-NUMERICAL-UNCERTAINTY",
+            axiom="S16",
+            path=context.symbols.render(key),
+            message="Numerical quantity MUST declare uncertainty."
+        ))
+
+
 def check(context):
     violations = []
 
     for key, q in context.quantities.items():
-        if q.unit is None or q.unit == "":
-            violations.append({
-                "rule": "FEATURE-NUMERICAL-UNIT",
-                "axiom": "S16",
-                "path": key,
-                "message": "Numerical quantity MUST declare unit."
-            })
-
-        if q.uncertainty is None:
-            violations.append({
-                "rule": "FEATURE-NUMERICAL-UNCERTAINTY",
-                "axiom": "S16",
-                "path": key,
-                "message": "Numerical quantity MUST declare uncertainty."
-            })
+        on_quantity(context, key, q, violations)
 
     return violations
@@ -18,16 +18,25 @@ This module validates that observers:
 Violations invalidate WorldSeed compliance.
 """
 
+from engine.report import violation
+
+SECTIONS = ("observers",)
+
+
+def on_observer(context, name, obs, violations):
+    if obs.operator is None:
+        violations.append(violation(
+            rule="FEATURE-OBSERVER-OPERATOR",
+            axiom="S11",
+            path=f"observers[{name}].operator",
+            message="Observer MUST declare an operator."
+        ))
+
+
 def check(context):
     violations = []
 
     for name, obs in context.observers.items():
-        if obs.operator is None:
-            violations.append({
-                "rule": "FEATURE-OBSERVER-OPERATOR",
-                "axiom": "S11",
-                "path": f"observers[{name}].operator",
-                "message": "Observer MUST declare an operator."
-            })
+        on_observer(context, name, obs, violations)
 
     return violations
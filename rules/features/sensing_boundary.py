@@ -12,16 +12,25 @@ This module validates correct declaration
 and respect of sensing boundaries.
 """
 
+from engine.report import violation
+
+SECTIONS = ("observers",)
+
+
+def on_observer(context, name, obs, violations):
+    if obs.boundary is None:
+        violations.append(violation(
+            rule="FEATURE-SENSING-BOUNDARY",
+            axiom="S12",
+            path=f"observers[{name}].boundary",
+            message="Observer MUST declare sensing boundary."
+        ))
+
+
 def check(context):
     violations = []
 
     for name, obs in context.observers.items():
-        if obs.boundary is None:
-            violations.append({
-                "rule": "FEATURE-SENSING-BOUNDARY",
-                "axiom": "S12",
-                "path": f"observers[{name}].boundary",
-                "message": "Observer MUST declare sensing boundary."
-            })
+        on_observer(context, name, obs, violations)
 
     return violations
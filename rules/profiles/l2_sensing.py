@@ -8,25 +8,39 @@ Enforces:
 - Uncertainty declaration
 """
 
-def check(context):
-    violations = []
+from engine.report import violation
+
+PROFILES = ("L2",)
+SECTIONS = ("observers",)
 
+
+def on_world(context, violations):
     if context.profile == "L2":
         if not context.observers:
-            violations.append({
-                "rule": "PROFILE-L2-OBSERVERS",
-                "axiom": "S9",
-                "path": "observers",
-                "message": "L2 profile requires observers."
-            })
-
-        for name, obs in context.observers.items():
-            if obs.boundary is None:
-                violations.append({
-                    "rule": "PROFILE-L2-BOUNDARY",
-                    "axiom": "S12",
-                    "path": f"observers[{name}].boundary",
-                    "message": "L2 observers MUST declare sensing boundary."
-                })
+            violations.append(violation(
+                rule="PROFILE-L2-OBSERVERS",
+                axiom="S9",
+                path="observers",
+                message="L2 profile requires observers."
+            ))
+
+
+def on_observer(context, name, obs, violations):
+    if context.profile == "L2":
+        if obs.boundary is None:
+            violations.append(violation(
+                rule="PROFILE-L2-BOUNDARY",
+                axiom="S12",
+                path=f"observers[{name}].boundary",
+                message="L2 observers MUST declare sensing boundary."
+            ))
+
+
+def check(context):
+    violations = []
+
+    on_world(context, violations)
+    for name, obs in context.observers.items():
+        on_observer(context, name, obs, violations)
 
     return violations
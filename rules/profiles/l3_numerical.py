@@ -7,17 +7,38 @@ Enforces:
 - Explicit irreversibility
 """
 
+from engine.report import violation
+
+PROFILES = ("L3",)
+SECTIONS = ("quantities",)
+
+
+def on_quantity(context, key, q, violations):
+    if context.profile == "L3":
+        if q.uncertainty == "unknown":
+            violations.append(violation(
+                rule="PROFILE-L3-UNCERTAINTY",
+                axiom="S16",
+                path=context.symbols.render(key),
+                message="L3 profile requires explicit numerical uncertainty."
+            ))
+
+
+def on_quantity_columns(context, columns, violations):
+    if context.profile == "L3":
+        for key in columns.offending_keys(columns.uncertainty_unknown):
+            violations.append(violation(
+                rule="PROFILE-L3-UNCERTAINTY",
+                axiom="S16",
+                path=context.symbols.render(key),
+                message="L3 profile requires explicit numerical uncertainty."
+            ))
+
+
 def check(context):
     violations = []
 
-    if context.profile == "L3":
-        for key, q in context.quantities.items():
-            if q.uncertainty == "unknown":
-                violations.append({
-                    "rule": "PROFILE-L3-UNCERTAINTY",
-                    "axiom": "S16",
-                    "path": key,
-                    "message": "L3 profile requires explicit numerical uncertainty."
-                })
+    for key, q in context.quantities.items():
+        on_quantity(context, key, q, violations)
 
     return violations
@@ -35,5 +35,32 @@ INVALID_WORLDS = [
                 }
             }
         ]
+    },
+    # Destroyed distinctions implicitly reconstructed (S15, S19)
+    {
+        "version": "1.0.0",
+        "profile": "L0",
+        "world": {
+            "id": "550e8400-e29b-41d4-a716-446655440000"
+        },
+        "ontology": {
+            "entities": ["pressure"]
+        },
+        "degradation": [
+            {
+                "source": "raw_audio",
+                "target": "mp3_audio",
+                "irreversible": True,
+                "destroyed": ["ultrasonic content"],
+                "preserved": ["speech content"]
+            },
+            {
+                "source": "mp3_audio",
+                "target": "raw_audio",
+                "irreversible": False,
+                "destroyed": [],
+                "preserved": ["speech content", "ultrasonic content"]
+            }
+        ]
     }
 ]
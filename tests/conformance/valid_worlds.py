@@ -52,5 +52,54 @@ VALID_WORLDS = [
                 }
             }
         ]
+    },
+    # Declared degradation pipeline with an explicit reconstruction
+    {
+        "version": "1.0.0",
+        "profile": "L1",
+        "world": {
+            "id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+        },
+        "ontology": {
+            "entities": ["image"]
+        },
+        "actions": [
+            {
+                "name": "capture",
+                "parameters": {
+                    "exposure": {
+                        "value": 0.01,
+                        "unit": "second",
+                        "uncertainty": 0.001,
+                        "provenance": "control"
+                    }
+                },
+                "stochastic": False
+            }
+        ],
+        "degradation": [
+            {
+                "source": "raw_image",
+                "target": "jpeg_image",
+                "irreversible": True,
+                "destroyed": ["sensor noise floor"],
+                "preserved": ["edges", "fine texture"]
+            },
+            {
+                "source": "jpeg_image",
+                "target": "thumbnail",
+                "irreversible": True,
+                "destroyed": ["fine texture"],
+                "preserved": ["edges"]
+            },
+            {
+                "source": "thumbnail",
+                "target": "upscaled_image",
+                "irreversible": False,
+                "destroyed": [],
+                "preserved": ["edges", "fine texture"],
+                "reconstruction": True
+            }
+        ]
     }
 ]
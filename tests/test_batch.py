@@ -0,0 +1,67 @@
+"""
+WorldSeed Lint Batch Mode Tests
+
+Status: Normative
+Scope: Multi-manifest invocation
+
+Verifies that batch mode:
+- emits exactly one ABI report per manifest,
+- preserves input order,
+- reports listfiles that cannot be expanded as BLOCKED,
+- and derives the aggregate exit code from the worst verdict.
+"""
+
+import json
+import os
+
+from cli.batch import expand_inputs, run_batch
+from cli.main import lint_path
+
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples")
+VALID = os.path.join(EXAMPLES, "valid_world.json")
+INVALID = os.path.join(EXAMPLES, "invalid_world.json")
+
+
+def test_expand_inputs(tmp_path):
+    listfile = tmp_path / "list.txt"
+    listfile.write_text(f"{INVALID}\n\n{VALID}\n")
+
+    paths = expand_inputs([VALID, f"@{listfile}", EXAMPLES])
+
+    assert paths[:3] == [VALID, INVALID, VALID]
+    assert [os.path.basename(p) for p in paths[3:]] == ["invalid_world.json", "valid_world.json"]
+
+
+def test_batch_order_and_exit_code(tmp_path, capsys):
+    missing = str(tmp_path / "missing.json")
+    inputs = [INVALID, VALID, missing, VALID]
+
+    exit_code = run_batch(inputs, max_workers=2)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert exit_code == 2
+    assert [json.loads(line)["manifest"] for line in lines] == inputs
+    for path, line in zip(inputs, lines):
+        assert json.loads(line)["report"] == lint_path(path)
+
+
+def test_unexpandable_listfiles_are_blocked(tmp_path, capsys):
+    binary = tmp_path / "binary.txt"
+    binary.write_bytes(b"\xff\xfe\n")
+    own = tmp_path / "self.txt"
+    own.write_text(f"{VALID}\n@{own}\n")
+    inputs = [f"@{tmp_path}", f"@{binary}", f"@{own}"]
+
+    failures = {}
+    paths = expand_inputs(inputs, failures)
+    assert paths == [f"@{tmp_path}", f"@{binary}", VALID, f"@{own}"]
+    assert sorted(failures) == sorted([f"@{tmp_path}", f"@{binary}", f"@{own}"])
+
+    assert run_batch(inputs, max_workers=2) == 2
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["manifest"] for line in lines] == paths
+    assert lines[2]["report"] == lint_path(VALID)
+    for line in lines[:2] + lines[3:]:
+        assert line["report"]["verdict"] == "BLOCKED"
+        assert [v["rule"] for v in line["report"]["violations"]] == ["CLI-IO-ERROR"]
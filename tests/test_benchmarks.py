@@ -0,0 +1,51 @@
+"""
+WorldSeed Lint Benchmark Suite Tests
+
+Status: Informative
+Scope: Synthetic worlds and regression detection
+
+Verifies that:
+- generated worlds are deterministic, schema-valid and compliant
+  at a violation density of 0,
+- defects are injected at the requested density,
+- and only slowdowns past both thresholds are regressions.
+"""
+
+import pytest
+
+from benchmarks.suite import find_regressions
+from benchmarks.worlds import PROFILES, generate_world
+from engine import compile_plan
+from engine.report import generate_report
+from engine.schema_check import check_schema
+from engine.semantic_context import SemanticContext
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_generated_worlds(profile):
+    plan = compile_plan(("axioms", "features", "consistency"))
+    size = dict(actions=40, parameters=5, observers=10, edges=20, profile=profile, seed=7)
+
+    world = generate_world(**size)
+    assert world == generate_world(**size)
+    assert check_schema(world) == []
+    assert generate_report(plan.run(SemanticContext(world)))["verdict"] == "COMPLIANT"
+
+    defective = generate_world(density=0.2, **size)
+    assert len(plan.run(SemanticContext(defective))) > 0
+    assert generate_world(density=0.2, **dict(size, seed=8)) != defective
+
+
+def test_regressions_need_relative_and_absolute_slowdown():
+    def run(**seconds):
+        return {"machine": "m", "python": "3", "results": {"k": {"seconds": seconds}}}
+
+    history = {"format": 1, "runs": [run(load=1.0, rules=0.010), run(load=1.2, rules=0.011)]}
+
+    assert find_regressions(history, run(load=1.2, rules=0.014), 0.25, 5) == []
+    assert find_regressions(history, run(load=1.3, rules=0.020), 0.25, 5) == [
+        {"scenario": "k", "phase": "load", "baseline": 1.0, "seconds": 1.3},
+        {"scenario": "k", "phase": "rules", "baseline": 0.010, "seconds": 0.020},
+    ]
+    assert find_regressions(history, run(load=1.3, rules=0.010), 0.25, 1) == []
+    assert find_regressions(history, dict(run(load=9.0, rules=9.0), machine="n"), 0.25, 5) == []
@@ -0,0 +1,88 @@
+"""
+WorldSeed Lint Report Cache Tests
+
+Status: Normative
+Scope: Content-addressed report reuse
+
+Verifies that:
+- cache hits are byte-identical to fresh runs and run no rules,
+- keys depend on content only, within one engine and rule set,
+- and eviction bounds the cache size.
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import cli.main
+from cli.cache import ReportCache
+from cli.main import main
+from engine import compile_plan, rule_plan
+
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples")
+INVALID = os.path.join(EXAMPLES, "invalid_world.json")
+
+
+def _run(argv, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    return exc.value.code, capsys.readouterr().out
+
+
+def test_cache_hit_is_byte_identical(tmp_path, capsys, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+
+    fresh = _run(["--no-cache", INVALID], capsys)
+    miss = _run(["--cache-dir", cache_dir, INVALID], capsys)
+
+    def no_context(manifest):
+        raise AssertionError("cache hit built a SemanticContext")
+
+    monkeypatch.setattr(cli.main, "SemanticContext", no_context)
+    hit = _run(["--cache-dir", cache_dir, INVALID], capsys)
+
+    assert fresh == miss == hit
+    assert fresh[0] == 1
+
+
+def test_key_ignores_layout(tmp_path):
+    cache = ReportCache(str(tmp_path))
+    with open(INVALID) as f:
+        manifest = json.load(f)
+    reordered = json.loads(json.dumps(dict(reversed(list(manifest.items()))), indent=4))
+
+    assert cache.key(manifest) == cache.key(reordered)
+    assert cache.key(manifest) != cache.key({**manifest, "profile": "L3"})
+
+
+def test_key_depends_on_engine_sources(tmp_path, monkeypatch):
+    engine_dir = os.path.dirname(rule_plan.__file__)
+    for name in os.listdir(engine_dir):
+        if name.endswith(".py"):
+            shutil.copy(os.path.join(engine_dir, name), tmp_path / name)
+    monkeypatch.setattr(rule_plan, "__file__", str(tmp_path / "rule_plan.py"))
+    with open(INVALID) as f:
+        manifest = json.load(f)
+
+    key = ReportCache(str(tmp_path), compile_plan()).key(manifest)
+    assert ReportCache(str(tmp_path), compile_plan()).key(manifest) == key
+    with open(tmp_path / "semantic_context.py", "a") as f:
+        f.write("\n# changed\n")
+    assert ReportCache(str(tmp_path), compile_plan()).key(manifest) != key
+
+
+def test_eviction_bounds_size(tmp_path):
+    cache = ReportCache(str(tmp_path), max_bytes=1000)
+    for i in range(10):
+        key = cache.key({"n": i})
+        cache.put(key, "x" * 300)
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    cache.evict()
+
+    sizes = [os.path.getsize(os.path.join(root, name))
+             for root, dirs, files in os.walk(tmp_path) for name in files]
+    assert sum(sizes) <= 1000
+    assert cache.get(cache.key({"n": 9})) == "x" * 300
@@ -0,0 +1,55 @@
+"""
+WorldSeed Lint Daemon Tests
+
+Status: Normative
+Scope: Lint server and thin client
+
+Verifies that reports served by the daemon are identical to
+direct invocations, and that an unreachable server yields BLOCKED.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from cli.daemon import request
+from cli.main import lint_path, main
+
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+EXAMPLES = os.path.join(ROOT, "examples")
+
+
+@pytest.fixture
+def server(tmp_path):
+    socket_path = str(tmp_path / "lint.sock")
+    proc = subprocess.Popen([sys.executable, "-m", "cli.main", "serve", socket_path], cwd=ROOT)
+    try:
+        for _ in range(200):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+        yield socket_path
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def test_served_reports_match_direct(server):
+    for name in ("valid_world.json", "invalid_world.json", "missing.json"):
+        path = os.path.join(EXAMPLES, name)
+        assert request(server, path) == lint_path(path)
+        assert request(server, path, stream=True) == lint_path(path, stream=True)
+
+
+def test_unreachable_server_is_blocked(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--connect", str(tmp_path / "none.sock"), os.path.join(EXAMPLES, "valid_world.json")])
+    assert exc.value.code == 2
+    report = json.loads(capsys.readouterr().out)
+    assert report["verdict"] == "BLOCKED"
+    assert report["violations"][0]["rule"] == "CLI-IO-ERROR"
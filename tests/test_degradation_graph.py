@@ -0,0 +1,179 @@
+"""
+WorldSeed Lint Degradation Graph Tests
+
+Status: Normative
+Scope: Declared degradation semantics (S14, S15, S19)
+
+Verifies that:
+- adjacency groups every edge under its source and its target,
+- strongly connected components are numbered in reverse
+  topological order, also on pipelines too deep for recursion,
+- S14, S15 and S19 report exactly the declared defects,
+- reachability indexes agree with path search, with either labelling,
+- and destroyed distinctions propagate exactly along implicit paths.
+"""
+
+import random
+
+import pytest
+
+from engine import degradation_graph, run_axiom_rules
+from engine.degradation_graph import ALL_EDGES, IMPLICIT_EDGES, IRREVERSIBLE_EDGES
+from engine.semantic_context import SemanticContext
+
+
+def _context(transformations):
+    return SemanticContext({
+        "version": "1.0.0",
+        "profile": "L0",
+        "world": {"id": "550e8400-e29b-41d4-a716-446655440000"},
+        "ontology": {"entities": ["signal"]},
+        "degradation": transformations
+    })
+
+
+def _edge(source, target, irreversible=True, destroyed=(), preserved=(), **extra):
+    return {"source": source, "target": target, "irreversible": irreversible,
+            "destroyed": list(destroyed), "preserved": list(preserved), **extra}
+
+
+def _findings(context):
+    return sorted(
+        (axiom, path) for _, _, axiom, path, _ in run_axiom_rules(context)
+        if axiom in ("S14", "S15", "S19")
+    )
+
+
+def test_adjacency_and_components():
+    graph = _context([
+        _edge("a", "b"), _edge("b", "c"), _edge("c", "b", irreversible=False),
+        _edge("a", "d"), _edge("d", "c", reconstruction=True)
+    ]).degradation_graph
+
+    assert graph.nodes == ["a", "b", "c", "d"]
+    a, b, c, d = range(4)
+    assert sorted(graph.successors(a)) == [(0, b), (3, d)]
+    assert sorted(graph.predecessors(c)) == [(1, b), (4, d)]
+
+    comp = graph.components(ALL_EDGES)
+    assert comp[b] == comp[c] and len(set(comp)) == 3
+    for e in range(len(graph.edges)):
+        assert comp[graph.edge_source[e]] >= comp[graph.edge_target[e]]
+    assert graph.on_cycle(1, ALL_EDGES) and not graph.on_cycle(1, IRREVERSIBLE_EDGES)
+    assert not graph.on_cycle(0, IMPLICIT_EDGES)
+
+    order = graph.topological_order()
+    assert order.index(a) < order.index(d) < order.index(b)
+
+
+def test_deep_pipeline():
+    n = 50_000
+    transformations = [_edge(f"r{i}", f"r{i + 1}", destroyed=[f"d{i}"]) for i in range(n)]
+    transformations.append(_edge(f"r{n}", "r0", irreversible=False, preserved=["d0"]))
+    context = _context(transformations)
+
+    assert len(set(context.degradation_graph.components())) == 1
+    findings = _findings(context)
+    assert findings.count(("S15", "degradation[r0->r1]")) == 1
+    assert ("S19", f"degradation[r{n}->r0].preserved") in findings
+
+
+def test_declared_degradation_rules():
+    context = _context([
+        _edge("raw", "quantized", destroyed=["lsb"], preserved=["msb"]),
+        _edge("quantized", "restored", irreversible=False, preserved=["lsb"], reconstruction=True),
+        _edge("restored", "copy", irreversible=False, preserved=["lsb"]),
+        _edge("quantized", "filtered", irreversible=False, destroyed=["msb"], preserved=["lsb"]),
+        {"source": "raw", "target": "preview"},
+    ])
+    assert _findings(context) == [
+        ("S14", "degradation[quantized->filtered].irreversible"),
+        ("S14", "degradation[raw->preview].irreversible"),
+        ("S19", "degradation[quantized->filtered].preserved"),
+        ("S19", "degradation[raw->preview].destroyed"),
+        ("S19", "degradation[raw->preview].preserved"),
+    ]
+
+
+def test_reappearances_name_their_origin():
+    context = _context([
+        _edge("raw", "a", destroyed=["phase"], preserved=[]),
+        _edge("raw", "b", destroyed=["phase"], preserved=[]),
+        _edge("b", "c", destroyed=["color"], preserved=[]),
+        _edge("c", "d", irreversible=False, preserved=["phase", "color"]),
+    ])
+    messages = sorted(message for _, _, axiom, _, message in run_axiom_rules(context) if axiom == "S19")
+    assert messages == [
+        "Distinction 'color' destroyed by degradation[b->c] MUST NOT reappear.",
+        "Distinction 'phase' destroyed by degradation[raw->b] MUST NOT reappear.",
+    ]
+
+
+def test_reappearances_match_path_search():
+    rng = random.Random(7)
+    names = [f"x{i}" for i in range(12)]
+    for _ in range(20):
+        transformations = []
+        for _ in range(40):
+            a, b = rng.randrange(15), rng.randrange(15)
+            transformations.append(_edge(
+                f"n{a}", f"n{b}",
+                destroyed=rng.sample(names, rng.randrange(3)),
+                preserved=rng.sample(names, rng.randrange(3)),
+                reconstruction=rng.random() < 0.1
+            ))
+        graph = _context(transformations).degradation_graph
+
+        # Reference: distinctions reaching each node along implicit paths
+        expected = set()
+        for e, edge in enumerate(graph.edges):
+            if edge.reconstruction:
+                continue
+            for origin, start in enumerate(graph.edges):
+                seen, stack = set(), [graph.edge_target[origin]]
+                while stack:
+                    n = stack.pop()
+                    if n in seen:
+                        continue
+                    seen.add(n)
+                    stack.extend(t for f, t in graph.successors(n) if not graph.edges[f].reconstruction)
+                if graph.edge_source[e] in seen:
+                    for d in start.destroyed_distinctions & edge.preserved_distinctions:
+                        expected.add((e, d))
+
+        actual = {(e, d) for e, bits in graph.reappearances() for d in graph.names(bits)}
+        assert actual == expected
+        for e, d in actual:
+            origin = graph.destroyed_by(graph.distinction_ids[d], graph.edge_source[e])
+            assert d in graph.edges[origin].destroyed_distinctions
+
+
+@pytest.mark.parametrize("closure_max", [1 << 12, 0])
+def test_reachability_matches_path_search(monkeypatch, closure_max):
+    monkeypatch.setattr(degradation_graph, "CLOSURE_MAX_COMPONENTS", closure_max)
+    rng = random.Random(11)
+    for _ in range(20):
+        transformations = [
+            _edge(f"n{rng.randrange(40)}", f"n{rng.randrange(40)}",
+                  irreversible=rng.random() < 0.7, reconstruction=rng.random() < 0.2)
+            for _ in range(50)
+        ]
+        graph = _context(transformations).degradation_graph
+
+        for which in (ALL_EDGES, IRREVERSIBLE_EDGES, IMPLICIT_EDGES):
+            selected = graph.selection(which)
+            index = graph.reachability(which)
+            assert graph.reachability(which) is index
+            starts = rng.sample(range(len(graph.nodes)), 3)
+            first = index.first_reaching(starts)
+            for u in range(len(graph.nodes)):
+                reaching = [i for i, n in enumerate(starts) if index.reaches(n, u)]
+                assert first[index.comp[u]] == (reaching[0] if reaching else -1)
+
+                seen, stack = set(), [u]
+                while stack:
+                    n = stack.pop()
+                    if n not in seen:
+                        seen.add(n)
+                        stack.extend(t for f, t in graph.successors(n) if selected[f])
+                assert {v for v in range(len(graph.nodes)) if index.reaches(u, v)} == seen
@@ -0,0 +1,144 @@
+"""
+WorldSeed Lint Incremental Tests
+
+Status: Normative
+Scope: Incremental re-linting
+
+Verifies that, over a sequence of edits, incremental re-linting
+produces exactly the report of a full relint, both in process
+and from a persisted state.
+"""
+
+import copy
+import json
+import os
+
+import pytest
+
+from engine import compile_plan
+from engine.incremental import IncrementalLinter
+from engine.report import generate_report
+from engine.semantic_context import SemanticContext
+from cli.main import main
+
+from tests.test_rule_plan import BROKEN_WORLD
+
+
+ALL_PACKS = ("features", "consistency", "profiles")
+
+
+def _edits():
+    m = copy.deepcopy(BROKEN_WORLD)
+    yield m
+
+    m = copy.deepcopy(m)
+    m["actions"][0]["parameters"]["dx"]["unit"] = "meter"
+    yield m
+
+    m = copy.deepcopy(m)
+    m["actions"].append({"name": "turn", "parameters": {
+        "theta": {"value": 1.0, "unit": "radian", "uncertainty": "unknown", "provenance": "control"}
+    }, "stochastic": False})
+    yield m
+
+    m = copy.deepcopy(m)
+    m["actions"].reverse()
+    yield m
+
+    m = copy.deepcopy(m)
+    m["actions"].insert(0, m["actions"].pop())
+    m["actions"][0]["parameters"]["dx"] = {"value": 2.0, "unit": "second", "uncertainty": 0.1,
+                                           "provenance": "control"}
+    yield m
+
+    m = copy.deepcopy(m)
+    del m["observers"][0]
+    yield m
+
+    m = copy.deepcopy(m)
+    m["actions"].append({"name": "idle", "parameters": {}, "stochastic": 3})
+    yield m
+
+    m = copy.deepcopy(m)
+    m["profile"] = "L2"
+    yield m
+
+    m = copy.deepcopy(m)
+    m["actions"] = []
+    m["observers"] = []
+    yield m
+
+    m = copy.deepcopy(m)
+    m["actions"] = [{"name": "a:b", "parameters": {"c": {"value": 1}}}]
+    yield m
+
+
+def _full_report(plan, manifest):
+    return generate_report(plan.run(SemanticContext(manifest)))
+
+
+@pytest.mark.parametrize("packs", [("axioms",), ALL_PACKS])
+def test_incremental_matches_full(packs):
+    plan = compile_plan(packs, columnar=False)
+    linter = IncrementalLinter(plan)
+
+    for manifest in _edits():
+        assert generate_report(linter.lint(manifest)) == _full_report(plan, manifest)
+
+
+def test_patched_context_matches_full():
+    plan = compile_plan(ALL_PACKS, columnar=False)
+    linter = IncrementalLinter(plan)
+
+    for manifest in _edits():
+        linter.lint(manifest)
+        if linter.context is None:
+            continue
+        full = SemanticContext(manifest)
+        patched = linter.context
+        assert list(patched.actions) == list(full.actions)
+        assert list(patched.observers) == list(full.observers)
+        assert [linter.symbols.render(k) for k in patched.quantities] == \
+            [full.symbols.render(k) for k in full.quantities]
+
+
+def test_units_mismatch_matches_full():
+    plan = compile_plan(("axioms", "consistency"), columnar=False)
+    linter = IncrementalLinter(plan)
+
+    def action(name, unit, provenance="control"):
+        q = {"value": 1.0, "unit": unit, "uncertainty": 0.1, "provenance": provenance}
+        return {"name": name, "parameters": {"x": q}, "stochastic": False}
+
+    m = dict(BROKEN_WORLD, actions=[action("A", "m"), action("B", "s")])
+    edits = [
+        m,
+        dict(m, actions=[action("A", "m", "derived"), action("B", "s")]),
+        dict(m, actions=[action("B", "s"), action("A", "m", "derived")]),
+        dict(m, actions=[action("C", "m"), action("B", "s"), action("A", "m", "derived")]),
+    ]
+    for manifest in edits:
+        assert generate_report(linter.lint(manifest)) == _full_report(plan, manifest)
+
+
+def test_persisted_state_matches_full(tmp_path):
+    plan = compile_plan(ALL_PACKS, columnar=False)
+    state = str(tmp_path / "state.json")
+
+    for manifest in _edits():
+        linter = IncrementalLinter.load(state, plan)
+        assert generate_report(linter.lint(manifest)) == _full_report(plan, manifest)
+        linter.save(state)
+
+
+def test_cli_verify(tmp_path, capsys):
+    manifest = tmp_path / "world.json"
+    state = str(tmp_path / "state.json")
+
+    for m in _edits():
+        manifest.write_text(json.dumps(m))
+        with pytest.raises(SystemExit) as exc:
+            main(["--incremental", state, "--verify", str(manifest)])
+        assert exc.value.code in (0, 1)
+        assert os.path.exists(state)
+    capsys.readouterr()
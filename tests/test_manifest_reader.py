@@ -0,0 +1,96 @@
+"""
+WorldSeed Lint Manifest Reader Tests
+
+Status: Normative
+Scope: Whole-manifest reading and decoding
+
+Verifies that the reader, with and without a fast decoder backend,
+accepts, decodes and rejects exactly as json.load on a UTF-8 file.
+"""
+
+import errno
+import json
+import mmap
+
+import pytest
+
+import engine.manifest_reader as manifest_reader
+import cli.main as cli_main
+from cli.main import lint_path
+from engine.manifest_reader import read_manifest
+
+from tests.conformance.valid_worlds import VALID_WORLDS
+
+
+CASES = [
+    json.dumps(VALID_WORLDS[0], indent=2).encode("utf-8"),
+    b"",
+    b"   ",
+    b"\xef\xbb\xbf{}",
+    b'{"a": "\xff"}',
+    b'{"a": NaN, "b": -Infinity}',
+    b'{"a": 123456789012345678901234567890, "b": -98765432109876543210}',
+    b'{"a": 0.00210605335111069271234, "b": 1e400, "c": 1.5e-400, "d": -0}',
+    b'{"a": "\\ud800", "\\u00e9": "\xc3\xa9"}',
+    b'{"a": 1, "a": 2}',
+    b'{"a": 1} x',
+    b'{"a": [1, 2',
+    b'"\xe2\x82\xac"',
+]
+
+
+def _outcome(fn, path):
+    try:
+        return "value", repr(fn(path))
+    except ValueError as e:
+        return type(e).__name__, str(e)
+
+
+def _json_load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_reader_matches_json_load(tmp_path, monkeypatch, fast):
+    if fast:
+        if manifest_reader.fast_loads() is None:
+            pytest.skip("no fast decoder backend installed")
+        monkeypatch.setattr(manifest_reader, "FAST_DECODE_MIN_BYTES", 0)
+    else:
+        monkeypatch.setattr(manifest_reader, "_probed", True)
+        monkeypatch.setattr(manifest_reader, "_fast_loads", None)
+
+    for i, data in enumerate(CASES):
+        path = tmp_path / f"case{i}.json"
+        path.write_bytes(data)
+        assert _outcome(read_manifest, path) == _outcome(_json_load, path), data
+
+
+def test_wide_integers_are_detected_across_windows(monkeypatch):
+    monkeypatch.setattr(manifest_reader, "_SCAN_CHUNK", 8)
+
+    assert manifest_reader._has_wide_integers(b'{"a": [1, 2], "b": -1234567890123456789}')
+    assert manifest_reader._has_wide_integers(b"1234567890123456789")
+    assert not manifest_reader._has_wide_integers(b'{"a": 0.12345678901234567890123}')
+
+
+def test_read_failures_are_blocked(tmp_path, monkeypatch):
+    def verdict(path):
+        report = lint_path(path)
+        return report["verdict"], [v["rule"] for v in report["violations"]]
+
+    assert verdict(str(tmp_path)) == ("BLOCKED", ["CLI-IO-ERROR"])
+
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps(VALID_WORLDS[0]), encoding="utf-8")
+
+    def failing(*args, **kwargs):
+        raise OSError(errno.EIO, "Input/output error")
+
+    # Unmappable files are read instead
+    monkeypatch.setattr(mmap, "mmap", failing)
+    assert verdict(str(path)) == ("COMPLIANT", [])
+
+    monkeypatch.setattr(cli_main, "read_manifest", failing)
+    assert verdict(str(path)) == ("BLOCKED", ["CLI-IO-ERROR"])
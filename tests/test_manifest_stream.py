@@ -0,0 +1,86 @@
+"""
+WorldSeed Lint Streaming Ingestion Tests
+
+Status: Normative
+Scope: Incremental manifest reading
+
+Verifies that streaming construction:
+- yields exactly the reports of in-memory construction,
+- is independent of the read window size,
+- and rejects exactly the input rejected by json.load.
+"""
+
+import io
+import json
+
+import pytest
+
+import engine.manifest_stream as manifest_stream
+from cli.main import lint_path
+from engine import run_axiom_rules
+from engine.report import generate_report
+from engine.semantic_context import SemanticContext
+
+from tests.conformance.valid_worlds import VALID_WORLDS
+from tests.conformance.invalid_worlds import INVALID_WORLDS
+from tests.test_rule_plan import BROKEN_WORLD
+
+
+def _report(context):
+    return generate_report(run_axiom_rules(context))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_stream_matches_in_memory(monkeypatch, chunk_size):
+    monkeypatch.setattr(manifest_stream, "CHUNK_SIZE", chunk_size)
+
+    for manifest in VALID_WORLDS + INVALID_WORLDS + [BROKEN_WORLD]:
+        for indent in (None, 2):
+            text = json.dumps(manifest, indent=indent)
+            streamed = SemanticContext.from_stream(io.StringIO(text))
+            assert _report(streamed) == _report(SemanticContext(json.loads(text)))
+
+
+def test_repeated_member_replaces_earlier():
+    text = '{"actions": [{"name": "a", "parameters": {}}], "actions": [], "profile": "L1"}'
+    context = SemanticContext.from_stream(io.StringIO(text))
+    assert context.actions == {}
+    assert context.profile == "L1"
+
+
+def test_replaced_member_does_not_affect_result(tmp_path):
+    # Earlier duplicates hold elements that cannot be constructed
+    text = json.dumps(VALID_WORLDS[0])
+    for prefix in ('{"actions": [1, {"name": "x"}], ', '{"observers": ["o"], ', '{"actions": 5, '):
+        path = str(tmp_path / "world.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(prefix + text[1:])
+        assert lint_path(path, stream=True) == lint_path(path)
+        assert lint_path(path)["verdict"] == "COMPLIANT"
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "{",
+    '{"actions": [{"name": "a"}, }',
+    '{"actions": [{"name": "a"} {"name": "b"}]}',
+    '{"profile": "L1",}',
+    '{"profile" "L1"}',
+    '{"version": "1.0.0"}\n  x',
+    '{"observers": [{"name": "\\u00"}]}',
+    '\ufeff{}',
+])
+def test_malformed_input_matches_json_load(monkeypatch, text):
+    monkeypatch.setattr(manifest_stream, "CHUNK_SIZE", 3)
+
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError) as actual:
+        SemanticContext.from_stream(io.StringIO(text))
+
+    assert (actual.value.lineno, actual.value.colno) == (expected.value.lineno, expected.value.colno)
+
+
+def test_non_object_manifest_rejected():
+    with pytest.raises(ValueError):
+        SemanticContext.from_stream(io.StringIO("[1, 2, 3]"))
@@ -0,0 +1,85 @@
+"""
+WorldSeed Lint Sharded Traversal Tests
+
+Status: Normative
+Scope: Parallel rule execution over one context
+
+Verifies that sharded execution delivers exactly the violations
+of sequential execution, in the same order.
+"""
+
+import os
+import time
+
+import pytest
+
+import engine.parallel as parallel
+from engine import compile_plan
+from engine.report import VerdictDecided, VerdictSink
+from engine.semantic_context import SemanticContext
+
+from tests.test_rule_plan import BROKEN_WORLD
+
+
+PACKS = ("axioms", "features", "consistency", "profiles")
+
+_run_shard = parallel._run_shard
+# Directory recording the shards started by forked workers
+_started = None
+
+
+def _slow_shard(task):
+    open(os.path.join(_started, "-".join(map(str, task))), "w").close()
+    time.sleep(0.05)
+    return _run_shard(task)
+
+
+def _large_world(copies):
+    actions, observers = [], []
+    for i in range(copies):
+        actions += [dict(a, name=f"{a['name']}_{i}") for a in BROKEN_WORLD["actions"]]
+        observers += [dict(o, name=f"{o['name']}_{i}") for o in BROKEN_WORLD["observers"]]
+    return dict(BROKEN_WORLD, actions=actions, observers=observers)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_sharded_matches_sequential(monkeypatch, columnar):
+    if not parallel.fork_available():
+        pytest.skip("processes cannot be forked on this platform")
+    if columnar:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_NODES", 0)
+    monkeypatch.setattr(parallel, "MIN_SHARD_NODES", 3)
+
+    plan = compile_plan(PACKS, columnar=columnar)
+    manifest = _large_world(10)
+
+    for profile in ("L0", "L3"):
+        context = SemanticContext(dict(manifest, profile=profile))
+        sequential = plan.run(context)
+        assert sequential
+        assert plan.run(context, workers=3) == sequential
+        assert plan.run(context, workers=1) == sequential
+
+
+def test_decided_verdict_stops_dispatch(monkeypatch, tmp_path):
+    global _started
+
+    if not parallel.fork_available():
+        pytest.skip("processes cannot be forked on this platform")
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_NODES", 0)
+    monkeypatch.setattr(parallel, "MIN_SHARD_NODES", 3)
+    monkeypatch.setattr(parallel, "_run_shard", _slow_shard)
+    _started = str(tmp_path)
+
+    plan = compile_plan(PACKS)
+    context = SemanticContext(_large_world(20))
+    tasks = sum(len(parallel._shard_bounds(len(nodes), 2))
+                for nodes in (context.actions, context.observers, context.quantities))
+    assert tasks >= 10
+
+    with pytest.raises(VerdictDecided), VerdictSink() as sink:
+        plan.run(context, violations=sink, workers=2)
+    assert sink.errors == 1
+    # At most the running shards and the queued ones are still executed
+    assert len(os.listdir(tmp_path)) < tasks // 2
@@ -0,0 +1,64 @@
+"""
+WorldSeed Lint Profiling Tests
+
+Status: Informative
+Scope: Per-phase and per-rule measurements
+
+Verifies that:
+- profiled runs produce the violations of unprofiled runs,
+- every applicable rule and every phase is measured,
+- and --profile leaves STDOUT and the exit code unchanged.
+"""
+
+import json
+import os
+
+import pytest
+
+from cli.main import main
+from engine import compile_plan
+from engine.profiling import Profile
+from engine.semantic_context import SemanticContext
+
+from tests.test_rule_plan import BROKEN_WORLD
+
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples")
+INVALID = os.path.join(EXAMPLES, "invalid_world.json")
+
+
+def test_profiled_plan_matches_unprofiled():
+    plan = compile_plan(("axioms", "features", "consistency", "profiles"))
+    context = SemanticContext(BROKEN_WORLD)
+
+    profile = Profile()
+    try:
+        with profile.phase("rules"):
+            violations = plan.run(context, profile=profile)
+    finally:
+        profile.close()
+
+    assert violations == plan.run(context)
+    document = profile.as_dict()
+    assert list(document["rules"]) == [rule.module_path for rule in plan.rules_for("L3")]
+    assert document["rules"]["rules.axioms.s6_action_semantics"]["calls"] == len(context.actions)
+    assert document["phases"]["rules"]["calls"] == 1
+    assert document["phases"]["rules"]["peak_bytes"] >= max(
+        entry["peak_bytes"] for entry in document["rules"].values())
+
+
+def test_profile_option_keeps_report(tmp_path, capsys):
+    out = tmp_path / "profile.json"
+
+    with pytest.raises(SystemExit) as plain:
+        main([INVALID])
+    report = capsys.readouterr().out
+    with pytest.raises(SystemExit) as profiled:
+        main(["--profile", str(out), INVALID])
+    captured = capsys.readouterr()
+
+    assert (profiled.value.code, captured.out, captured.err) == (plain.value.code, report, "")
+    document = json.loads(out.read_text())
+    assert list(document["phases"]) == ["load", "schema", "context", "rules", "report"]
+    assert all(entry["calls"] == 1 for entry in document["phases"].values())
+    assert "rules.axioms.s1_world_identity" in document["rules"]
@@ -0,0 +1,60 @@
+"""
+WorldSeed Lint Report Tests
+
+Status: Normative
+Scope: Deterministic report generation
+
+Verifies that the spilling violation sink and the streaming
+report writer are byte-identical to the in-memory report path,
+and that violation records and violation dicts report identically.
+"""
+
+import io
+import json
+
+import pytest
+
+from engine.report import ViolationSink, as_dict, build_report, generate_report, violation, write_report
+
+
+VIOLATIONS = [
+    {"severity": "ERROR", "rule": "R-B", "axiom": "S2", "path": "b", "message": "m"},
+    {"severity": "WARNING", "rule": "R-A", "axiom": "S1", "path": "a", "message": "m"},
+    {"rule": "R-A", "axiom": "S1", "path": "z", "message": "m"},
+    {"rule": "R-A", "path": "observers[kameraé]", "message": "ünicode \"quoted\""},
+    {"severity": "ERROR", "rule": "R-A", "axiom": "S1", "path": "a", "message": "m"},
+    {},
+    violation(rule="R-B", axiom="S2", path="b", message="m"),
+    violation(rule="R-C", axiom=None, path="c", message="m", severity="WARNING"),
+    {"rule": "R-D", "axiom": True, "path": "d", "message": 1.0},
+    {"rule": "R-D", "axiom": 1, "path": "d", "message": 1.0},
+] * 7
+
+
+@pytest.mark.parametrize("violations", [
+    [],
+    VIOLATIONS,
+    VIOLATIONS + [{"severity": "ERROR", "rule": "CLI-JSON-ERROR", "axiom": None,
+                   "path": "x.json", "message": "Invalid JSON"}],
+])
+@pytest.mark.parametrize("spill_threshold", [1, 4, 1 << 20])
+def test_spilled_report_is_byte_identical(violations, spill_threshold):
+    expected = json.dumps(generate_report(violations), indent=2)
+
+    with ViolationSink(spill_threshold=spill_threshold) as sink:
+        sink.extend(violations)
+        out = io.StringIO()
+        write_report(sink, out)
+    assert out.getvalue() == expected
+
+    with ViolationSink(spill_threshold=spill_threshold) as sink:
+        sink.extend(violations)
+        assert json.dumps(build_report(sink), indent=2) == expected
+
+
+def test_records_report_as_their_dicts():
+    records = [violation(rule=f"R-{i % 3}", axiom=None, path=str(i), message="m") for i in range(10)]
+    dicts = [as_dict(record) for record in records]
+
+    assert dicts[0] == {"severity": "ERROR", "rule": "R-0", "axiom": None, "path": "0", "message": "m"}
+    assert generate_report(records) == generate_report(dicts)
@@ -0,0 +1,115 @@
+"""
+WorldSeed Lint Rule Plan Tests
+
+Status: Normative
+Scope: Rule resolution and execution order
+
+Verifies that a compiled rule plan:
+- follows the authoritative mapping order,
+- includes supplementary packs only when requested,
+- and produces exactly the violations of direct rule execution.
+"""
+
+import importlib
+
+import pytest
+
+from engine import compile_plan, run_axiom_rules
+from engine.report import generate_report
+from engine.semantic_context import SemanticContext
+from mapping.axiom_mapping import AXIOM_RULE_MODULES, RULE_PACKS
+
+from tests.conformance.valid_worlds import VALID_WORLDS
+from tests.conformance.invalid_worlds import INVALID_WORLDS
+
+
+BROKEN_WORLD = {
+    "version": "1.0.0",
+    "profile": "L3",
+    "world": {"id": "not-a-uuid"},
+    "ontology": {"entities": []},
+    "actions": [
+        {"name": "move", "parameters": {
+            "dx": {"value": "unknown", "unit": None, "uncertainty": 0.5, "provenance": None},
+            "dy": {"value": 1.0, "unit": "", "uncertainty": -1, "provenance": ""}
+        }, "stochastic": "sometimes"},
+        {"name": "idle", "parameters": {}}
+    ],
+    "observers": [
+        {"name": "camera", "noise": {"value": 1.0, "unit": "pixel", "uncertainty": None}},
+        {"name": "lidar", "operator": "tof", "boundary": "range",
+         "noise": {"value": "unknown", "unit": "meter", "uncertainty": "unknown"}}
+    ],
+    "degradation": [
+        {"source": "raw", "target": "binned", "irreversible": True,
+         "destroyed": ["fine range"], "preserved": ["coarse range"]},
+        {"source": "binned", "target": "raw", "irreversible": True,
+         "destroyed": ["coarse range"], "preserved": ["fine range"]},
+        {"source": "binned", "target": "summary", "destroyed": ["count"], "preserved": ["count"]},
+        {"source": "summary", "target": "report", "irreversible": False}
+    ]
+}
+
+
+def _direct_report(context, packs):
+    violations = []
+    for pack in packs:
+        for module_path in RULE_PACKS[pack].values():
+            violations.extend(importlib.import_module(module_path).check(context))
+    return generate_report(violations)
+
+
+def test_plan_order():
+    plan = compile_plan()
+    assert plan.packs == ("axioms",)
+    assert [r.module_path for r in plan.rules] == list(AXIOM_RULE_MODULES.values())
+
+    full = compile_plan(("profiles", "features", "consistency"))
+    assert full.packs == ("axioms", "features", "consistency", "profiles")
+
+
+def test_unknown_pack_rejected():
+    with pytest.raises(ValueError):
+        compile_plan(("axioms", "nonexistent"))
+
+
+def test_plan_matches_direct_execution():
+    packs = ("axioms", "features", "consistency", "profiles")
+    plan = compile_plan(packs)
+
+    for manifest in VALID_WORLDS + INVALID_WORLDS + [BROKEN_WORLD]:
+        context = SemanticContext(manifest)
+        assert generate_report(run_axiom_rules(context)) == _direct_report(context, ("axioms",))
+        assert generate_report(run_axiom_rules(context, plan)) == _direct_report(context, packs)
+
+
+def test_profile_index_matches_direct_execution():
+    packs = ("axioms", "features", "consistency", "profiles")
+    plan = compile_plan(packs)
+
+    for profile in ("L0", "L1", "L2", "L3", "L9", "", ["L1"], {"L": 1}, None):
+        context = SemanticContext(dict(BROKEN_WORLD, profile=profile))
+        assert generate_report(plan.run(context)) == _direct_report(context, packs)
+        assert all(rule.sections != () for rule in plan.rules_for(profile))
+
+
+def test_columnar_matches_row_evaluation():
+    pytest.importorskip("numpy")
+
+    packs = ("axioms", "features", "consistency", "profiles")
+    row_plan = compile_plan(packs, columnar=False)
+    column_plan = compile_plan(packs, columnar=True)
+
+    manifest = dict(BROKEN_WORLD)
+    manifest["actions"] = BROKEN_WORLD["actions"] + [
+        {"name": "odd", "parameters": {
+            "a": {"value": "unknown", "unit": ["m"], "uncertainty": True, "provenance": 0},
+            "b": {"value": 10 ** 400, "unit": 0, "uncertainty": -10 ** 400},
+            "c": {"value": float("nan"), "unit": "m", "uncertainty": float("nan"), "provenance": "x"},
+            "d": {"value": "unknown", "uncertainty": None, "provenance": []},
+        }, "stochastic": True}
+    ]
+
+    for profile in ("L0", "L3"):
+        context = SemanticContext(dict(manifest, profile=profile))
+        assert generate_report(column_plan.run(context)) == generate_report(row_plan.run(context))
@@ -0,0 +1,142 @@
+"""
+WorldSeed Lint Schema Check Tests
+
+Status: Normative
+Scope: Compiled schema validation as the BLOCKED stage
+
+Verifies that:
+- compiled validators agree with a conforming JSON Schema validator,
+- schema failures are reported as BLOCKED with their paths,
+- streamed and parsed manifests yield identical schema reports,
+- and compiled code is cached on disk only on request, and reused
+  from, and never trusted blindly from, that cache.
+"""
+
+import copy
+import json
+import os
+
+import pytest
+
+from cli.main import lint_path, main
+from engine import schema_check
+from engine.report import as_dict
+from engine.schema_check import SCHEMA_DIR, SCHEMA_FILES, check_schema, compiled_validator
+from tests.conformance.invalid_worlds import INVALID_WORLDS
+from tests.conformance.valid_worlds import VALID_WORLDS
+
+
+def _broken_worlds():
+    base = VALID_WORLDS[0]
+    edits = [
+        lambda m: m.update(profile="L9"),
+        lambda m: m.update(world=[]),
+        lambda m: m.pop("profile"),
+        lambda m: m["actions"][0].pop("name"),
+        lambda m: m["actions"][0]["parameters"]["dx"].update(value=[1], unit=3),
+        lambda m: m["observers"][0].update(noise="low", boundary=False),
+        lambda m: m["ontology"].update(entities=["position", 7]),
+        lambda m: m.update(actions={"move": {}}),
+    ]
+    for edit in edits:
+        world = copy.deepcopy(base)
+        edit(world)
+        yield world
+
+
+def test_compiled_validator_matches_jsonschema():
+    jsonschema = pytest.importorskip("jsonschema")
+
+    for version, name in SCHEMA_FILES.items():
+        with open(os.path.join(SCHEMA_DIR, name), encoding="utf-8") as f:
+            reference = jsonschema.Draft202012Validator(json.load(f))
+        validate = compiled_validator(version)["validate"]
+
+        for world in [*VALID_WORLDS, *INVALID_WORLDS, *_broken_worlds()]:
+            expected = sorted(
+                (list(e.absolute_path), e.validator == "required") for e in reference.iter_errors(world)
+            )
+            # Required errors are reported at the missing property
+            actual = []
+            for path, message in validate(world):
+                keys = []
+                while path is not None:
+                    path, key = path
+                    keys.append(key)
+                keys.reverse()
+                required = message.endswith("is a required property")
+                actual.append((keys[:-1] if required else keys, required))
+            assert sorted(actual) == expected
+
+
+def test_schema_errors_are_blocked(tmp_path, capsys):
+    world = copy.deepcopy(VALID_WORLDS[0])
+    world["profile"] = "L9"
+    world["actions"][0]["parameters"]["dx"]["unit"] = 3
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps(world), encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exc:
+        main([str(path)])
+    assert exc.value.code == 2
+    report = json.loads(capsys.readouterr().out)
+    assert report["verdict"] == "BLOCKED"
+    assert [(v["rule"], v["path"]) for v in report["violations"]] == [
+        ("SCHEMA-ERROR", "actions[0].parameters.dx.unit"),
+        ("SCHEMA-ERROR", "profile"),
+    ]
+
+
+def test_unsupported_version_is_blocked():
+    assert [path for _, _, _, path, _ in check_schema({"profile": "L1"})] == ["version"]
+    violations = check_schema({"version": "9.9.9", "profile": "L1"})
+    assert as_dict(violations[0])["message"] == "Unsupported specification version: '9.9.9'"
+    assert check_schema(VALID_WORLDS[0]) == []
+
+
+def test_streamed_schema_report_matches_parsed(tmp_path):
+    for i, world in enumerate(_broken_worlds()):
+        # The version arrives last, after every streamed element
+        world["version"] = world.pop("version")
+        path = str(tmp_path / f"world{i}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(world, f)
+        assert lint_path(path, stream=True) == lint_path(path)
+
+
+def test_non_object_manifest_is_blocked(tmp_path):
+    for i, text in enumerate(("[1, 2]", '"str"', "null", "3")):
+        path = str(tmp_path / f"root{i}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        report = lint_path(path)
+        assert report["verdict"] == "BLOCKED"
+        assert [(v["rule"], v["path"]) for v in report["violations"]] == [("SCHEMA-ERROR", "manifest")]
+        assert lint_path(path, stream=True) == report
+
+    assert as_dict(check_schema([1, 2])[0])["message"] == "[...] is not of type 'object'"
+    assert as_dict(check_schema("str")[0])["message"] == "'str' is not of type 'object'"
+
+
+def test_compiled_code_is_cached_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv("WORLDSEED_LINT_SCHEMA_CACHE", str(tmp_path))
+    monkeypatch.setattr(schema_check, "_validators", {})
+
+    compiled_validator("1.0.0")
+    (entry,) = tmp_path.iterdir()
+
+    # A damaged entry is recompiled and replaced
+    entry.write_bytes(b"\0damaged")
+    monkeypatch.setattr(schema_check, "_validators", {})
+    assert compiled_validator("1.0.0")["validate"]({"version": "1.0.0"}) != []
+    assert entry.read_bytes() != b"\0damaged"
+
+
+def test_compiled_code_is_not_cached_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv("WORLDSEED_LINT_SCHEMA_CACHE", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(schema_check, "_validators", {})
+
+    assert compiled_validator("1.0.0")["validate"](VALID_WORLDS[0]) == []
+    assert list(tmp_path.iterdir()) == []
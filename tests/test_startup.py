@@ -0,0 +1,74 @@
+"""
+WorldSeed Lint Startup Tests
+
+Status: Normative
+Scope: CLI cold-start cost
+
+Verifies that:
+- importing the CLI loads no optional or heavy dependency and no rule,
+- linting a small manifest loads no optional dependency,
+- and the CLI import stays within its measured import-time budget.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+VALID = os.path.join(ROOT, "examples", "valid_world.json")
+
+# Cumulative `python -X importtime` cost of `import cli.main`, in microseconds.
+# Measured at about 11 ms, of which about 8.5 ms is the stdlib json package.
+IMPORT_BUDGET_US = 25_000
+
+HEAVY_MODULES = (
+    "jsonschema", "numpy", "typing", "tempfile", "hashlib",
+    "concurrent.futures", "socketserver", "multiprocessing",
+)
+
+
+def _python(code: str, *args):
+    env = dict(os.environ)
+    # Budgets assume cached bytecode, as in an installed package
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _loaded_modules(code: str) -> set:
+    out = _python(code + "\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))").stdout
+    return set(json.loads(out.splitlines()[-1]))
+
+
+def test_cli_import_is_lean():
+    modules = _loaded_modules("import cli.main")
+    assert not [m for m in HEAVY_MODULES if m in modules]
+    assert not [m for m in modules if m.startswith("rules.")]
+
+
+def test_small_lint_loads_no_optional_dependency():
+    modules = _loaded_modules(
+        "from cli.main import main\n"
+        "try:\n"
+        f"    main([{VALID!r}])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert not [m for m in HEAVY_MODULES if m in modules]
+
+
+def test_cli_import_time_budget():
+    _python("import cli.main")  # warm the bytecode cache
+
+    best = None
+    for _ in range(5):
+        err = _python("import cli.main", "-X", "importtime").stderr
+        line = [l for l in err.splitlines() if l.endswith("| cli.main")][-1]
+        cumulative = int(line.split("|")[1])
+        best = cumulative if best is None else min(best, cumulative)
+
+    assert best < IMPORT_BUDGET_US, f"import cli.main took {best} us"
@@ -0,0 +1,56 @@
+"""
+WorldSeed Lint Symbol Table Tests
+
+Status: Normative
+Scope: Interned identifiers and structured paths
+
+Verifies that:
+- registry keys render to the text paths they represent,
+- repeated declarations share one string object,
+- and non-string values are kept as declared.
+"""
+
+import json
+
+from engine.semantic_context import SemanticContext
+from engine.symbols import ACTION_PARAMETER, SymbolTable
+
+
+def _context(actions, observers=()):
+    manifest = {
+        "version": "1.0.0",
+        "profile": "L1",
+        "world": {"id": "550e8400-e29b-41d4-a716-446655440000"},
+        "ontology": {"entities": ["position"]},
+        "actions": list(actions),
+        "observers": list(observers)
+    }
+    # Distinct string objects, as after json.load
+    return SemanticContext(json.loads(json.dumps(manifest)))
+
+
+def test_registry_keys_render_to_text_paths():
+    q = {"value": 1.0, "unit": "meter", "uncertainty": 0.1, "provenance": "control"}
+    context = _context(
+        [{"name": "move", "parameters": {"dx": q, "dy": q}}, {"name": 7, "parameters": {"dx": q}}],
+        [{"name": "camera", "operator": "project", "boundary": "fov", "noise": q}]
+    )
+
+    assert [context.symbols.render(k) for k in context.quantities] == [
+        "action:move:dx", "action:move:dy", "action:7:dx", "observer:camera:noise"
+    ]
+    assert context.symbols.render("world.id") == "world.id"
+
+    units = {id(q.unit) for q in context.quantities.values()}
+    assert len(units) == 1
+    assert 7 in context.actions
+
+
+def test_canonical_keeps_declared_values():
+    symbols = SymbolTable()
+    a, b = "".join(["me", "ter"]), "".join(["met", "er"])
+
+    assert symbols.canonical(a) is symbols.canonical(b) is a
+    assert symbols.canonical(None) is None and symbols.canonical(["m"]) == ["m"]
+    assert symbols.intern(1) == symbols.intern("1") != symbols.intern(True)
+    assert symbols.render((ACTION_PARAMETER, symbols.intern("a"), symbols.intern(a))) == "action:a:meter"
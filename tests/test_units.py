@@ -0,0 +1,107 @@
+"""
+WorldSeed Lint Unit Engine Tests
+
+Status: Normative
+Scope: Unit canonicalization and dimensional consistency
+
+Verifies that:
+- equivalent unit expressions share one canonical dimension,
+- unparseable expressions are opaque,
+- and only dimension conflicts between same-named parameters
+  are reported.
+"""
+
+import rules.consistency.units as units_rule
+from engine.semantic_context import SemanticContext
+from engine.units import DIMENSIONLESS, UNIT_CACHE_SIZE, _parse, dimension_of, parse_unit
+
+
+def test_equivalent_expressions_share_a_dimension():
+    groups = [
+        ["m", "meter", "Meters", "km", "kilometre", "cm", "2 m"],
+        ["m/s", "m s^-1", "m·s⁻¹", "m s-1", "meter per second", "km/h"],
+        ["N", "newton", "kg m/s^2", "kg*m*s**-2", "(kg m) / s^2"],
+        ["J", "N m", "kWh", "W*h"],
+        ["1", "rad", "deg", "%", "dimensionless", "m/m"],
+        ["Hz", "1/s", "s^-1", "s⁻¹"],
+        ["m²", "m^2", "m*m"],
+        ["m³", "L", "liter"],
+        ["m/s²", "m s^-2", "N/kg"],
+        ["kg·m²", "J s^2", "kg m^2"],
+        ["K", "°C", "°F", "degF", "fahrenheit"],
+    ]
+    seen = set()
+    for group in groups:
+        dimensions = {dimension_of(text) for text in group}
+        assert len(dimensions) == 1 and None not in dimensions, group
+        seen |= dimensions
+    assert len(seen) == len(groups)
+
+    assert parse_unit("km").scale == 1000.0 and parse_unit("ms").scale == 0.001
+    assert dimension_of("px") != dimension_of("m") != dimension_of("kB")
+    assert parse_unit("%").dimension == DIMENSIONLESS
+
+
+def test_opaque_expressions():
+    for text in ("", "furlong", "dB", "m^", "m/", "(m", "m)", "kmin", "meter second per",
+                 "deg C", "° F", "degree Celsius", None, 1, ["m"]):
+        assert parse_unit(text) is None, text
+
+    assert _parse.cache_info().maxsize == UNIT_CACHE_SIZE
+    parse_unit("furlong")
+    hits = _parse.cache_info().hits
+    parse_unit("furlong")
+    assert _parse.cache_info().hits == hits + 1
+
+
+def test_dimension_conflicts_across_parameters():
+    def q(unit):
+        return {"value": 1.0, "unit": unit, "uncertainty": 0.1, "provenance": "control"}
+
+    manifest = {
+        "version": "1.0.0",
+        "profile": "L2",
+        "world": {"id": "550e8400-e29b-41d4-a716-446655440000"},
+        "ontology": {"entities": ["position"]},
+        "actions": [
+            {"name": "a", "parameters": {"dx": q("furlong"), "dt": q(None), "v": q("m/s")}},
+            {"name": "b", "parameters": {"dx": q("km"), "dt": q("ms"), "v": q("km/h")}},
+            {"name": "c", "parameters": {"dx": q("second"), "dt": q("meter"), "v": q(["m"])}},
+            {"name": "d", "parameters": {"dx": q("cm"), "dt": q("min"), "v": q("")}},
+        ],
+        "observers": [
+            {"name": "camera", "operator": "pinhole", "boundary": "fov", "noise": q("pixel")},
+            {"name": "lidar", "operator": "tof", "boundary": "range", "noise": q("meter")},
+        ]
+    }
+    context = SemanticContext(manifest)
+
+    violations = units_rule.check(context)
+    assert [(rule, path) for _, rule, _, path, _ in violations] == [
+        ("CONSISTENCY-UNIT-MISMATCH", "action:c:dx"),
+        ("CONSISTENCY-UNIT-MISMATCH", "action:c:dt"),
+    ]
+    assert violations[0][4] == "Same quantity declared with conflicting units: 'second' (time) and 'cm' (length)."
+
+    # The most common dimension is the reference, whatever the declaration order
+    reordered = SemanticContext(dict(manifest, actions=manifest["actions"][::-1]))
+    assert sorted(units_rule.check(reordered)) == sorted(violations)
+
+
+def test_temperature_units_do_not_conflict():
+    def q(unit):
+        return {"value": 1.0, "unit": unit, "uncertainty": 0.1, "provenance": "control"}
+
+    context = SemanticContext({
+        "version": "1.0.0",
+        "profile": "L2",
+        "world": {"id": "550e8400-e29b-41d4-a716-446655440000"},
+        "ontology": {"entities": ["oven"]},
+        "actions": [
+            {"name": "a", "parameters": {"t": q("°F"), "u": q("deg C")}},
+            {"name": "b", "parameters": {"t": q("K"), "u": q("K")}},
+            {"name": "c", "parameters": {"t": q("°C"), "u": q("kelvin")}},
+        ]
+    })
+
+    assert units_rule.check(context) == []
@@ -0,0 +1,58 @@
+"""
+WorldSeed Lint Verdict-Only Tests
+
+Status: Normative
+Scope: Early-terminating verdict reports
+
+Verifies that verdict-only runs:
+- reach the verdict and exit code of full runs,
+- stop at the first deciding violation,
+- and emit ABI-consistent reports.
+"""
+
+import json
+
+import pytest
+
+from cli.main import main
+from engine import run_axiom_rules
+from engine.report import VerdictDecided, VerdictSink, build_report
+from engine.semantic_context import SemanticContext
+
+from tests.conformance.valid_worlds import VALID_WORLDS
+from tests.conformance.invalid_worlds import INVALID_WORLDS
+from tests.test_rule_plan import BROKEN_WORLD
+
+
+def _run(argv, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    return exc.value.code, json.loads(capsys.readouterr().out)
+
+
+def test_verdict_sink_stops_at_first_error():
+    context = SemanticContext(BROKEN_WORLD)
+    first = run_axiom_rules(context)[0]
+
+    with VerdictSink() as sink:
+        with pytest.raises(VerdictDecided):
+            run_axiom_rules(context, violations=sink)
+        report = build_report(sink)
+
+    assert report["verdict"] == "NON-COMPLIANT"
+    assert report["summary"] == {"errors": 1, "warnings": 0, "blocked": 0}
+    assert [tuple(v.values()) for v in report["violations"]] == [first]
+
+
+@pytest.mark.parametrize("manifest", VALID_WORLDS + INVALID_WORLDS + [BROKEN_WORLD, {"profile": 3}])
+def test_verdict_only_matches_full_run(tmp_path, capsys, manifest):
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps(manifest))
+
+    code, full = _run([str(path)], capsys)
+    fast_code, fast = _run(["--verdict-only", str(path)], capsys)
+
+    assert (fast_code, fast["verdict"], fast["compliance"]) == (code, full["verdict"], full["compliance"])
+    assert fast["summary"]["blocked"] == full["summary"]["blocked"]
+    assert fast["summary"]["errors"] == len(fast["violations"]) == min(1, full["summary"]["errors"])
+    assert all(v in full["violations"] for v in fast["violations"])
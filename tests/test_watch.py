@@ -0,0 +1,80 @@
+"""
+WorldSeed Lint Watch Mode Tests
+
+Status: Normative
+Scope: Change detection and incremental re-linting
+
+Verifies that watch polls:
+- lint new manifests and re-lint exactly the changed ones,
+- report as a fresh single-manifest run would,
+- and report unreadable manifests once, as BLOCKED.
+"""
+
+import io
+import json
+import os
+
+from cli.main import lint_path
+from cli.watch import poll, watch
+from engine import default_plan
+
+from tests.conformance.valid_worlds import VALID_WORLDS
+from tests.conformance.invalid_worlds import INVALID_WORLDS
+
+
+def _poll(args, state):
+    out = io.StringIO()
+    poll(args, state, default_plan(), out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_poll_relints_changed_manifests(tmp_path):
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    a.write_text(json.dumps(VALID_WORLDS[0]))
+    b.write_text(json.dumps(INVALID_WORLDS[0]))
+    state = {}
+
+    lines = _poll([str(tmp_path)], state)
+    assert [line["manifest"] for line in lines] == [str(a), str(b)]
+    assert [line["report"] for line in lines] == [lint_path(str(a)), lint_path(str(b))]
+    assert _poll([str(tmp_path)], state) == []
+
+    # Rewritten with equal content: no re-lint
+    b.write_text(json.dumps(INVALID_WORLDS[0]))
+    os.utime(b, ns=(0, 0))
+    assert _poll([str(tmp_path)], state) == []
+
+    edited = dict(VALID_WORLDS[0], actions=VALID_WORLDS[0]["actions"] + [{"name": "wait"}])
+    a.write_text(json.dumps(edited))
+    c = tmp_path / "c.json"
+    c.write_text(json.dumps(VALID_WORLDS[1]))
+    lines = _poll([str(tmp_path)], state)
+    assert [line["manifest"] for line in lines] == [str(a), str(c)]
+    assert lines[0]["report"] == lint_path(str(a))
+
+    a.unlink()
+    assert _poll([str(a), str(c)], state)[0]["report"]["verdict"] == "BLOCKED"
+    assert _poll([str(a), str(c)], state) == []
+    assert sorted(state) == [str(a), str(c)]
+
+
+def test_watch_returns_latest_exit_code(tmp_path):
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps(INVALID_WORLDS[0]))
+    out = io.StringIO()
+
+    assert watch([str(path)], interval=0, polls=2, out=out) == 1
+    assert len(out.getvalue().splitlines()) == 1
+
+
+def test_poll_reports_unexpandable_listfile_once(tmp_path):
+    a = tmp_path / "a.json"
+    a.write_text(json.dumps(VALID_WORLDS[0]))
+    own = tmp_path / "self.txt"
+    own.write_text(f"{a}\n@{own}\n")
+    state = {}
+
+    lines = _poll([f"@{own}", f"@{tmp_path}"], state)
+    assert [line["manifest"] for line in lines] == [str(a), f"@{own}", f"@{tmp_path}"]
+    assert [line["report"]["verdict"] for line in lines] == ["COMPLIANT", "BLOCKED", "BLOCKED"]
+    assert _poll([f"@{own}", f"@{tmp_path}"], state) == []